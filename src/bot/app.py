@@ -31,6 +31,14 @@ logger = logging.getLogger(__name__)
 _scheduler_engine: SchedulerEngine | None = None
 _webhook_server: WebhookServer | None = None
 
+# Strong references to startup tasks so they aren't garbage-collected mid-run.
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _log_task_failure(task: asyncio.Task[None]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background startup task failed", exc_info=task.exception())
+
 
 def _init_notifications(app: Application) -> None:
     """Register notification channels and set the default."""
@@ -108,6 +116,14 @@ async def _post_init(app: Application) -> None:
     if removed:
         logger.info("Scratch cleanup: removed %d old files", removed)
 
+    # Build the memory client in the background while the rest starts up
+    from src.memory.store import MemoryStore
+
+    warm_task = asyncio.create_task(MemoryStore.warm())
+    _background_tasks.add(warm_task)
+    warm_task.add_done_callback(_background_tasks.discard)
+    warm_task.add_done_callback(_log_task_failure)
+
     _scheduler_engine = _init_scheduler()
     await _scheduler_engine.start()
 
@@ -135,6 +151,14 @@ async def _post_shutdown(app: Application) -> None:
     if _scheduler_engine is not None:
         await _scheduler_engine.stop()
 
+    from src.db import close_pools
+    from src.llm.client import close_client
+    from src.memory.store import MemoryStore
+
+    await close_client()
+    await MemoryStore.close()
+    await close_pools()
+
 
 def create_app() -> Application:
     """Build and configure the Telegram application."""
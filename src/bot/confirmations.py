@@ -11,8 +11,8 @@ import asyncio
 import html
 import logging
 import re
+import secrets
 import time
-import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -61,7 +61,7 @@ _pending: dict[str, PendingConfirmation] = {}
 
 def generate_confirmation_id() -> str:
     """Return an 8-character hex string suitable for callback data."""
-    return uuid.uuid4().hex[:8]
+    return secrets.token_hex(4)
 
 
 # ---------------------------------------------------------------------------
@@ -570,6 +570,7 @@ async def _enrich_cancel_task(inp: dict[str, Any]) -> dict[str, Any]:
     task_id = task_id.replace("-", "")
     try:
         from src.scheduler.store import TaskStore
+        from src.tools.scheduler_tools import next_run_at
 
         store = TaskStore.get()
         task = await store.get_task(task_id)
@@ -583,7 +584,7 @@ async def _enrich_cancel_task(inp: dict[str, Any]) -> dict[str, Any]:
         "_task_type": task.task_type,
         "_task_schedule": task.schedule,
         "_task_action_type": task.action_type,
-        "_task_next_run_at": task.next_run_at,
+        "_task_next_run_at": next_run_at(task),
     }
 
 
@@ -170,7 +170,7 @@ async def _process_message(
             session.add("assistant", result_text)
 
             # Background memory extraction (don't block the response)
-            recent = session.to_api_messages()[-6:]  # last 3 exchanges
+            recent = session.to_api_messages(last=6)  # last 3 exchanges
             asyncio.create_task(
                 extract_and_save(
                     user_message=user_message,
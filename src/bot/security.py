@@ -8,30 +8,31 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
-_allowed: set[int] | None = None
+_allowed: frozenset[int] | None = None
 
 
-def _get_allowed() -> set[int]:
+def _get_allowed() -> frozenset[int]:
     """Lazily load and cache the allowed user IDs."""
     global _allowed  # noqa: PLW0603
     if _allowed is None:
         _allowed = settings.get_allowed_user_ids()
-        logger.info("Allowed user IDs: %s", _allowed)
+        if _allowed:
+            logger.info("Allowed user IDs: %s", _allowed)
+        else:
+            logger.warning("ALLOWED_USER_IDS is empty — rejecting all messages")
     return _allowed
 
 
 def is_allowed(update: Update) -> bool:
     """Check if the update is from an allowed user.
 
-    Returns False (silently rejected) for unknown users.
+    Returns False (silently rejected) for unknown users. Runs on every
+    inbound update, so after the first call this is a single frozenset probe
+    (an empty allowlist simply matches nobody).
     """
     user = update.effective_user
     if user is None:
         return False
 
-    allowed = _get_allowed()
-    if not allowed:
-        logger.warning("ALLOWED_USER_IDS is empty — rejecting all messages")
-        return False
-
+    allowed = _allowed if _allowed is not None else _get_allowed()
     return user.id in allowed
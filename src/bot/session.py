@@ -1,7 +1,9 @@
 """In-memory conversation session with sliding window."""
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 
 from src.config import settings
 
@@ -18,16 +20,21 @@ class Message:
 
 @dataclass
 class Session:
-    """Conversation history for a single chat."""
+    """Conversation history for a single chat.
+
+    ``messages`` is a bounded deque, so appending past ``window_size``
+    drops the oldest message in O(1) instead of re-slicing the history.
+    """
 
-    messages: list[Message] = field(default_factory=list)
     window_size: int = field(default_factory=lambda: settings.conversation_window_size)
+    messages: deque[Message] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.messages = deque(maxlen=self.window_size)
 
     def add(self, role: str, content: str) -> None:
-        """Append a message and trim to the sliding window."""
+        """Append a message, evicting the oldest beyond the sliding window."""
         self.messages.append(Message(role=role, content=content))
-        if len(self.messages) > self.window_size:
-            self.messages = self.messages[-self.window_size :]
 
     def clear(self) -> int:
         """Clear all messages. Returns the count of cleared messages."""
@@ -35,9 +42,15 @@ class Session:
         self.messages.clear()
         return count
 
-    def to_api_messages(self) -> list[dict[str, str]]:
-        """Format messages for the Claude API."""
-        return [{"role": m.role, "content": m.content} for m in self.messages]
+    def to_api_messages(self, last: int | None = None) -> list[dict[str, str]]:
+        """Format messages for the Claude API, oldest first.
+
+        With *last*, only the most recent *last* messages are formatted.
+        """
+        msgs = self.messages
+        if last is not None and last < len(msgs):
+            msgs = islice(msgs, len(msgs) - last, None)
+        return [{"role": m.role, "content": m.content} for m in msgs]
 
 
 # Global session store keyed by session ID (str(chat_id) for Telegram, phone for SMS)
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import base64
-import json
 import logging
 import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from src.config import settings
 from src.llm.models import _resolve
 
@@ -17,21 +18,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# JavaScript that finds interactive elements, injects numbered red labels,
-# and returns metadata for each element.
+# Interactive elements the agent can act on. Matched via Playwright's locator
+# engine rather than a querySelectorAll walk in page script.
+_INTERACTIVE_SELECTORS = 'a, button, input, select, textarea, [role="button"], [role="link"]'
+
+# JavaScript run over the located elements: filters out hidden ones, draws
+# numbered red labels into a single SVG overlay, and returns metadata for each
+# element. The overlay is built detached and attached once, so the page does
+# one layout/paint pass for all labels instead of one per label.
 _EXTRACT_ELEMENTS_JS = """
-() => {
-    const SELECTORS = 'a, button, input, select, textarea, [role="button"], [role="link"]';
+(els) => {
     const MAX_ELEMENTS = 50;
-    const LABEL_CLASS = '__nella_label__';
+    const OVERLAY_ID = '__nella_labels__';
+    const SVG_NS = 'http://www.w3.org/2000/svg';
 
     // Remove any previous labels
-    document.querySelectorAll('.' + LABEL_CLASS).forEach(el => el.remove());
+    document.getElementById(OVERLAY_ID)?.remove();
+
+    const svg = document.createElementNS(SVG_NS, 'svg');
+    svg.id = OVERLAY_ID;
+    svg.style.cssText = [
+        'position: fixed',
+        'top: 0',
+        'left: 0',
+        'width: 100%',
+        'height: 100%',
+        'pointer-events: none',
+        'z-index: 999999',
+    ].join(';');
 
     const elements = [];
     let index = 0;
 
-    for (const el of document.querySelectorAll(SELECTORS)) {
+    for (const el of els) {
         if (index >= MAX_ELEMENTS) break;
 
         // Skip hidden / off-screen elements
@@ -49,24 +68,29 @@ _EXTRACT_ELEMENTS_JS = """
         const href = el.getAttribute('href') || '';
         const name = el.getAttribute('name') || '';
 
-        // Inject a red numbered label overlay
-        const label = document.createElement('div');
-        label.className = LABEL_CLASS;
-        label.textContent = String(index);
-        label.style.cssText = [
-            'position: absolute',
-            'z-index: 999999',
-            'background: red',
-            'color: white',
-            'font-size: 12px',
-            'font-weight: bold',
-            'padding: 1px 4px',
-            'border-radius: 3px',
-            'pointer-events: none',
-            `left: ${rect.left + window.scrollX}px`,
-            `top: ${rect.top + window.scrollY - 16}px`,
-        ].join(';');
-        document.body.appendChild(label);
+        // Red numbered label: background rect + text, just above the element
+        const labelText = String(index);
+        const x = rect.left;
+        const y = rect.top - 16;
+
+        const bg = document.createElementNS(SVG_NS, 'rect');
+        bg.setAttribute('x', x);
+        bg.setAttribute('y', y);
+        bg.setAttribute('width', labelText.length * 8 + 8);
+        bg.setAttribute('height', 16);
+        bg.setAttribute('rx', 3);
+        bg.setAttribute('fill', 'red');
+        svg.appendChild(bg);
+
+        const label = document.createElementNS(SVG_NS, 'text');
+        label.setAttribute('x', x + 4);
+        label.setAttribute('y', y + 12);
+        label.setAttribute('fill', 'white');
+        label.setAttribute('font-size', '12px');
+        label.setAttribute('font-weight', 'bold');
+        label.setAttribute('font-family', 'sans-serif');
+        label.textContent = labelText;
+        svg.appendChild(label);
 
         elements.push({
             index,
@@ -81,13 +105,14 @@ _EXTRACT_ELEMENTS_JS = """
         index++;
     }
 
+    document.body.appendChild(svg);
     return elements;
 }
 """
 
 _REMOVE_LABELS_JS = """
 () => {
-    document.querySelectorAll('.__nella_label__').forEach(el => el.remove());
+    document.getElementById('__nella_labels__')?.remove();
 }
 """
 
@@ -203,8 +228,10 @@ class BrowserAgent:
         self._state.steps += 1
         logger.info("Browser step %d/%d on %s", self._state.steps, self._max_steps, self._page.url)
 
-        # Extract interactive elements (also injects labels)
-        elements = await self._page.evaluate(_EXTRACT_ELEMENTS_JS)
+        # Extract interactive elements (also injects labels) in one round-trip
+        elements = await self._page.locator(_INTERACTIVE_SELECTORS).evaluate_all(
+            _EXTRACT_ELEMENTS_JS
+        )
 
         # Screenshot with labels visible
         screenshot_bytes = await self._page.screenshot(full_page=False)
@@ -236,7 +263,8 @@ class BrowserAgent:
         """Send screenshot + element list to Claude, get back an action."""
         # Lazy import to avoid circular dependency:
         # src.llm.client → src.tools → browser_tools → agent → src.llm.client
-        from src.llm.client import complete_text
+        from src.llm.client import complete_text_stream
+
         messages = [
             {
                 "role": "user",
@@ -262,7 +290,13 @@ class BrowserAgent:
         ]
 
         system = SYSTEM_PROMPT.format(task=self._task)
-        raw = await complete_text(messages, system=system, model=self._model, max_tokens=1024)
+        raw = await complete_text_stream(
+            messages,
+            system=system,
+            model=self._model,
+            max_tokens=1024,
+            stop_when=self._has_complete_action,
+        )
         return self._parse_action(raw)
 
     async def _execute_action(
@@ -340,6 +374,24 @@ class BrowserAgent:
             lines.append(" ".join(parts))
         return "\n".join(lines) if lines else "(no interactive elements found)"
 
+    @staticmethod
+    def _has_complete_action(text: str) -> bool:
+        """Return True once ``text`` contains a full JSON object with an "action".
+
+        Used to close the response stream as soon as the action is known
+        instead of waiting for Claude to finish generating.
+        """
+        if not text.rstrip().endswith("}"):
+            return False
+        start = text.find("{")
+        if start == -1:
+            return False
+        try:
+            parsed = orjson.loads(text[start:])
+        except orjson.JSONDecodeError:
+            return False
+        return isinstance(parsed, dict) and "action" in parsed
+
     @staticmethod
     def _parse_action(raw: str) -> dict[str, Any]:
         """Parse Claude's response into an action dict.
@@ -359,20 +411,20 @@ class BrowserAgent:
 
         # Try direct JSON parse
         try:
-            parsed = json.loads(text)
+            parsed = orjson.loads(text)
             if isinstance(parsed, dict) and "action" in parsed:
                 return parsed
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         # Try to find JSON object in freeform text
         match = re.search(r"\{[^{}]*\"action\"[^{}]*\}", text)
         if match:
             try:
-                parsed = json.loads(match.group())
+                parsed = orjson.loads(match.group())
                 if isinstance(parsed, dict) and "action" in parsed:
                     return parsed
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
         # Fall back: treat entire response as a "done" summary
@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING
 
 from playwright.async_api import async_playwright
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from types import TracebackType
 
-    from playwright.async_api import BrowserContext, Page
+    from playwright.async_api import Browser, BrowserContext, Page
 
 from src.config import settings
 
@@ -26,15 +26,28 @@ CHROMIUM_ARGS = [
     "--disable-dev-shm-usage",
 ]
 
-# Only one persistent context can use a profile dir at a time
-_profile_lock = asyncio.Lock()
+# Cookies and local storage are persisted here between sessions. Each session
+# gets its own non-persistent context seeded from this file, so concurrent
+# sessions don't contend for a single Chromium user_data_dir.
+STORAGE_STATE_FILENAME = "storage_state.json"
+
+# Profile directories already created this process — start() skips the mkdir
+_ready_profile_dirs: set[Path] = set()
+
+
+def _ensure_profile_dir(profile_dir: Path) -> None:
+    """Create the profile directory once per process."""
+    if profile_dir not in _ready_profile_dirs:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        _ready_profile_dirs.add(profile_dir)
 
 
 class BrowserSession:
     """Manages a headless Chromium browser for a single browsing task.
 
-    Uses a persistent browser profile so cookies and state survive across
-    calls, and applies playwright-stealth evasions to reduce bot detection.
+    Cookies and state survive across calls via a storage-state file in the
+    profile directory, and playwright-stealth evasions are applied to reduce
+    bot detection. Sessions are independent, so several can run concurrently.
 
     Usage::
 
@@ -46,18 +59,22 @@ class BrowserSession:
     def __init__(self, timeout_ms: int | None = None) -> None:
         self._timeout_ms = timeout_ms or settings.browser_timeout_ms
         self._playwright = None
+        self._browser: Browser | None = None
         self._context: BrowserContext | None = None
 
     async def start(self) -> None:
-        """Launch the browser with a persistent profile and stealth evasions."""
+        """Launch the browser with saved storage state and stealth evasions."""
         profile_dir = settings.browser_profile_dir
-        profile_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_profile_dir(profile_dir)
+        state_file = profile_dir / STORAGE_STATE_FILENAME
 
         self._playwright = await async_playwright().start()
-        self._context = await self._playwright.chromium.launch_persistent_context(
-            user_data_dir=str(profile_dir),
+        self._browser = await self._playwright.chromium.launch(
             headless=True,
             args=CHROMIUM_ARGS,
+        )
+        self._context = await self._browser.new_context(
+            storage_state=str(state_file) if state_file.exists() else None,
             viewport=DEFAULT_VIEWPORT,
             user_agent=(
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -80,10 +97,18 @@ class BrowserSession:
         logger.info("Browser session started (timeout=%dms)", self._timeout_ms)
 
     async def stop(self) -> None:
-        """Close everything."""
+        """Save storage state and close everything."""
         if self._context:
+            state_file = settings.browser_profile_dir / STORAGE_STATE_FILENAME
+            try:
+                await self._context.storage_state(path=str(state_file))
+            except Exception:
+                logger.warning("Failed to save browser storage state", exc_info=True)
             await self._context.close()
             self._context = None
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
         if self._playwright:
             await self._playwright.stop()
             self._playwright = None
@@ -97,12 +122,7 @@ class BrowserSession:
         return await self._context.new_page()
 
     async def __aenter__(self) -> BrowserSession:
-        await _profile_lock.acquire()
-        try:
-            await self.start()
-        except BaseException:
-            _profile_lock.release()
-            raise
+        await self.start()
         return self
 
     async def __aexit__(
@@ -111,7 +131,4 @@ class BrowserSession:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        try:
-            await self.stop()
-        finally:
-            _profile_lock.release()
+        await self.stop()
@@ -1,5 +1,6 @@
 """Application settings loaded from environment variables."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -8,6 +9,26 @@ from pydantic_settings import BaseSettings
 
 load_dotenv()
 
+# Markdown/TOML config files (SOUL.md, MEMORY_RULES.md, TOOL_CONFIRMATIONS.toml, ...)
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+
+# The comma-separated env strings below are read on hot paths (every inbound
+# update, every Google/Slack tool call). Parsing is memoized on the raw string,
+# so each distinct value is split once and later reassignments still take effect.
+
+
+@lru_cache(maxsize=8)
+def _parse_int_list(raw: str) -> frozenset[int]:
+    """Parse a comma-separated list of ints into a frozenset."""
+    return frozenset(int(item.strip()) for item in raw.split(",") if item.strip())
+
+
+@lru_cache(maxsize=8)
+def _parse_name_list(raw: str) -> tuple[str, ...]:
+    """Parse a comma-separated list of names into a tuple, preserving order."""
+    return tuple(name.strip() for name in raw.split(",") if name.strip())
+
 
 class Settings(BaseSettings):
     """Nella configuration. All values come from environment variables."""
@@ -47,6 +68,7 @@ class Settings(BaseSettings):
 
     # Memory extraction
     memory_extraction_enabled: bool = Field(default=True)
+    memory_extraction_concurrency: int = Field(default=2)
 
     # Notifications
     default_notification_channel: str = Field(default="telegram")
@@ -108,23 +130,38 @@ class Settings(BaseSettings):
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
-    def get_allowed_user_ids(self) -> set[int]:
-        """Parse ALLOWED_USER_IDS into a set of ints."""
-        if not self.allowed_user_ids.strip():
-            return set()
-        return {int(uid.strip()) for uid in self.allowed_user_ids.split(",") if uid.strip()}
+    @classmethod
+    def for_tests(cls, **overrides: object) -> "Settings":
+        """Build settings from field defaults plus *overrides*, for tests.
+
+        Uses ``model_construct``: no validation and no env/.env reads, so
+        values are exactly what the test passes in.
+        """
+        return cls.model_construct(**overrides)
+
+    def get_allowed_user_ids(self) -> frozenset[int]:
+        """Parse ALLOWED_USER_IDS into a set of ints (cached)."""
+        return _parse_int_list(self.allowed_user_ids)
+
+    def get_google_accounts(self) -> tuple[str, ...]:
+        """Parse GOOGLE_ACCOUNTS into a tuple of account names (cached)."""
+        return _parse_name_list(self.google_accounts)
+
+    def get_slack_workspaces(self) -> tuple[str, ...]:
+        """Parse SLACK_WORKSPACES into a tuple of workspace names (cached)."""
+        return _parse_name_list(self.slack_workspaces)
 
-    def get_google_accounts(self) -> list[str]:
-        """Parse GOOGLE_ACCOUNTS into a list of account names."""
-        if not self.google_accounts.strip():
-            return []
-        return [name.strip() for name in self.google_accounts.split(",") if name.strip()]
 
-    def get_slack_workspaces(self) -> list[str]:
-        """Parse SLACK_WORKSPACES into a list of workspace names."""
-        if not self.slack_workspaces.strip():
-            return []
-        return [name.strip() for name in self.slack_workspaces.split(",") if name.strip()]
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, validating them on first use."""
+    return Settings()
 
 
-settings = Settings()
+def __getattr__(name: str) -> Settings:
+    # ``from src.config import settings`` keeps working, but the model is only
+    # built (and .env read) the first time it is actually imported or accessed.
+    if name == "settings":
+        return get_settings()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
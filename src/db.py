@@ -1,36 +1,67 @@
 """Async database connection abstraction over libsql.
 
-Provides a thin async wrapper around the synchronous ``libsql`` driver using
-``asyncio.to_thread()``.  Connection target is determined by settings:
+Provides a thin async wrapper around the synchronous ``libsql`` driver.
+Remote calls run via ``asyncio.to_thread()``; local-file calls all run on one
+dedicated ``libsql`` worker thread (SQLite serializes them anyway, and this
+keeps each local connection pinned to a single thread).  Connection target is
+determined by settings:
 
 - **Production**: ``TURSO_DATABASE_URL`` + ``TURSO_AUTH_TOKEN`` → remote Turso
 - **Dev/test**: no Turso env vars → local SQLite file via ``database_path``
+
+Connections to the configured database are pooled: ``close()`` on a pooled
+connection hands it back to the pool instead of closing it, so callers keep
+the usual ``get_connection()`` / ``try`` / ``finally: close()`` shape while
+the Turso handshake (or local open + PRAGMAs) is paid once per connection.
+
+Pure reads can ask for ``get_connection(read_only=True)``. Against a local
+file that is a read-only connection on a second worker thread: under WAL it
+never waits on the writer, so a SELECT doesn't queue behind a commit.
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import libsql
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
     from pathlib import Path
 
 from src.config import settings
 
+# Single worker thread for every local-file libsql call...
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="libsql")
+# ...except those on the read-only connection, which get their own.
+_READ_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="libsql-read")
+
+
+async def _run(executor: Executor | None, fn: Callable[..., Any], /, *args: Any) -> Any:
+    """Run a blocking libsql call on *executor* (or the default pool if None)."""
+    if executor is None:
+        return await asyncio.to_thread(fn, *args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args))
+
 
 class _AsyncCursor:
     """Thin async wrapper around a synchronous libsql cursor."""
 
-    def __init__(self, cursor: Any) -> None:
+    def __init__(self, cursor: Any, executor: Executor | None = None) -> None:
         self._cursor = cursor
+        self._executor = executor
 
     async def fetchone(self) -> tuple | None:
-        return await asyncio.to_thread(self._cursor.fetchone)
+        return await _run(self._executor, self._cursor.fetchone)
 
     async def fetchall(self) -> list[tuple]:
-        return await asyncio.to_thread(self._cursor.fetchall)
+        return await _run(self._executor, self._cursor.fetchall)
 
     @property
     def rowcount(self) -> int:
@@ -40,49 +71,225 @@ class _AsyncCursor:
 class _AsyncConnection:
     """Thin async wrapper around a synchronous libsql connection."""
 
-    def __init__(self, conn: Any) -> None:
+    def __init__(self, conn: Any, executor: Executor | None = None) -> None:
         self._conn = conn
+        self._executor = executor
 
     async def execute(self, sql: str, params: tuple = ()) -> _AsyncCursor:
-        cursor = await asyncio.to_thread(self._conn.execute, sql, params)
-        return _AsyncCursor(cursor)
+        cursor = await _run(self._executor, self._conn.execute, sql, params)
+        return _AsyncCursor(cursor, self._executor)
+
+    async def executemany(self, sql: str, seq_of_params: list[tuple]) -> _AsyncCursor:
+        cursor = await _run(self._executor, self._conn.executemany, sql, seq_of_params)
+        return _AsyncCursor(cursor, self._executor)
 
     async def commit(self) -> None:
-        await asyncio.to_thread(self._conn.commit)
+        await _run(self._executor, self._conn.commit)
+
+    async def rollback(self) -> None:
+        await _run(self._executor, self._conn.rollback)
+
+    async def close(self) -> None:
+        await _run(self._executor, self._conn.close)
+
+
+class _PooledConnection(_AsyncConnection):
+    """A connection borrowed from a ``_ConnectionPool``; ``close()`` returns it."""
+
+    def __init__(self, conn: Any, pool: _ConnectionPool) -> None:
+        super().__init__(conn, pool.executor)
+        self._pool = pool
+        self._released = False
 
     async def close(self) -> None:
-        await asyncio.to_thread(self._conn.close)
+        # A second close() must not hand the same connection out twice
+        if self._released:
+            return
+        self._released = True
+        await self._pool.release(self._conn)
+
+
+# How long acquire() waits for a borrowed connection to come back
+_ACQUIRE_TIMEOUT = 30.0
+
+
+class _ConnectionPool:
+    """Bounded pool of warm libsql connections to a single database.
+
+    The idle queue holds connections plus ``None`` tokens: a token stands
+    for a slot freed by a dropped connection, and whoever takes it opens a
+    fresh one. That way a waiter blocked on the queue wakes up whether a
+    connection comes back or is thrown away.
+    """
+
+    def __init__(
+        self,
+        opener: Callable[[], Any],
+        max_size: int,
+        executor: Executor | None = None,
+    ) -> None:
+        self._opener = opener
+        self._max_size = max_size
+        self.executor = executor
+        self._size = 0
+        self._idle: asyncio.Queue[Any] = asyncio.Queue()
+
+    async def acquire(self, timeout: float = _ACQUIRE_TIMEOUT) -> _PooledConnection:
+        """Borrow an idle connection, opening a new one if under the limit.
+
+        Raises ``TimeoutError`` if nothing frees up within *timeout* seconds,
+        rather than hanging every later caller on a connection that was
+        never returned.
+        """
+        conn = None
+        if not self._idle.empty() or self._size >= self._max_size:
+            async with asyncio.timeout(timeout):
+                conn = await self._idle.get()
+        if conn is None:
+            self._size += 1
+            try:
+                conn = await _run(self.executor, self._opener)
+            except BaseException:
+                self._drop()
+                raise
+        return _PooledConnection(conn, self)
+
+    async def release(self, conn: Any) -> None:
+        """Return a connection, rolling back anything the caller left uncommitted.
+
+        If the rollback fails or is cancelled the connection's state is
+        unknown, so it is dropped and its slot freed instead.
+        """
+        try:
+            if conn.in_transaction:
+                await _run(self.executor, conn.rollback)
+        except BaseException:
+            self._drop()
+            raise
+        self._idle.put_nowait(conn)
+
+    def _drop(self) -> None:
+        """Give up a connection's slot and wake a waiter to open a replacement."""
+        self._size -= 1
+        self._idle.put_nowait(None)
+
+    async def close(self) -> None:
+        """Close every idle connection. Borrowed ones are left to their callers."""
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            if conn is None:
+                continue
+            self._size -= 1
+            await _run(self.executor, conn.close)
+
+
+# Remote Turso connections are worth keeping several of. A local SQLite file
+# serializes writers anyway, and with a single worker thread a second local
+# connection could block that thread on busy_timeout while the first waits to
+# commit — so local work shares one connection, borrowed exclusively.
+_REMOTE_POOL_SIZE = 4
+_LOCAL_POOL_SIZE = 1
+
+_pools: dict[str, _ConnectionPool] = {}
+
+
+# Applied once per local connection. synchronous=NORMAL is safe under WAL and
+# skips the per-commit fsync; the page cache is 20 MB (negative = KiB) and
+# reads go through a memory map of up to 256 MB.
+_LOCAL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA mmap_size=268435456;"
+)
+
+
+# journal_mode is a property of the file (set by the writer) and can't be
+# changed from a read-only connection; the rest apply per connection.
+_READER_PRAGMAS = (
+    "PRAGMA busy_timeout=5000;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA mmap_size=268435456;"
+)
 
 
 def _open_local(path: str) -> Any:
-    """Open a local libsql connection with WAL mode and busy timeout."""
+    """Open a local libsql connection with the standard PRAGMAs applied."""
     conn = libsql.connect(path)
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout=5000")
+    conn.executescript(_LOCAL_PRAGMAS)
+    return conn
+
+
+def _open_local_reader(path: str) -> Any:
+    """Open a read-only local libsql connection, creating the file first if needed."""
+    if not os.path.exists(path):
+        _open_local(path).close()
+    conn = libsql.connect(f"file:{path}?mode=ro")
+    conn.executescript(_READER_PRAGMAS)
     return conn
 
 
-async def get_connection(local_path_override: Path | None = None) -> _AsyncConnection:
+async def get_connection(
+    local_path_override: Path | None = None, *, read_only: bool = False
+) -> _AsyncConnection:
     """Return an async-wrapped libsql connection.
 
-    If *local_path_override* is given (test isolation), it takes priority.
-    Otherwise, ``TURSO_DATABASE_URL`` triggers a remote connection, and
-    ``database_path`` falls back to a local file.
+    If *local_path_override* is given (test isolation), it takes priority and
+    a fresh, unpooled connection is returned. Otherwise, ``TURSO_DATABASE_URL``
+    triggers a remote connection, and ``database_path`` falls back to a local
+    file — both served from a per-target pool.
+
+    *read_only* borrows from the local reader pool instead; remote reads share
+    the regular pool, which already serves several callers at once.
     """
     if local_path_override:
         local_path_override.parent.mkdir(parents=True, exist_ok=True)
-        conn = await asyncio.to_thread(_open_local, str(local_path_override))
-        return _AsyncConnection(conn)
+        conn = await _run(_DB_EXECUTOR, _open_local, str(local_path_override))
+        return _AsyncConnection(conn, _DB_EXECUTOR)
+
+    if read_only and not settings.turso_database_url:
+        return await _get_reader_pool().acquire()
+    return await _get_pool().acquire()
+
+
+async def close_pools() -> None:
+    """Close all pooled connections (called on shutdown)."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
 
+
+def _get_pool() -> _ConnectionPool:
+    """Return the pool for the currently configured database, creating it lazily."""
     if settings.turso_database_url:
-        conn = await asyncio.to_thread(
-            libsql.connect,
-            database=settings.turso_database_url,
-            auth_token=settings.turso_auth_token,
-        )
-        return _AsyncConnection(conn)
+        key = settings.turso_database_url
+        if key not in _pools:
+            url, token = settings.turso_database_url, settings.turso_auth_token
+            _pools[key] = _ConnectionPool(
+                lambda: libsql.connect(database=url, auth_token=token),
+                _REMOTE_POOL_SIZE,
+            )
+        return _pools[key]
 
     # Local file fallback
-    settings.database_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = await asyncio.to_thread(_open_local, str(settings.database_path))
-    return _AsyncConnection(conn)
+    key = str(settings.database_path)
+    if key not in _pools:
+        settings.database_path.parent.mkdir(parents=True, exist_ok=True)
+        _pools[key] = _ConnectionPool(lambda: _open_local(key), _LOCAL_POOL_SIZE, _DB_EXECUTOR)
+    return _pools[key]
+
+
+def _get_reader_pool() -> _ConnectionPool:
+    """Return the read-only pool for the local database, creating it lazily."""
+    path = str(settings.database_path)
+    key = f"{path}?mode=ro"
+    if key not in _pools:
+        settings.database_path.parent.mkdir(parents=True, exist_ok=True)
+        _pools[key] = _ConnectionPool(
+            lambda: _open_local_reader(path), _LOCAL_POOL_SIZE, _READ_EXECUTOR
+        )
+    return _pools[key]
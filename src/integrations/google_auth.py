@@ -1,16 +1,60 @@
 """Google OAuth2 authentication manager — multi-account registry."""
 
+import asyncio
 import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any
 
+import httplib2
+import orjson
+import requests
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_PATH_TEMPLATE = "auth_tokens/google_{name}_auth_token.json"
+
+
+@lru_cache(maxsize=8)
+def _token_paths(accounts: tuple[str, ...]) -> tuple[str, ...]:
+    """Token file paths for *accounts*, built once per configured account list."""
+    return tuple(_TOKEN_PATH_TEMPLATE.format(name=name) for name in accounts)
+
+
+# Blocking googleapiclient calls run here rather than on the default executor,
+# so a burst of Google tool calls can't starve DB and other to_thread work.
+_GOOGLE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="google-api")
+
+
+async def run_google_api(fn: Callable[..., Any], /, *args: Any) -> Any:
+    """Run a blocking Google API call on the dedicated ``google-api`` pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_GOOGLE_EXECUTOR, partial(fn, *args))
+
+
+# One token-refresh transport for every account, so refreshes share the
+# underlying requests.Session (and its pooled TLS connections).
+_auth_request: Request | None = None
+
+
+def _get_auth_request() -> Request:
+    """Return the shared transport for credential refreshes, creating it lazily."""
+    global _auth_request  # noqa: PLW0603
+    if _auth_request is None:
+        _auth_request = Request(session=requests.Session())
+    return _auth_request
+
 
 class GoogleAuthManager:
     """Per-account Google OAuth credentials and API service builder.
@@ -20,6 +64,7 @@ class GoogleAuthManager:
     """
 
     _instances: dict[str, "GoogleAuthManager"] = {}
+    _get_lock = threading.Lock()
 
     SCOPES = [
         "https://www.googleapis.com/auth/gmail.modify",
@@ -33,6 +78,12 @@ class GoogleAuthManager:
         self._account = account
         self._token_path = token_path
         self._credentials: Credentials | None = None
+        # mtime of the token file when it was last read or written by us
+        self._token_mtime: float | None = None
+        # api name -> (credentials it was built with, service)
+        self._services: dict[str, tuple[Credentials, Any]] = {}
+        # Tool calls run in worker threads; only one of them loads/refreshes
+        self._refresh_lock = threading.Lock()
 
     @classmethod
     def get(cls, account: str | None = None) -> "GoogleAuthManager":
@@ -60,11 +111,15 @@ class GoogleAuthManager:
             )
             raise ValueError(msg)
 
-        if name not in cls._instances:
-            token_path = Path(f"auth_tokens/google_{name}_auth_token.json")
-            cls._instances[name] = cls(name, token_path)
+        instance = cls._instances.get(name)
+        if instance is None:
+            with cls._get_lock:
+                instance = cls._instances.get(name)
+                if instance is None:
+                    token_path = Path(_TOKEN_PATH_TEMPLATE.format(name=name))
+                    instance = cls._instances[name] = cls(name, token_path)
 
-        return cls._instances[name]
+        return instance
 
     @classmethod
     def any_enabled(cls) -> bool:
@@ -76,9 +131,7 @@ class GoogleAuthManager:
         if not configured:
             logger.warning("GOOGLE_ACCOUNTS is not configured — Google tools disabled")
             return False
-        return any(
-            Path(f"auth_tokens/google_{name}_auth_token.json").exists() for name in configured
-        )
+        return any(os.path.exists(path) for path in _token_paths(configured))
 
     @property
     def enabled(self) -> bool:
@@ -97,42 +150,115 @@ class GoogleAuthManager:
             )
             raise FileNotFoundError(msg)
 
-        creds = Credentials.from_authorized_user_file(str(self._token_path), self.SCOPES)
+        info = orjson.loads(self._token_path.read_bytes())
+        creds = Credentials.from_authorized_user_info(info, self.SCOPES)
+        self._token_mtime = self._read_token_mtime()
 
         if creds.expired and creds.refresh_token:
-            logger.info("Refreshing expired Google credentials for account '%s'", self._account)
-            creds.refresh(Request())
-            self._token_path.write_text(creds.to_json(), encoding="utf-8")
-            logger.info("Google credentials refreshed and saved for account '%s'", self._account)
+            self._refresh(creds)
 
         return creds
 
+    def _refresh(self, creds: Credentials) -> None:
+        """Refresh *creds* in place and persist them to the token file."""
+        logger.info("Refreshing expired Google credentials for account '%s'", self._account)
+        creds.refresh(_get_auth_request())
+        self._token_path.write_text(creds.to_json(), encoding="utf-8")
+        self._token_mtime = self._read_token_mtime()
+        logger.info("Google credentials refreshed and saved for account '%s'", self._account)
+
+    def _read_token_mtime(self) -> float | None:
+        try:
+            return self._token_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def _is_current(self, creds: Credentials) -> bool:
+        """True if *creds* needs neither a reload from disk nor a refresh."""
+        mtime = self._read_token_mtime()
+        if mtime is not None and mtime != self._token_mtime:
+            return False
+        return not (creds.expired and creds.refresh_token)
+
     def _get_credentials(self) -> Credentials:
-        """Return cached credentials, loading/refreshing as needed."""
-        if self._credentials is None or (
-            self._credentials.expired and self._credentials.refresh_token
-        ):
-            self._credentials = self._load_credentials()
-        return self._credentials
+        """Return cached credentials, loading/refreshing as needed.
+
+        The token file is only re-read when its mtime changes (e.g. after
+        re-running ``scripts/google_auth.py``); expiry is handled by
+        refreshing the cached credentials in place. Loading and refreshing
+        happen under a per-account lock, so a burst of concurrent calls on
+        an expired token triggers a single refresh.
+        """
+        creds = self._credentials
+        if creds is not None and self._is_current(creds):
+            return creds
+
+        with self._refresh_lock:
+            # Another thread may have loaded/refreshed while we waited
+            creds = self._credentials
+            if creds is None:
+                self._credentials = self._load_credentials()
+                return self._credentials
+
+            mtime = self._read_token_mtime()
+            if mtime is not None and mtime != self._token_mtime:
+                logger.info("Google token file changed on disk for account '%s'", self._account)
+                self._credentials = self._load_credentials()
+            elif creds.expired and creds.refresh_token:
+                self._refresh(creds)
+            return self._credentials
 
     # -- service builders -----------------------------------------------------
 
+    def _service(self, api: str, version: str) -> Any:
+        """Return a cached API service, rebuilding only if credentials changed.
+
+        ``build()`` parses a large discovery document, so services are kept
+        per account. httplib2 is not thread-safe and tool calls run in worker
+        threads, so each request gets its own ``Http`` via ``requestBuilder``.
+        """
+        creds = self._get_credentials()
+        cached = self._services.get(api)
+        if cached is not None and cached[0] is creds:
+            return cached[1]
+
+        def build_request(_http: Any, *args: Any, **kwargs: Any) -> HttpRequest:
+            return HttpRequest(AuthorizedHttp(creds, http=httplib2.Http()), *args, **kwargs)
+
+        service = build(
+            api,
+            version,
+            http=AuthorizedHttp(creds, http=httplib2.Http()),
+            requestBuilder=build_request,
+        )
+        self._services[api] = (creds, service)
+        return service
+
     def gmail(self):  # noqa: ANN201
-        """Build a Gmail API service."""
-        return build("gmail", "v1", credentials=self._get_credentials())
+        """Return the Gmail API service."""
+        return self._service("gmail", "v1")
 
     def calendar(self):  # noqa: ANN201
-        """Build a Calendar API service."""
-        return build("calendar", "v3", credentials=self._get_credentials())
+        """Return the Calendar API service."""
+        return self._service("calendar", "v3")
 
     def drive(self):  # noqa: ANN201
-        """Build a Drive API service."""
-        return build("drive", "v3", credentials=self._get_credentials())
+        """Return the Drive API service."""
+        return self._service("drive", "v3")
 
     def docs(self):  # noqa: ANN201
-        """Build a Docs API service."""
-        return build("docs", "v1", credentials=self._get_credentials())
+        """Return the Docs API service."""
+        return self._service("docs", "v1")
 
     def people(self):  # noqa: ANN201
-        """Build a People API service."""
-        return build("people", "v1", credentials=self._get_credentials())
+        """Return the People API service."""
+        return self._service("people", "v1")
+
+
+def get_google_credentials(account: str | None = None) -> Credentials:
+    """Return live credentials for *account* (or the default) via its manager.
+
+    Shares the manager's cache and refresh lock, for callers that need raw
+    credentials rather than an API service.
+    """
+    return GoogleAuthManager.get(account)._get_credentials()
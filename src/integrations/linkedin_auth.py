@@ -1,11 +1,11 @@
 """LinkedIn OAuth2 authentication manager — single-account singleton."""
 
-import json
 import logging
 import time
 from pathlib import Path
 
 import httpx
+import orjson
 
 from src.config import settings
 
@@ -14,6 +14,22 @@ logger = logging.getLogger(__name__)
 TOKEN_PATH = Path("auth_tokens/linkedin_default_auth_token.json")
 TOKEN_ENDPOINT = "https://www.linkedin.com/oauth/v2/accessToken"
 
+# Refresh this many seconds before the server-side expiry to avoid racing it.
+EXPIRY_MARGIN_SECONDS = 60
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Lazily initialize the shared HTTP client used for token refreshes."""
+    global _client  # noqa: PLW0603
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _client
+
 
 class LinkedInAuthError(Exception):
     """Raised when LinkedIn authentication fails."""
@@ -30,6 +46,8 @@ class LinkedInAuth:
 
     def __init__(self) -> None:
         self._token_data: dict | None = None
+        # Monotonic deadline until which the cached token is known-good
+        self._valid_until: float = 0.0
 
     @classmethod
     def get(cls) -> "LinkedInAuth":
@@ -56,11 +74,11 @@ class LinkedInAuth:
                 "Run `python scripts/linkedin_auth.py` to authenticate."
             )
             raise LinkedInAuthError(msg)
-        return json.loads(TOKEN_PATH.read_text(encoding="utf-8"))
+        return orjson.loads(TOKEN_PATH.read_bytes())
 
-    def _refresh(self, refresh_token: str) -> dict:
-        """Exchange a refresh token for a new access token (sync)."""
-        resp = httpx.post(
+    async def _refresh(self, refresh_token: str) -> dict:
+        """Exchange a refresh token for a new access token."""
+        resp = await _get_client().post(
             TOKEN_ENDPOINT,
             data={
                 "grant_type": "refresh_token",
@@ -69,25 +87,36 @@ class LinkedInAuth:
                 "client_secret": settings.linkedin_client_secret,
             },
             headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=15,
         )
         if resp.status_code != 200:
             msg = f"LinkedIn token refresh failed ({resp.status_code}): {resp.text[:200]}"
             raise LinkedInAuthError(msg)
         return resp.json()
 
-    def _ensure_token(self) -> dict:
-        """Load token, refreshing if expired and a refresh_token exists."""
+    def _mark_valid(self, expires_at: float) -> None:
+        """Cache the expiry as a monotonic deadline (minus the safety margin)."""
+        remaining = expires_at - time.time() - EXPIRY_MARGIN_SECONDS
+        self._valid_until = time.monotonic() + remaining
+
+    async def _ensure_token(self) -> dict:
+        """Load token, refreshing if (nearly) expired and a refresh_token exists."""
+        if self._token_data is not None and time.monotonic() < self._valid_until:
+            return self._token_data
+
         if self._token_data is None:
             self._token_data = self._load_token()
 
         expires_at = self._token_data.get("expires_at", 0)
-        if time.time() < expires_at:
+        now = time.time()
+        if now < expires_at - EXPIRY_MARGIN_SECONDS:
+            self._mark_valid(expires_at)
             return self._token_data
 
-        # Token expired — try refresh
+        # Token expired (or about to) — try refresh
         refresh_token = self._token_data.get("refresh_token", "")
         if not refresh_token:
+            if now < expires_at:
+                return self._token_data
             msg = (
                 "LinkedIn access token has expired and no refresh token is available. "
                 "Re-run `python scripts/linkedin_auth.py` to re-authenticate."
@@ -95,23 +124,24 @@ class LinkedInAuth:
             raise LinkedInAuthError(msg)
 
         logger.info("Refreshing expired LinkedIn access token")
-        new_data = self._refresh(refresh_token)
+        new_data = await self._refresh(refresh_token)
 
         # Merge new token data
         self._token_data["access_token"] = new_data["access_token"]
         self._token_data["expires_at"] = time.time() + new_data.get("expires_in", 5184000)
         if new_data.get("refresh_token"):
             self._token_data["refresh_token"] = new_data["refresh_token"]
+        self._mark_valid(self._token_data["expires_at"])
 
         # Persist updated token
-        TOKEN_PATH.write_text(json.dumps(self._token_data, indent=2), encoding="utf-8")
+        TOKEN_PATH.write_bytes(orjson.dumps(self._token_data, option=orjson.OPT_INDENT_2))
         logger.info("LinkedIn token refreshed and saved")
 
         return self._token_data
 
-    def get_headers(self) -> dict[str, str]:
+    async def get_headers(self) -> dict[str, str]:
         """Return authorization + API version headers for LinkedIn REST API."""
-        token_data = self._ensure_token()
+        token_data = await self._ensure_token()
         return {
             "Authorization": f"Bearer {token_data['access_token']}",
             "LinkedIn-Version": "202401",
@@ -119,9 +149,9 @@ class LinkedInAuth:
             "X-Restli-Protocol-Version": "2.0.0",
         }
 
-    def get_person_urn(self) -> str:
+    async def get_person_urn(self) -> str:
         """Return the ``urn:li:person:{id}`` for the authenticated user."""
-        token_data = self._ensure_token()
+        token_data = await self._ensure_token()
         person_id = token_data.get("person_id", "")
         if not person_id:
             msg = "person_id not found in LinkedIn token file. Re-run the auth script."
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import anthropic
+import httpx
 
 from src.config import settings
 from src.llm.models import ModelManager
 from src.llm.prompt import build_system_prompt
 from src.tools import registry
+from src.tools.base import ToolResult
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -34,14 +38,35 @@ class PendingToolCall:
     description: str
 
 
+# Shared by chat rounds, memory extraction and complete_text side calls.
+# HTTP/2 lets concurrent requests multiplex over one warm TLS connection.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60,
+)
+
+
 def _get_client() -> anthropic.AsyncAnthropic:
     """Lazily initialize the Anthropic client."""
     global _client  # noqa: PLW0603
     if _client is None:
-        _client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+        _client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            # Keeps the SDK's default timeouts and redirect handling
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=_HTTP_LIMITS, http2=True),
+        )
     return _client
 
 
+async def close_client() -> None:
+    """Close the shared Anthropic client and its connection pool (on shutdown)."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
 async def complete_text(
     messages: list[dict[str, Any]],
     *,
@@ -66,14 +91,93 @@ async def complete_text(
     return response.content[0].text
 
 
-def _serialize_content(content: list[Any]) -> list[dict[str, Any]]:
-    """Convert SDK content blocks to plain dicts for message history."""
-    result: list[dict[str, Any]] = []
+async def complete_text_stream(
+    messages: list[dict[str, Any]],
+    *,
+    system: str | list[dict[str, Any]] | None = None,
+    model: str | None = None,
+    max_tokens: int = 4096,
+    stop_when: Callable[[str], bool] | None = None,
+) -> str:
+    """Single-shot Claude call that streams, optionally stopping early.
+
+    Like ``complete_text()``, but the response is streamed and
+    ``stop_when`` is called with the accumulated text after each chunk
+    that ends in ``}`` (trailing whitespace aside) — the only point where a
+    JSON object can have just closed. When it returns True the stream is
+    closed and the text so far is returned — useful when the caller only
+    needs one JSON object and the remaining tokens are waste. Checking the
+    chunk first keeps the buffer from being re-joined on every delta.
+    """
+    client = _get_client()
+    kwargs: dict[str, Any] = {
+        "model": model or ModelManager.get().get_chat_model(),
+        "max_tokens": max_tokens,
+        "messages": messages,
+    }
+    if system is not None:
+        kwargs["system"] = system
+
+    parts: list[str] = []
+    async with client.messages.stream(**kwargs) as stream:
+        async for text in stream.text_stream:
+            parts.append(text)
+            if stop_when is not None and text.rstrip().endswith("}") and stop_when("".join(parts)):
+                break
+    return "".join(parts)
+
+
+class _DeltaBuffer:
+    """Coalesces streamed text deltas before handing them to ``on_text_delta``.
+
+    The SDK yields many tiny deltas; the callback fires once at least
+    ``min_chars`` are buffered or ``max_delay`` seconds have passed since the
+    last flush. Callers must ``flush()`` at the end of each streamed round.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str], Awaitable[None]] | None,
+        min_chars: int = 32,
+        max_delay: float = 0.05,
+    ) -> None:
+        self._callback = callback
+        self._min_chars = min_chars
+        self._max_delay = max_delay
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    async def push(self, text: str) -> None:
+        if self._callback is None:
+            return
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._min_chars or time.monotonic() - self._last_flush >= self._max_delay:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._parts:
+            text = "".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            await self._callback(text)
+        self._last_flush = time.monotonic()
+
+
+def _split_content(content: list[Any]) -> tuple[list[dict[str, Any]], list[Any]]:
+    """Convert SDK content blocks to plain dicts for message history.
+
+    Returns ``(serialized, tool_use_blocks)`` from a single pass, where
+    ``tool_use_blocks`` are the original SDK blocks.
+    """
+    serialized: list[dict[str, Any]] = []
+    tool_use_blocks: list[Any] = []
     for block in content:
         if block.type == "text":
-            result.append({"type": "text", "text": block.text})
+            serialized.append({"type": "text", "text": block.text})
         elif block.type == "tool_use":
-            result.append(
+            serialized.append(
                 {
                     "type": "tool_use",
                     "id": block.id,
@@ -81,7 +185,141 @@ def _serialize_content(content: list[Any]) -> list[dict[str, Any]]:
                     "input": block.input,
                 }
             )
-    return result
+            tool_use_blocks.append(block)
+    return serialized, tool_use_blocks
+
+
+_CONTENT_FILTER_MSG = "My response was blocked by a content filter. Could you try rephrasing?"
+
+
+def _is_content_filter_error(exc: anthropic.APIStatusError) -> bool:
+    return "content filtering" in str(exc).lower()
+
+
+# tool_result content for a denied confirmation, serialized once
+_DENIED_CONTENT = ToolResult(error="User denied this action.").to_content()
+
+# Tool-round history gets a cache breakpoint on its last tool_result from this
+# (0-based) round on, so resending it next round is a cache read. Rolling: at
+# most this many message breakpoints are kept, leaving room under the API's
+# limit of 4 for the system prompt's. Each tag costs a small cache write; a
+# one-round exchange is never tagged since nothing would read it back.
+_HISTORY_CACHE_FROM_ROUND = 1
+_MAX_HISTORY_BREAKPOINTS = 2
+
+
+def _mark_cache_breakpoint(block: dict[str, Any], marked: list[dict[str, Any]]) -> None:
+    """Tag *block* as a prompt-cache breakpoint, untagging the oldest if over the cap."""
+    block["cache_control"] = {"type": "ephemeral"}
+    marked.append(block)
+    while len(marked) > _MAX_HISTORY_BREAKPOINTS:
+        del marked.pop(0)["cache_control"]
+
+
+# Results of side-effect-free tool calls within one generate_response call,
+# keyed by (tool name, canonical JSON input).
+_CallCache = dict[tuple[str, str], "asyncio.Future[ToolResult]"]
+
+
+async def _run_tool(
+    block: Any,
+    msg_context: MessageContext | None,
+    call_cache: _CallCache | None = None,
+) -> dict[str, Any]:
+    """Execute one tool_use block and wrap the outcome as a tool_result.
+
+    Identical calls to side-effect-free tools share one execution via
+    *call_cache*; any other tool clears it, since it may have changed
+    what those reads would return.
+    """
+    tool_def = registry.get(block.name)
+    if call_cache is None:
+        result = await registry.execute(block.name, block.input, msg_context=msg_context)
+    elif tool_def is not None and tool_def.side_effect_free:
+        key = (block.name, json.dumps(block.input, sort_keys=True, separators=(",", ":")))
+        future = call_cache.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                registry.execute(block.name, block.input, msg_context=msg_context)
+            )
+            call_cache[key] = future
+        else:
+            logger.info("Reusing result of identical '%s' call", block.name)
+        result = await future
+        if not result.success and call_cache.get(key) is future:
+            # Don't pin failures; a later identical call may succeed
+            del call_cache[key]
+    else:
+        call_cache.clear()
+        result = await registry.execute(block.name, block.input, msg_context=msg_context)
+
+    return {
+        "type": "tool_result",
+        "tool_use_id": block.id,
+        "content": result.to_content(),
+        "is_error": not result.success,
+    }
+
+
+async def _execute_tool_calls(
+    tool_use_blocks: list[Any],
+    on_confirm: Callable[[PendingToolCall], Awaitable[bool]] | None,
+    msg_context: MessageContext | None,
+    call_cache: _CallCache | None = None,
+) -> list[dict[str, Any]]:
+    """Execute a round's tool calls, returning tool_results in block order.
+
+    Consecutive auto-approved, parallel-safe calls run concurrently.
+    Confirmation-gated and non-parallel-safe tools act as barriers: the
+    pending batch finishes first, then they run on their own, so prompts
+    are never interleaved and order-dependent side effects stay ordered.
+    """
+    tool_results: list[dict[str, Any]] = []
+    batch: list[Any] = []
+
+    async def flush() -> None:
+        if batch:
+            tool_results.extend(
+                await asyncio.gather(*(_run_tool(b, msg_context, call_cache) for b in batch))
+            )
+            batch.clear()
+
+    for block in tool_use_blocks:
+        tool_def = registry.get(block.name)
+
+        # Confirmation gate
+        if tool_def and registry.requires_confirmation(block.name):
+            await flush()
+            approved = False
+            if on_confirm:
+                pending = PendingToolCall(
+                    tool_use_id=block.id,
+                    tool_name=block.name,
+                    tool_input=block.input,
+                    description=tool_def.description,
+                )
+                approved = await on_confirm(pending)
+
+            if not approved:
+                tool_results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": _DENIED_CONTENT,
+                        "is_error": True,
+                    }
+                )
+                continue
+
+            tool_results.append(await _run_tool(block, msg_context, call_cache))
+        elif tool_def is None or tool_def.parallel_safe:
+            batch.append(block)
+        else:
+            await flush()
+            tool_results.append(await _run_tool(block, msg_context, call_cache))
+
+    await flush()
+    return tool_results
 
 
 async def generate_response(
@@ -107,7 +345,8 @@ async def generate_response(
 
     Args:
         messages: Conversation history in Claude API message format.
-        on_text_delta: Async callback receiving each text chunk.
+        on_text_delta: Async callback receiving streamed text, coalesced
+            into small batches rather than one call per SDK delta.
         on_confirm: Async callback for tool confirmation; return True to allow.
 
     Returns:
@@ -130,22 +369,50 @@ async def generate_response(
         source_channel=source_channel,
     )
 
+    # Resolved once: every round of this response uses the same model
+    model = model or ModelManager.get().chat_model
+
+    # No tools and nobody listening to deltas: one plain request, no streaming
+    if not tool_schemas and on_text_delta is None:
+        try:
+            response = await client.messages.create(
+                model=model,
+                max_tokens=4096,
+                system=system_prompt,
+                messages=messages,
+            )
+        except anthropic.APIStatusError as exc:
+            if _is_content_filter_error(exc):
+                logger.warning("Response blocked by content filter")
+                return _CONTENT_FILTER_MSG
+            raise
+        return "".join(b.text for b in response.content if b.type == "text")
+
+    # Shallow copy (pointers only) so the caller's history isn't mutated;
+    # each round then appends in place.
     loop_messages = list(messages)
-    full_text = ""
+    # Text deltas across all rounds; joined once on return.
+    chunks: list[str] = []
+    call_cache: _CallCache = {}
+    deltas = _DeltaBuffer(on_text_delta)
+    # tool_result blocks currently carrying cache_control
+    cache_marked: list[dict[str, Any]] = []
+
+    # Identical for every round: loop_messages grows in place between rounds
+    kwargs: dict[str, Any] = {
+        "model": model,
+        "max_tokens": 4096,
+        "system": system_prompt,
+        "messages": loop_messages,
+    }
+    if tool_schemas:
+        kwargs["tools"] = tool_schemas
 
     max_rounds = settings.max_tool_rounds
     for round_num in range(max_rounds):
-        kwargs: dict[str, Any] = {
-            "model": model or ModelManager.get().get_chat_model(),
-            "max_tokens": 4096,
-            "system": system_prompt,
-            "messages": loop_messages,
-        }
-        if tool_schemas:
-            kwargs["tools"] = tool_schemas
-
-        # Save length so we can retract text if this round has confirmation tools.
-        pre_round_len = len(full_text)
+        # Remember where this round starts so its text can be retracted if it
+        # has confirmation tools.
+        round_start = len(chunks)
 
         try:
             async with client.messages.stream(**kwargs) as stream:
@@ -154,42 +421,42 @@ async def generate_response(
                     # Insert a visual separator between streaming rounds so
                     # text from successive tool-calling rounds doesn't run
                     # together into an unreadable blob.
-                    if first_chunk and round_num > 0 and full_text and not full_text.endswith("\n"):
-                        full_text += "\n\n"
-                        if on_text_delta:
-                            await on_text_delta("\n\n")
+                    if first_chunk and round_num > 0 and chunks and not chunks[-1].endswith("\n"):
+                        chunks.append("\n\n")
+                        await deltas.push("\n\n")
                         first_chunk = False
-                    full_text += text
-                    if on_text_delta:
-                        await on_text_delta(text)
+                    chunks.append(text)
+                    await deltas.push(text)
                     first_chunk = False
 
+                await deltas.flush()
                 response = await stream.get_final_message()
         except anthropic.APIStatusError as exc:
-            if "content filtering" in str(exc).lower():
+            if _is_content_filter_error(exc):
                 logger.warning("Response blocked by content filter (round %d)", round_num + 1)
-                msg = "My response was blocked by a content filter. Could you try rephrasing?"
+                msg = _CONTENT_FILTER_MSG
+                await deltas.flush()
                 if on_text_delta:
-                    if full_text:
+                    if chunks:
                         await on_text_delta("\n\n")
                     await on_text_delta(msg)
-                return f"{full_text}\n\n{msg}".strip()
+                return f"{''.join(chunks)}\n\n{msg}".strip()
             raise
 
-        tool_use_blocks = [b for b in response.content if b.type == "tool_use"]
+        serialized, tool_use_blocks = _split_content(response.content)
 
         if not tool_use_blocks:
-            return full_text
+            return "".join(chunks)
 
         # When confirmation is needed, Claude's text was generated before
         # knowing the outcome — it often claims success prematurely.
-        # Retract that text from full_text so the final result is accurate.
+        # Retract that text from the result so the final result is accurate.
         # The next round will produce correct text based on actual results.
         # (The text was already streamed to on_text_delta, but the handler's
         # final edit_text(result_text) will replace it with the clean version.)
         has_confirmation = any(registry.requires_confirmation(b.name) for b in tool_use_blocks)
         if has_confirmation:
-            full_text = full_text[:pre_round_len]
+            del chunks[round_start:]
 
         logger.info(
             "Round %d: %d tool call(s): %s",
@@ -202,49 +469,16 @@ async def generate_response(
         loop_messages.append(
             {
                 "role": "assistant",
-                "content": _serialize_content(response.content),
+                "content": serialized,
             }
         )
 
-        # Execute each tool call
-        tool_results: list[dict[str, Any]] = []
-        for block in tool_use_blocks:
-            tool_def = registry.get(block.name)
-
-            # Confirmation gate
-            if tool_def and registry.requires_confirmation(block.name):
-                approved = False
-                if on_confirm:
-                    pending = PendingToolCall(
-                        tool_use_id=block.id,
-                        tool_name=block.name,
-                        tool_input=block.input,
-                        description=tool_def.description,
-                    )
-                    approved = await on_confirm(pending)
-
-                if not approved:
-                    tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": json.dumps({"error": "User denied this action."}),
-                            "is_error": True,
-                        }
-                    )
-                    continue
-
-            result = await registry.execute(block.name, block.input, msg_context=msg_context)
-
-            tool_results.append(
-                {
-                    "type": "tool_result",
-                    "tool_use_id": block.id,
-                    "content": result.to_content(),
-                    "is_error": not result.success,
-                }
-            )
+        tool_results = await _execute_tool_calls(
+            tool_use_blocks, on_confirm, msg_context, call_cache
+        )
 
+        if round_num >= _HISTORY_CACHE_FROM_ROUND and tool_results:
+            _mark_cache_breakpoint(tool_results[-1], cache_marked)
         loop_messages.append({"role": "user", "content": tool_results})
 
     last_tools = ", ".join(b.name for b in tool_use_blocks) if tool_use_blocks else "none"
@@ -253,4 +487,4 @@ async def generate_response(
         max_rounds,
         last_tools,
     )
-    return full_text
+    return "".join(chunks)
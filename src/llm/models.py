@@ -15,14 +15,13 @@ MODEL_MAP: dict[str, str] = {
 # Reverse lookup: full model string → friendly name
 FRIENDLY_NAMES: dict[str, str] = {v: k for k, v in MODEL_MAP.items()}
 
+# Friendly name or full ID → full ID, built once so resolving is one lookup
+_RESOLVE: dict[str, str] = {**MODEL_MAP, **{v: v for v in MODEL_MAP.values()}}
+
 
 def _resolve(name_or_id: str) -> str | None:
     """Resolve a friendly name or full model ID. Returns full ID or None."""
-    if name_or_id in MODEL_MAP:
-        return MODEL_MAP[name_or_id]
-    if name_or_id in FRIENDLY_NAMES:
-        return name_or_id
-    return None
+    return _RESOLVE.get(name_or_id)
 
 
 def friendly(model_id: str) -> str:
@@ -31,17 +30,21 @@ def friendly(model_id: str) -> str:
 
 
 class ModelManager:
-    """Singleton that tracks which models are active for chat and memory."""
+    """Singleton that tracks which models are active for chat and memory.
+
+    ``chat_model`` and ``memory_model`` are plain attributes holding full
+    model IDs; hot paths read them directly. Change them via the setters.
+    """
 
     _instance: "ModelManager | None" = None
 
     def __init__(self) -> None:
-        self._chat_model = _resolve(settings.default_chat_model) or MODEL_MAP["sonnet"]
-        self._memory_model = _resolve(settings.default_memory_model) or MODEL_MAP["haiku"]
+        self.chat_model = _resolve(settings.default_chat_model) or MODEL_MAP["sonnet"]
+        self.memory_model = _resolve(settings.default_memory_model) or MODEL_MAP["haiku"]
         logger.info(
             "Models: chat=%s, memory=%s",
-            friendly(self._chat_model),
-            friendly(self._memory_model),
+            friendly(self.chat_model),
+            friendly(self.memory_model),
         )
 
     @classmethod
@@ -51,16 +54,16 @@ class ModelManager:
         return cls._instance
 
     def get_chat_model(self) -> str:
-        return self._chat_model
+        return self.chat_model
 
     def get_memory_model(self) -> str:
-        return self._memory_model
+        return self.memory_model
 
     def set_chat_model(self, name: str) -> str | None:
         """Set chat model by friendly name. Returns full ID or None if invalid."""
         model_id = _resolve(name)
         if model_id:
-            self._chat_model = model_id
+            self.chat_model = model_id
             logger.info("Chat model → %s", friendly(model_id))
         return model_id
 
@@ -68,6 +71,6 @@ class ModelManager:
         """Set memory model by friendly name. Returns full ID or None if invalid."""
         model_id = _resolve(name)
         if model_id:
-            self._memory_model = model_id
+            self.memory_model = model_id
             logger.info("Memory model → %s", friendly(model_id))
         return model_id
@@ -1,20 +1,58 @@
 """System prompt assembly with memory retrieval."""
 
+import asyncio
 import logging
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 
 try:
     import zoneinfo
 except ImportError:  # pragma: no cover
     from backports import zoneinfo  # type: ignore[no-redef]
 
-from src.config import settings
+from src.config import CONFIG_DIR, settings
 from src.memory.models import MemoryEntry
+from src.memory.text import is_trivial, normalize_query
 
 logger = logging.getLogger(__name__)
 
-CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
+# Config files that feed the static prompt block (order matches _build_static_text)
+_STATIC_CONFIG_FILES = ("SOUL.md", "USER.md", "TOOLS.md", "MEMORY.md", "NOTION.md")
+
+# (inputs key, assembled static text) from the last build
+_static_cache: tuple[tuple, str] | None = None
+
+
+_GOOGLE_ACCOUNTS_INTRO = (
+    "When using Google tools, specify which account via the `account` parameter. "
+    "If omitted, the default is used.\n"
+)
+_SLACK_WORKSPACES_INTRO = (
+    "When using Slack tools, specify which workspace via the `workspace` parameter. "
+    "If omitted, the default is used.\n"
+)
+_LINKEDIN_BLOCK = (
+    "# LinkedIn\n\n"
+    "LinkedIn is connected. You can create posts with `linkedin_create_post` "
+    "and comment on posts with `linkedin_post_comment` (provide the post URL). "
+    "Both require confirmation before executing."
+)
+_NOTION_FALLBACK_BLOCK = (
+    "# Notion\n\n"
+    "Notion is connected. You can search, query databases, create/update pages, "
+    "read content, and archive pages. Use notion_list_databases to discover "
+    "available databases."
+)
+
+
+@lru_cache(maxsize=8)
+def _named_list_block(heading: str, intro: str, names: tuple[str, ...], default: str) -> str:
+    """Render a "# Heading" block listing *names*, marking the default one."""
+    lines = [f"# {heading}\n", intro]
+    for name in names:
+        suffix = " (default)" if name == default else ""
+        lines.append(f"- {name}{suffix}")
+    return "\n".join(lines)
 
 
 def _read_config(filename: str) -> str:
@@ -37,7 +75,14 @@ def _format_memories(entries: list[MemoryEntry]) -> str:
 
 
 async def _retrieve_memories(user_message: str) -> str:
-    """Search the memory store for context relevant to the user's message."""
+    """Search the memory store for context relevant to the user's message.
+
+    Trivial messages skip the search entirely; repeats are served from
+    the store's own search cache.
+    """
+    if is_trivial(normalize_query(user_message)):
+        return ""
+
     try:
         from src.memory.store import MemoryStore
 
@@ -52,27 +97,51 @@ async def _retrieve_memories(user_message: str) -> str:
         return ""
 
 
-async def build_system_prompt(
-    user_message: str = "",
-    source_channel: str = "",
-) -> list[dict]:
-    """Assemble the system prompt with optional memory context.
+def _config_stamp(filename: str) -> tuple[int, int] | None:
+    """Return the config file's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        st = (CONFIG_DIR / filename).stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
-    The static parts (SOUL.md, USER.md, TOOLS.md, MEMORY.md) get ``cache_control``
-    so they're cached across tool-calling rounds. Retrieved memories are
-    appended as a separate block.
 
-    Args:
-        user_message: Current user message for memory retrieval. If empty,
-            no memory search is performed.
+def _static_key() -> tuple:
+    """Everything the static prompt block depends on.
 
-    Returns:
-        List of content blocks for the Claude ``system`` parameter.
+    Cheap to compute (a few stats and settings reads); when it is unchanged
+    the assembled block is reused instead of re-reading and re-joining files.
     """
-    soul = _read_config("SOUL.md")
-    user = _read_config("USER.md")
-    tools = _read_config("TOOLS.md")
-    memory = _read_config("MEMORY.md")
+    from src.integrations.linkedin_auth import LinkedInAuth
+
+    workspaces = settings.get_slack_workspaces()
+    slack_enabled = False
+    if workspaces:
+        from src.integrations.slack_auth import SlackAuthManager
+
+        slack_enabled = SlackAuthManager.any_enabled()
+
+    # The two enabled probes come last; _get_static_text passes them on
+    return (
+        CONFIG_DIR,
+        tuple(_config_stamp(f) for f in _STATIC_CONFIG_FILES),
+        tuple(settings.get_google_accounts()),
+        settings.google_default_account,
+        settings.nella_source_repo,
+        tuple(workspaces),
+        settings.slack_default_workspace,
+        bool(settings.notion_api_key),
+        LinkedInAuth.enabled(),
+        slack_enabled,
+    )
+
+
+async def _build_static_text(linkedin_enabled: bool, slack_enabled: bool) -> str:
+    """Assemble the static (cacheable) part of the system prompt."""
+    # Read all config files concurrently, off the event loop
+    soul, user, tools, memory, notion_config = await asyncio.gather(
+        *(asyncio.to_thread(_read_config, f) for f in _STATIC_CONFIG_FILES)
+    )
 
     sections = []
     if soul:
@@ -88,15 +157,9 @@ async def build_system_prompt(
     accounts = settings.get_google_accounts()
     if accounts:
         default = settings.google_default_account or accounts[0]
-        lines = [
-            "# Google Accounts\n",
-            "When using Google tools, specify which account via the `account` parameter. "
-            "If omitted, the default is used.\n",
-        ]
-        for name in accounts:
-            suffix = " (default)" if name == default else ""
-            lines.append(f"- {name}{suffix}")
-        sections.append("\n".join(lines))
+        sections.append(
+            _named_list_block("Google Accounts", _GOOGLE_ACCOUNTS_INTRO, tuple(accounts), default)
+        )
 
     # Inject Nella's source repo so she can reference her own code
     if settings.nella_source_repo:
@@ -108,47 +171,62 @@ async def build_system_prompt(
         )
 
     # Inject LinkedIn availability
-    from src.integrations.linkedin_auth import LinkedInAuth
-
-    if LinkedInAuth.enabled():
-        sections.append(
-            "# LinkedIn\n\n"
-            "LinkedIn is connected. You can create posts with `linkedin_create_post` "
-            "and comment on posts with `linkedin_post_comment` (provide the post URL). "
-            "Both require confirmation before executing."
-        )
+    if linkedin_enabled:
+        sections.append(_LINKEDIN_BLOCK)
 
     # Inject Slack workspace list so Claude knows what workspaces exist
     workspaces = settings.get_slack_workspaces()
-    if workspaces:
-        from src.integrations.slack_auth import SlackAuthManager
-
-        if SlackAuthManager.any_enabled():
-            default_ws = settings.slack_default_workspace or workspaces[0]
-            lines = [
-                "# Slack Workspaces\n",
-                "When using Slack tools, specify which workspace via the `workspace` parameter. "
-                "If omitted, the default is used.\n",
-            ]
-            for name in workspaces:
-                suffix = " (default)" if name == default_ws else ""
-                lines.append(f"- {name}{suffix}")
-            sections.append("\n".join(lines))
+    if workspaces and slack_enabled:
+        default_ws = settings.slack_default_workspace or workspaces[0]
+        sections.append(
+            _named_list_block(
+                "Slack Workspaces", _SLACK_WORKSPACES_INTRO, tuple(workspaces), default_ws
+            )
+        )
 
     # Inject Notion config when API key is set
     if settings.notion_api_key:
-        notion_config = _read_config("NOTION.md")
-        if notion_config:
-            sections.append(notion_config)
-        else:
-            sections.append(
-                "# Notion\n\n"
-                "Notion is connected. You can search, query databases, create/update pages, "
-                "read content, and archive pages. Use notion_list_databases to discover "
-                "available databases."
-            )
+        sections.append(notion_config or _NOTION_FALLBACK_BLOCK)
+
+    return "\n\n---\n\n".join(sections)
+
 
-    static_text = "\n\n---\n\n".join(sections)
+async def _get_static_text() -> str:
+    """Return the static prompt block, rebuilding only when its inputs change."""
+    global _static_cache  # noqa: PLW0603
+    key = _static_key()
+    if _static_cache is None or _static_cache[0] != key:
+        linkedin_enabled, slack_enabled = key[-2:]
+        _static_cache = (key, await _build_static_text(linkedin_enabled, slack_enabled))
+    return _static_cache[1]
+
+
+async def build_system_prompt(
+    user_message: str = "",
+    source_channel: str = "",
+) -> list[dict]:
+    """Assemble the system prompt with optional memory context.
+
+    The static parts (SOUL.md, USER.md, TOOLS.md, MEMORY.md) get ``cache_control``
+    so they're cached across tool-calling rounds. Retrieved memories are
+    appended as a separate block; the memory search runs concurrently with
+    assembling the rest of the prompt.
+
+    Args:
+        user_message: Current user message for memory retrieval. If empty,
+            no memory search is performed.
+
+    Returns:
+        List of content blocks for the Claude ``system`` parameter.
+    """
+    # Start the memory search first; it is independent of everything below
+    memory_task = asyncio.create_task(_retrieve_memories(user_message)) if user_message else None
+    try:
+        static_text = await _get_static_text()
+    except BaseException:
+        if memory_task is not None:
+            memory_task.cancel()
+        raise
 
     # Current time — injected on every call (not cached)
     tz = zoneinfo.ZoneInfo(settings.scheduler_timezone)
@@ -179,10 +257,7 @@ async def build_system_prompt(
             "- Do not suggest Telegram-specific commands (/clear, /status, /model)"
         )
 
-    # Retrieve relevant memories
-    memory_text = ""
-    if user_message:
-        memory_text = await _retrieve_memories(user_message)
+    memory_text = await memory_task if memory_task is not None else ""
 
     blocks: list[dict] = [
         {
@@ -4,18 +4,37 @@ After each user↔Nella exchange, a background task sends the exchange
 to Claude Haiku which decides what (if anything) is worth remembering.
 """
 
-import json
+import asyncio
 import logging
+import re
 from dataclasses import dataclass, field
-from pathlib import Path
+from typing import Any
 
-from src.config import settings
+import orjson
+
+from src.config import CONFIG_DIR, settings
 from src.llm.models import ModelManager
 from src.memory.store import MemoryStore
+from src.memory.text import is_trivial, normalize_query
 
 logger = logging.getLogger(__name__)
 
-CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
+# Extractions beyond settings.memory_extraction_concurrency wait their turn;
+# once this many are already waiting, new ones are dropped instead of piling up.
+_MAX_WAITING_EXTRACTIONS = 8
+
+# Exchanges shorter than this (both sides together) can't hold a memory
+_MIN_EXCHANGE_CHARS = 40
+
+_extraction_sem: asyncio.Semaphore | None = None
+_waiting_extractions = 0
+
+
+def _get_extraction_sem() -> asyncio.Semaphore:
+    global _extraction_sem  # noqa: PLW0603
+    if _extraction_sem is None:
+        _extraction_sem = asyncio.Semaphore(settings.memory_extraction_concurrency)
+    return _extraction_sem
 
 
 # -- Data structures ---------------------------------------------------------
@@ -45,11 +64,33 @@ class ExtractionResult:
 # -- Prompt building ---------------------------------------------------------
 
 
+_DEFAULT_RULES = "Extract important facts, preferences, action items, and decisions as JSON."
+
+# ((mtime_ns, size) of MEMORY_RULES.md, its text) from the last read
+_rules_cache: tuple[tuple[int, int], str] | None = None
+
+
 def _load_rules() -> str:
+    """Return MEMORY_RULES.md, re-reading it only when the file changes."""
+    global _rules_cache  # noqa: PLW0603
     path = CONFIG_DIR / "MEMORY_RULES.md"
-    if path.exists():
-        return path.read_text(encoding="utf-8")
-    return "Extract important facts, preferences, action items, and decisions as JSON."
+    try:
+        st = path.stat()
+    except OSError:
+        return _DEFAULT_RULES
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _rules_cache is None or _rules_cache[0] != stamp:
+        _rules_cache = (stamp, path.read_text(encoding="utf-8"))
+    return _rules_cache[1]
+
+
+def _format_turn(msg: dict[str, str]) -> str:
+    """Render one history message as ``<role>content</role>`` (non-text → "")."""
+    content = msg.get("content", "")
+    if not isinstance(content, str):
+        return ""
+    role = msg.get("role", "unknown")
+    return f"<{role}>{content}</{role}>"
 
 
 def build_extraction_prompt(
@@ -60,13 +101,9 @@ def build_extraction_prompt(
     """Build the user-message content sent to the extraction model."""
     history_text = ""
     if recent_history:
-        lines = []
-        for msg in recent_history:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            if isinstance(content, str):
-                lines.append(f"<{role}>{content}</{role}>")
-        history_text = f"<recent_history>\n{''.join(lines)}\n</recent_history>\n\n"
+        # A list, not a generator: join() would build one from it anyway
+        turns = "".join([_format_turn(msg) for msg in recent_history])
+        history_text = f"<recent_history>\n{turns}\n</recent_history>\n\n"
 
     return (
         f"{history_text}"
@@ -81,26 +118,37 @@ def build_extraction_prompt(
 # -- Parsing -----------------------------------------------------------------
 
 
+# The JSON object inside a markdown fence, with any surrounding prose ignored.
+# The closing fence may be missing when the stream was stopped early.
+_FENCED_JSON_RE = re.compile(r"```[a-zA-Z]*\s*(\{.*\})\s*(?:```|$)", re.DOTALL)
+
+
+def _has_complete_json(text: str) -> bool:
+    """Return True once ``text`` contains a full JSON object.
+
+    Used to close the extraction stream as soon as the object is done,
+    skipping any closing fence or commentary the model adds after it.
+    """
+    if not text.rstrip().endswith("}"):
+        return False
+    start = text.find("{")
+    if start == -1:
+        return False
+    try:
+        orjson.loads(text[start:])
+    except orjson.JSONDecodeError:
+        return False
+    return True
+
+
 def parse_extraction_result(text: str) -> ExtractionResult:
-    """Parse the extraction model's JSON output."""
+    """Parse the extraction model's JSON output (bare or in a markdown fence)."""
+    fenced = _FENCED_JSON_RE.search(text) if "```" in text else None
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        # Try to extract JSON from markdown fences
-        if "```" in text:
-            start = text.find("{")
-            end = text.rfind("}") + 1
-            if start >= 0 and end > start:
-                try:
-                    data = json.loads(text[start:end])
-                except json.JSONDecodeError:
-                    logger.warning("Failed to parse extraction JSON")
-                    return ExtractionResult()
-            else:
-                return ExtractionResult()
-        else:
-            logger.warning("Failed to parse extraction JSON")
-            return ExtractionResult()
+        data = orjson.loads(fenced.group(1) if fenced else text)
+    except orjson.JSONDecodeError:
+        logger.warning("Failed to parse extraction JSON")
+        return ExtractionResult()
 
     memories = [
         ExtractedMemory(
@@ -136,8 +184,11 @@ async def extract_and_save(
 ) -> None:
     """Background task: extract memories from an exchange and save them.
 
-    Call via ``asyncio.create_task(extract_and_save(...))``.
+    Call via ``asyncio.create_task(extract_and_save(...))``. At most
+    ``memory_extraction_concurrency`` run at once; under a burst, exchanges
+    past the waiting limit are skipped rather than queued.
     """
+    global _waiting_extractions  # noqa: PLW0603
     if not settings.memory_extraction_enabled:
         return
 
@@ -145,37 +196,55 @@ async def extract_and_save(
     if not store.enabled:
         return
 
+    # "ok" / "thanks!" / "👍" answered in kind: nothing worth an LLM call. The
+    # whole exchange is checked, since a bare "yes" can confirm a real decision.
+    if len(user_message) + len(assistant_response) < _MIN_EXCHANGE_CHARS:
+        return
+    if is_trivial(normalize_query(f"{user_message} {assistant_response}")):
+        return
+
+    sem = _get_extraction_sem()
+    if sem.locked() and _waiting_extractions >= _MAX_WAITING_EXTRACTIONS:
+        logger.warning("Memory extraction backlog full — skipping this exchange")
+        return
+
+    _waiting_extractions += 1
+    try:
+        await sem.acquire()
+    finally:
+        _waiting_extractions -= 1
+
     try:
-        from src.llm.client import complete_text
+        from src.llm.client import complete_text_stream
 
         rules = _load_rules()
         prompt = build_extraction_prompt(user_message, assistant_response, recent_history)
 
-        response_text = await complete_text(
+        response_text = await complete_text_stream(
             [{"role": "user", "content": prompt}],
             system=rules,
             model=ModelManager.get().get_memory_model(),
             max_tokens=1024,
+            stop_when=_has_complete_json,
         )
 
         result = parse_extraction_result(response_text)
 
-        # Save medium and high importance memories
-        saved = 0
-        for mem in result.memories:
-            if mem.importance in ("medium", "high"):
-                await store.add(
-                    content=mem.content,
-                    source="automatic",
-                    category=mem.category,
-                    metadata={
-                        "importance": mem.importance,
-                        "conversation_id": conversation_id,
-                    },
-                )
-                saved += 1
-
-        # Save workstream snapshot on topic switch
+        # Medium and high importance memories
+        pending: list[dict[str, Any]] = [
+            {
+                "content": mem.content,
+                "category": mem.category,
+                "metadata": {
+                    "importance": mem.importance,
+                    "conversation_id": conversation_id,
+                },
+            }
+            for mem in result.memories
+            if mem.importance in ("medium", "high")
+        ]
+
+        # Workstream snapshot on topic switch
         if result.topic_switch:
             ts = result.topic_switch
             snapshot = (
@@ -184,16 +253,20 @@ async def extract_and_save(
                 f"Open: {ts.open_items}\n"
                 f"Next: {ts.next_steps}"
             )
-            await store.add(
-                content=snapshot,
-                source="automatic",
-                category="workstream",
-                metadata={"conversation_id": conversation_id},
+            pending.append(
+                {
+                    "content": snapshot,
+                    "category": "workstream",
+                    "metadata": {"conversation_id": conversation_id},
+                }
             )
-            saved += 1
 
-        if saved:
-            logger.info("Extracted %d memories from exchange", saved)
+        if pending:
+            results = await store.add_many(pending, source="automatic")
+            saved = sum(r is not None for r in results)
+            logger.info("Extracted %d memories from exchange (%d saved)", len(pending), saved)
 
     except Exception:
         logger.exception("Memory extraction failed (non-fatal)")
+    finally:
+        sem.release()
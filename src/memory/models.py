@@ -1,17 +1,14 @@
-"""Data models for memory and conversation storage."""
+"""Data models for the memory store.
 
-from pydantic import BaseModel
+Plain slotted dataclasses: these are built in bulk from already-typed data
+(Mem0 results), so they skip validation.
+"""
 
+from dataclasses import dataclass
 
-class Message(BaseModel):
-    """A single conversation message."""
 
-    role: str
-    content: str
-    created_at: str
-
-
-class MemoryEntry(BaseModel):
+@dataclass(slots=True)
+class MemoryEntry:
     """A memory retrieved from the store."""
 
     id: str
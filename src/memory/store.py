@@ -7,15 +7,50 @@ Supports two modes controlled by environment variables:
   long-term memory.
 """
 
+import asyncio
 import logging
+import string
+import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
 from typing import Any
 
+import httpx
+
 from src.config import settings
 from src.memory.models import MemoryEntry
 
 logger = logging.getLogger(__name__)
 
+# Mem0 rewrites base_url/headers on the client it's given, so it gets its own
+# rather than sharing Anthropic's. httpx's default 5s keep-alive would drop the
+# connection between most chat turns; keep it warm for a minute instead.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=16,
+    max_keepalive_connections=8,
+    keepalive_expiry=60,
+)
+_HTTP_TIMEOUT = 60.0
+
+# Cap on Mem0 add requests in flight at once (batches fan out concurrently)
+_MAX_CONCURRENT_ADDS = 8
+
+# Recent search results, keyed by (_search_key(query), limit). Cleared on any
+# write, so the TTL only bounds staleness from edits made outside the bot.
+_SEARCH_CACHE_TTL = 300.0
+_SEARCH_CACHE_SIZE = 1000
+
+
+def _search_key(query: str) -> str:
+    """Cache key for a search: the query with case, spacing and punctuation normalized.
+
+    Word order and every word are kept, since either can change what a
+    semantic search matches ("who owes Alice" vs "Alice owes who").
+    """
+    words = (w.strip(string.punctuation) for w in query.lower().split())
+    return " ".join(w for w in words if w)
+
 
 class MemoryStore:
     """Singleton memory store.
@@ -24,11 +59,18 @@ class MemoryStore:
     """
 
     _instance: "MemoryStore | None" = None
+    _get_lock = threading.Lock()
 
     def __init__(self) -> None:
         self._client: Any = None
         self._enabled = False
         self._user_id = "owner"
+        self._add_sem = asyncio.Semaphore(_MAX_CONCURRENT_ADDS)
+        self._search_cache: OrderedDict[tuple[str, int], tuple[float, list[MemoryEntry]]] = (
+            OrderedDict()
+        )
+        # Bumped on every write; a search only caches if no write landed meanwhile
+        self._cache_generation = 0
         self._init_backend()
 
     def _init_backend(self) -> None:
@@ -36,7 +78,12 @@ class MemoryStore:
             try:
                 from mem0 import AsyncMemoryClient
 
-                self._client = AsyncMemoryClient(api_key=settings.mem0_api_key)
+                self._client = AsyncMemoryClient(
+                    api_key=settings.mem0_api_key,
+                    client=httpx.AsyncClient(
+                        limits=_HTTP_LIMITS, http2=True, timeout=_HTTP_TIMEOUT
+                    ),
+                )
                 self._enabled = True
                 logger.info("Memory store: hosted mode (Mem0 cloud)")
             except Exception:
@@ -51,9 +98,20 @@ class MemoryStore:
     def get(cls) -> "MemoryStore":
         """Return the shared MemoryStore instance."""
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._get_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
+    @classmethod
+    async def warm(cls) -> None:
+        """Create the shared instance off the event loop.
+
+        Mem0's client validates its API key with a blocking HTTP request when
+        constructed; doing that at startup keeps it off the first message.
+        """
+        await asyncio.to_thread(cls.get)
+
     @classmethod
     def _reset(cls) -> None:
         """Reset the singleton (for testing)."""
@@ -63,6 +121,17 @@ class MemoryStore:
     def enabled(self) -> bool:
         return self._enabled
 
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared instance's Mem0 HTTP connections, if it was created."""
+        store = cls._instance
+        if store is None or store._client is None:
+            return
+        try:
+            await store._client.async_client.aclose()
+        except Exception:
+            logger.exception("Failed to close Mem0 client")
+
     # -- Write ---------------------------------------------------------------
 
     async def add(
@@ -95,18 +164,35 @@ class MemoryStore:
         }
 
         try:
-            result = await self._client.add(
-                content,
-                user_id=self._user_id,
-                metadata=full_metadata,
-            )
+            async with self._add_sem:
+                result = await self._client.add(
+                    content,
+                    user_id=self._user_id,
+                    metadata=full_metadata,
+                )
             logger.debug("Stored memory [%s/%s]: %s", source, category, content[:80])
+            self._invalidate_search_cache()
             return result
         except Exception as exc:
             body = getattr(getattr(exc, "response", None), "text", "")
             logger.exception("Failed to store memory: %s", body)
             return None
 
+    async def add_many(self, items: list[dict[str, Any]], source: str) -> list[dict | None]:
+        """Store several memories at once.
+
+        Each item holds ``content``, ``category`` and optionally ``metadata``,
+        as for :meth:`add`. Mem0 has no batch insert, so the requests are
+        issued together (at most ``_MAX_CONCURRENT_ADDS`` in flight) and
+        awaited once; failures are logged per item.
+
+        Returns:
+            One result per item, in order (None where disabled or failed).
+        """
+        if not self._enabled or not items:
+            return [None] * len(items)
+        return list(await asyncio.gather(*(self.add(source=source, **item) for item in items)))
+
     # -- Read ----------------------------------------------------------------
 
     async def search(
@@ -121,22 +207,38 @@ class MemoryStore:
             limit: Max results to return.
 
         Returns:
-            List of MemoryEntry sorted by relevance.
+            List of MemoryEntry sorted by relevance. Results are cached
+            briefly per normalized query; failures are not cached.
         """
         if not self._enabled:
             return []
 
+        key = (_search_key(query), limit)
+        generation = self._cache_generation
+        now = time.monotonic()
+        cached = self._search_cache.get(key)
+        if cached is not None and now - cached[0] < _SEARCH_CACHE_TTL:
+            self._search_cache.move_to_end(key)
+            return list(cached[1])
+
         try:
             raw = await self._client.search(
                 query,
                 filters={"user_id": self._user_id},
             )
-            return self._normalize(raw)
+            entries = self._normalize(raw)
         except Exception as exc:
             body = getattr(getattr(exc, "response", None), "text", "")
             logger.exception("Memory search failed: %s", body)
             return []
 
+        if generation == self._cache_generation:
+            self._search_cache[key] = (now, entries)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return list(entries)
+
     async def get_all(self) -> list[MemoryEntry]:
         """Retrieve all memories (for debugging/admin)."""
         if not self._enabled:
@@ -163,6 +265,7 @@ class MemoryStore:
         try:
             await self._client.delete(memory_id)
             logger.info("Deleted memory: %s", memory_id)
+            self._invalidate_search_cache()
             return True
         except Exception:
             logger.exception("Failed to delete memory %s", memory_id)
@@ -170,6 +273,11 @@ class MemoryStore:
 
     # -- Helpers -------------------------------------------------------------
 
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached searches, including any still in flight."""
+        self._cache_generation += 1
+        self._search_cache.clear()
+
     @staticmethod
     def _normalize(raw: Any) -> list[MemoryEntry]:
         """Normalize Mem0 results (hosted or local) into MemoryEntry list."""
@@ -0,0 +1,23 @@
+"""Text checks shared by memory search and memory extraction."""
+
+import string
+
+# Messages made up only of these words ("ok", "thanks!", "got it") carry
+# nothing to search memory for, or to remember.
+_TRIVIAL_WORDS = frozenset(
+    {"ok", "okay", "k", "kk", "yes", "yep", "yeah", "no", "nope", "sure", "cool"}
+    | {"thanks", "thank", "you", "thx", "ty", "nice", "great", "lol", "got", "it"}
+)
+_MIN_QUERY_CHARS = 4
+
+
+def normalize_query(text: str) -> str:
+    """Lowercase *text*, collapse whitespace and trim surrounding punctuation."""
+    return " ".join(text.lower().split()).strip(string.punctuation + " ")
+
+
+def is_trivial(normalized: str) -> bool:
+    """True for text too short or generic to be worth a memory lookup or extraction."""
+    if len(normalized) < _MIN_QUERY_CHARS:
+        return True
+    return all(w.strip(string.punctuation) in _TRIVIAL_WORDS for w in normalized.split())
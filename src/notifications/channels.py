@@ -5,7 +5,12 @@ from typing import Protocol, runtime_checkable
 
 @runtime_checkable
 class NotificationChannel(Protocol):
-    """Protocol that all notification channels must satisfy."""
+    """Protocol that all notification channels must satisfy.
+
+    Channels may also provide ``send_photos(user_id, photos, *, caption=None)``
+    to deliver several photos in one request; ``NotificationRouter.send_photos``
+    falls back to one ``send_photo`` call per photo for channels without it.
+    """
 
     @property
     def name(self) -> str:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -22,6 +23,9 @@ class NotificationRouter:
     def __init__(self) -> None:
         self._channels: dict[str, NotificationChannel] = {}
         self._default: str = ""
+        # Channel used when send() gets no explicit name; kept in sync by
+        # register_channel/set_default_channel so the hot path is one lookup
+        self._resolved_default: NotificationChannel | None = None
 
     @classmethod
     def get(cls) -> NotificationRouter:
@@ -41,6 +45,9 @@ class NotificationRouter:
             msg = f"Channel '{channel.name}' is already registered"
             raise ValueError(msg)
         self._channels[channel.name] = channel
+        if not self._default:
+            # With no explicit default, a lone channel is the implicit one
+            self._resolved_default = channel if len(self._channels) == 1 else None
 
     def set_default_channel(self, name: str) -> None:
         """Set the default channel by name. Raises KeyError if not registered."""
@@ -48,6 +55,7 @@ class NotificationRouter:
             msg = f"Channel '{name}' is not registered"
             raise KeyError(msg)
         self._default = name
+        self._resolved_default = self._channels[name]
 
     def get_channel(self, name: str) -> NotificationChannel | None:
         """Look up a channel by name."""
@@ -64,13 +72,7 @@ class NotificationRouter:
 
     def _resolve_channel(self, name: str | None) -> NotificationChannel | None:
         """Resolve a channel: explicit name → default → only registered channel."""
-        if name:
-            return self._channels.get(name)
-        if self._default:
-            return self._channels.get(self._default)
-        if len(self._channels) == 1:
-            return next(iter(self._channels.values()))
-        return None
+        return self._channels.get(name) if name else self._resolved_default
 
     async def send(
         self,
@@ -86,6 +88,32 @@ class NotificationRouter:
             return False
         return await ch.send(user_id, message)
 
+    async def send_many(
+        self,
+        user_ids: list[str],
+        message: str,
+        *,
+        channel: str | None = None,
+        concurrency: int = 20,
+    ) -> list[bool]:
+        """Send the same plain text message to several users concurrently.
+
+        At most *concurrency* sends are in flight at once. Returns one
+        result per user, in the order of *user_ids*.
+        """
+        ch = self._resolve_channel(channel)
+        if ch is None:
+            logger.warning("No channel resolved for send_many (requested=%s)", channel)
+            return [False] * len(user_ids)
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(user_id: str) -> bool:
+            async with sem:
+                return await ch.send(user_id, message)
+
+        return list(await asyncio.gather(*(_one(u) for u in user_ids)))
+
     async def send_rich(
         self,
         user_id: str,
@@ -118,3 +146,30 @@ class NotificationRouter:
             logger.warning("No channel resolved for send_photo (requested=%s)", channel)
             return False
         return await ch.send_photo(user_id, photo, caption=caption)
+
+    async def send_photos(
+        self,
+        user_id: str,
+        photos: list[bytes],
+        *,
+        channel: str | None = None,
+        caption: str | None = None,
+    ) -> bool:
+        """Send several photos via the resolved channel.
+
+        Uses the channel's batched ``send_photos`` when it has one, otherwise
+        sends the photos one by one with the caption on the first.
+        """
+        ch = self._resolve_channel(channel)
+        if ch is None:
+            logger.warning("No channel resolved for send_photos (requested=%s)", channel)
+            return False
+        if not photos:
+            return True
+        send_batch = getattr(ch, "send_photos", None)
+        if send_batch is not None:
+            return await send_batch(user_id, photos, caption=caption)
+        ok = True
+        for i, photo in enumerate(photos):
+            ok = await ch.send_photo(user_id, photo, caption=caption if i == 0 else None) and ok
+        return ok
@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 import telegram
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, InputMediaPhoto
 
 from src.notifications.chunking import split_message
 
 logger = logging.getLogger(__name__)
 
+# Telegram accepts 2-10 items per media group
+MEDIA_GROUP_LIMIT = 10
+
+# One button as (text, callback_data, url)
+_ButtonKey = tuple[str, str | None, str | None]
+
+
+@lru_cache(maxsize=256)
+def _build_markup(rows: tuple[tuple[_ButtonKey, ...], ...]) -> InlineKeyboardMarkup:
+    """Build an inline keyboard; repeated layouts reuse the same (immutable) markup."""
+    return InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton(text=text, callback_data=data, url=url) for text, data, url in r]
+            for r in rows
+        ]
+    )
+
 
 class TelegramChannel:
     """Sends notifications via the Telegram Bot API."""
@@ -55,17 +73,11 @@ class TelegramChannel:
         try:
             markup = None
             if buttons:
-                markup = InlineKeyboardMarkup([
-                    [
-                        InlineKeyboardButton(
-                            text=btn["text"],
-                            callback_data=btn.get("callback_data"),
-                            url=btn.get("url"),
-                        )
-                        for btn in row
-                    ]
+                rows = tuple(
+                    tuple((b["text"], b.get("callback_data"), b.get("url")) for b in row)
                     for row in buttons
-                ])
+                )
+                markup = _build_markup(rows)
 
             chunks = split_message(message)
             mode = parse_mode or "Markdown"
@@ -106,3 +118,33 @@ class TelegramChannel:
         except Exception:
             logger.exception("TelegramChannel.send_photo failed for user_id=%s", user_id)
             return False
+
+    async def send_photos(
+        self,
+        user_id: str,
+        photos: list[bytes],
+        *,
+        caption: str | None = None,
+    ) -> bool:
+        """Send several photos as album(s), one request per 10 photos.
+
+        The caption is attached to the first photo, which Telegram shows
+        as the album caption.
+        """
+        if len(photos) == 1:
+            return await self.send_photo(user_id, photos[0], caption=caption)
+        try:
+            for start in range(0, len(photos), MEDIA_GROUP_LIMIT):
+                batch = photos[start : start + MEDIA_GROUP_LIMIT]
+                if len(batch) == 1:
+                    await self._bot.send_photo(chat_id=int(user_id), photo=batch[0])
+                    continue
+                media = [
+                    InputMediaPhoto(photo, caption=caption if start + i == 0 else None)
+                    for i, photo in enumerate(batch)
+                ]
+                await self._bot.send_media_group(chat_id=int(user_id), media=media)
+            return True
+        except Exception:
+            logger.exception("TelegramChannel.send_photos failed for user_id=%s", user_id)
+            return False
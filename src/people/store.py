@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import re
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from src.db import get_connection
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from pathlib import Path
 
+    from src.db import _AsyncConnection
+
 logger = logging.getLogger(__name__)
 
 _CREATE_TABLE = """
@@ -23,6 +29,85 @@ CREATE TABLE IF NOT EXISTS people_notes (
 )
 """
 
+# Serves the most-recent listing (ORDER BY updated_at DESC LIMIT 20)
+_CREATE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_people_notes_updated ON people_notes(updated_at DESC)
+"""
+
+# Full-text index over people_notes (external content: the index stores only
+# tokens). Triggers keep it in step with the base table.
+_CREATE_FTS = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS people_notes_fts USING fts5(
+        display_name, notes, content='people_notes', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS people_notes_ai AFTER INSERT ON people_notes BEGIN
+        INSERT INTO people_notes_fts(rowid, display_name, notes)
+        VALUES (new.rowid, new.display_name, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS people_notes_ad AFTER DELETE ON people_notes BEGIN
+        INSERT INTO people_notes_fts(people_notes_fts, rowid, display_name, notes)
+        VALUES ('delete', old.rowid, old.display_name, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS people_notes_au AFTER UPDATE ON people_notes BEGIN
+        INSERT INTO people_notes_fts(people_notes_fts, rowid, display_name, notes)
+        VALUES ('delete', old.rowid, old.display_name, old.notes);
+        INSERT INTO people_notes_fts(rowid, display_name, notes)
+        VALUES (new.rowid, new.display_name, new.notes);
+    END
+    """,
+)
+
+_FTS_EXISTS = "SELECT 1 FROM sqlite_master WHERE name = 'people_notes_fts'"
+_FTS_REBUILD = "INSERT INTO people_notes_fts(people_notes_fts) VALUES ('rebuild')"
+
+_COLUMNS = "p.google_resource_id, p.display_name, p.notes, p.created_at, p.updated_at"
+
+_SEARCH = f"""
+SELECT {_COLUMNS} FROM people_notes_fts f
+JOIN people_notes p ON p.rowid = f.rowid
+WHERE people_notes_fts MATCH ?
+ORDER BY bm25(people_notes_fts)
+LIMIT 20
+"""
+
+_RECENT = f"SELECT {_COLUMNS} FROM people_notes p ORDER BY p.updated_at DESC LIMIT 20"
+
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM people_notes p WHERE p.google_resource_id = ?"
+
+_DELETE = "DELETE FROM people_notes WHERE google_resource_id = ?"
+
+_FIELDS = ("google_resource_id", "display_name", "notes", "created_at", "updated_at")
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query: every word, as a quoted prefix.
+
+    Quoting keeps FTS5 operators and punctuation in user input from being
+    parsed as query syntax; the ``*`` keeps prefix matches ("Ali" → Alice).
+    """
+    return " ".join(f'"{word}"*' for word in _WORD_RE.findall(query))
+
+
+_UPSERT = """
+INSERT INTO people_notes
+    (google_resource_id, display_name, notes, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(google_resource_id) DO UPDATE SET
+    display_name = excluded.display_name,
+    notes = excluded.notes,
+    updated_at = excluded.updated_at
+RETURNING created_at, updated_at
+"""
+
 
 class PeopleStore:
     """Persists per-person notes in SQLite / Turso.
@@ -36,6 +121,9 @@ class PeopleStore:
     def __init__(self, db_path: Path | None = None) -> None:
         self._db_path = db_path
         self._initialised = False
+        # Long-lived connection to *db_path*, opened on first use
+        self._conn: _AsyncConnection | None = None
+        self._conn_lock = asyncio.Lock()
 
     @classmethod
     def get(cls) -> PeopleStore:
@@ -51,13 +139,70 @@ class PeopleStore:
 
     # -- Internal helpers ------------------------------------------------------
 
-    async def _connect(self):  # noqa: ANN201
-        db = await get_connection(local_path_override=self._db_path)
+    async def _ensure_table(self, db: _AsyncConnection) -> None:
         if not self._initialised:
             await db.execute(_CREATE_TABLE)
+            await db.execute(_CREATE_INDEX)
+            cursor = await db.execute(_FTS_EXISTS)
+            fts_exists = await cursor.fetchone() is not None
+            for stmt in _CREATE_FTS:
+                await db.execute(stmt)
+            if not fts_exists:
+                # Index rows written before the FTS table existed
+                await db.execute(_FTS_REBUILD)
             await db.commit()
             self._initialised = True
-        return db
+
+    @contextlib.asynccontextmanager
+    async def _connect(self, *, read_only: bool = False) -> AsyncIterator[_AsyncConnection]:
+        """Yield a connection with the table in place.
+
+        Same scheme as ``TaskStore``: an explicit *db_path* gets one
+        connection kept open until ``close()`` and used by one caller at a
+        time; the configured database is
+        borrowed from the shared pool (or, for *read_only*, the reader pool)
+        per call.
+        """
+        if self._db_path is None:
+            if not self._initialised:
+                db = await get_connection()
+                try:
+                    await self._ensure_table(db)
+                finally:
+                    await db.close()
+            db = await get_connection(read_only=read_only)
+            try:
+                yield db
+            finally:
+                await db.close()
+            return
+
+        # One coroutine at a time: a shared connection has one transaction,
+        # so another caller's commit or rollback would land on this one's work
+        async with self._conn_lock:
+            if self._conn is None:
+                db = await get_connection(local_path_override=self._db_path)
+                self._initialised = False
+                try:
+                    await self._ensure_table(db)
+                except BaseException:
+                    await db.close()
+                    raise
+                self._conn = db
+            db = self._conn
+            try:
+                yield db
+            except BaseException:
+                # Don't leave a half-done write for the next commit to pick up
+                await db.rollback()
+                raise
+
+    async def close(self) -> None:
+        """Close the store's own connection, if it has one (called on shutdown)."""
+        async with self._conn_lock:
+            if self._conn is not None:
+                conn, self._conn = self._conn, None
+                await conn.close()
 
     # -- CRUD ------------------------------------------------------------------
 
@@ -66,93 +211,45 @@ class PeopleStore:
     ) -> dict:
         """Insert or update a people_notes record. Returns the row as a dict."""
         now = datetime.now(UTC).isoformat()
-        db = await self._connect()
-        try:
-            # Check if record exists to preserve created_at
-            cursor = await db.execute(
-                "SELECT created_at FROM people_notes WHERE google_resource_id = ?",
-                (google_resource_id,),
-            )
-            existing = await cursor.fetchone()
-            created_at = existing[0] if existing else now
-
-            await db.execute(
-                """
-                INSERT OR REPLACE INTO people_notes
-                    (google_resource_id, display_name, notes, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (google_resource_id, display_name, notes, created_at, now),
-            )
+        async with self._connect() as db:
+            # created_at is only set on first insert; RETURNING hands back the
+            # preserved value, so no separate lookup is needed. Drain the
+            # cursor (fetchall) so the statement is finished before commit.
+            cursor = await db.execute(_UPSERT, (google_resource_id, display_name, notes, now, now))
+            [(created_at, updated_at)] = await cursor.fetchall()
             await db.commit()
             return {
                 "google_resource_id": google_resource_id,
                 "display_name": display_name,
                 "notes": notes,
                 "created_at": created_at,
-                "updated_at": now,
+                "updated_at": updated_at,
             }
-        finally:
-            await db.close()
 
     async def get_by_id(self, google_resource_id: str) -> dict | None:
         """Fetch one row by resource ID, or None if not found."""
-        db = await self._connect()
-        try:
-            cursor = await db.execute(
-                "SELECT * FROM people_notes WHERE google_resource_id = ?",
-                (google_resource_id,),
-            )
+        async with self._connect(read_only=True) as db:
+            cursor = await db.execute(_SELECT_BY_ID, (google_resource_id,))
             row = await cursor.fetchone()
-            if not row:
-                return None
-            return {
-                "google_resource_id": row[0],
-                "display_name": row[1],
-                "notes": row[2],
-                "created_at": row[3],
-                "updated_at": row[4],
-            }
-        finally:
-            await db.close()
+            return dict(zip(_FIELDS, row, strict=True)) if row else None
 
     async def search(self, query: str) -> list[dict]:
-        """Search by display_name or notes content (case-insensitive LIKE)."""
-        db = await self._connect()
-        try:
-            pattern = f"%{query}%"
-            cursor = await db.execute(
-                """
-                SELECT * FROM people_notes
-                WHERE display_name LIKE ? OR notes LIKE ?
-                ORDER BY updated_at DESC
-                LIMIT 20
-                """,
-                (pattern, pattern),
-            )
+        """Search display_name and notes by word prefix, best matches first.
+
+        A query with no words in it returns the most recently updated records.
+        """
+        match = _fts_query(query)
+        async with self._connect(read_only=True) as db:
+            if match:
+                cursor = await db.execute(_SEARCH, (match,))
+            else:
+                cursor = await db.execute(_RECENT)
             rows = await cursor.fetchall()
-            return [
-                {
-                    "google_resource_id": row[0],
-                    "display_name": row[1],
-                    "notes": row[2],
-                    "created_at": row[3],
-                    "updated_at": row[4],
-                }
-                for row in rows
-            ]
-        finally:
-            await db.close()
+            return [dict(zip(_FIELDS, row, strict=True)) for row in rows]
 
     async def delete(self, google_resource_id: str) -> bool:
         """Delete a record. Returns True if a row was removed."""
-        db = await self._connect()
-        try:
-            cursor = await db.execute(
-                "DELETE FROM people_notes WHERE google_resource_id = ?",
-                (google_resource_id,),
-            )
+        async with self._connect() as db:
+            cursor = await db.execute(_DELETE, (google_resource_id,))
             await db.commit()
             return cursor.rowcount > 0
-        finally:
-            await db.close()
@@ -78,6 +78,7 @@ class SchedulerEngine:
             EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES,
         )
 
+        self._store.start_write_behind()
         self._scheduler.start()
         self._running = True
         logger.info(
@@ -87,11 +88,13 @@ class SchedulerEngine:
         )
 
     async def stop(self) -> None:
-        """Shut down the scheduler."""
+        """Shut down the scheduler, flush pending writes, and release the store."""
         if self._running:
             self._scheduler.shutdown(wait=False)
             self._running = False
             logger.info("Scheduler stopped")
+        await self._store.stop_write_behind()
+        await self._store.close()
 
     # -- Task management -------------------------------------------------------
 
@@ -110,9 +113,8 @@ class SchedulerEngine:
             self._scheduler.remove_job(task_id)
         except Exception:
             logger.debug("Job %s not found in scheduler (may already be removed)", task_id)
-        deactivated = await self._store.deactivate_task(task_id)
+        deactivated = await self._store.deactivate_and_clear_next(task_id)
         if deactivated:
-            await self._store.update_next_run(task_id, None)
             logger.info("Cancelled task: %s", task_id)
         return deactivated
 
@@ -120,12 +122,21 @@ class SchedulerEngine:
         """Remove all jobs and re-load from the store."""
         self._scheduler.remove_all_jobs()
         tasks = await self._store.list_active_tasks()
+        next_runs: list[tuple[str | None, str]] = []
         for task in tasks:
             job = self._add_job(task)
             if job and job.next_run_time:
-                await self._store.update_next_run(task.id, job.next_run_time.isoformat())
+                next_runs.append((job.next_run_time.isoformat(), task.id))
+        # One transaction for all of them rather than a commit per task
+        await self._store.update_next_runs(next_runs)
         logger.info("Reloaded %d task(s)", len(tasks))
 
+    def next_run_time(self, task_id: str) -> str | None:
+        """Return the live job's next run time (ISO 8601), or None if not scheduled."""
+        job = self._scheduler.get_job(task_id)
+        next_run = getattr(job, "next_run_time", None) if job else None
+        return next_run.isoformat() if next_run else None
+
     # -- Event listeners -------------------------------------------------------
 
     def _on_job_event(self, event: JobEvent | JobExecutionEvent) -> None:
@@ -177,7 +188,7 @@ class SchedulerEngine:
         logger.info("Scheduler firing task_id=%s", task_id)
 
         try:
-            await self._executor.execute(task_id)
+            task = await self._executor.execute(task_id)
         except Exception:
             elapsed = time.monotonic() - t0
             logger.exception(
@@ -188,22 +199,20 @@ class SchedulerEngine:
         elapsed = time.monotonic() - t0
         logger.info("Scheduler task_id=%s completed in %.1fs", task_id, elapsed)
 
-        # Post-execution bookkeeping
-        task = await self._store.get_task(task_id)
+        # Post-execution bookkeeping, using the row the executor already read
         if task is None:
             return
 
         if task.is_one_off:
-            await self._store.deactivate_task(task_id)
-            await self._store.update_next_run(task_id, None)
+            # A successful run already completed it; this catches failed runs
+            await self._store.deactivate_and_clear_next(task_id)
             logger.info("Deactivated one-off task: %s (%s)", task.name, task_id)
         else:
-            job = self._scheduler.get_job(task_id)
-            if job and job.next_run_time:
-                await self._store.update_next_run(task_id, job.next_run_time.isoformat())
-                logger.info(
-                    "Next run for '%s': %s", task.name, job.next_run_time
-                )
+            # next_run_at isn't persisted per firing (that would be a commit per
+            # tick); readers ask next_run_time() for the live value instead
+            next_run = self.next_run_time(task_id)
+            if next_run:
+                logger.info("Next run for '%s': %s", task.name, next_run)
 
     def _build_trigger(self, task: ScheduledTask):
         """Convert a task's schedule dict into an APScheduler trigger."""
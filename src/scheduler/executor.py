@@ -42,15 +42,19 @@ class TaskExecutor:
         self._store = store
         self._owner_user_id = owner_user_id
 
-    async def execute(self, task_id: str) -> None:
-        """Look up and execute a scheduled task by ID."""
+    async def execute(self, task_id: str) -> ScheduledTask | None:
+        """Look up and execute a scheduled task by ID.
+
+        Returns the task as it was looked up (even if it was skipped as
+        inactive), or None if it doesn't exist.
+        """
         task = await self._store.get_task(task_id)
         if task is None:
             logger.warning("Scheduled task not found: %s", task_id)
-            return
+            return None
         if not task.active:
             logger.info("Skipping inactive task: %s (%s)", task.name, task_id)
-            return
+            return task
 
         logger.info(
             "Executing task: '%s' (%s) action=%s channel=%s",
@@ -61,11 +65,16 @@ class TaskExecutor:
         )
         try:
             await self._dispatch(task)
-            await self._store.update_last_run(task_id)
+            if task.is_one_off:
+                # Committed right away, so a crash can't make it look missed
+                await self._store.complete_one_off(task_id)
+            else:
+                await self._store.update_last_run(task_id)
             logger.info("Task executed successfully: '%s' (%s)", task.name, task_id)
         except Exception:
             logger.exception("Task execution failed: '%s' (%s)", task.name, task_id)
             await self._send_error(task, task_id)
+        return task
 
     async def _dispatch(self, task: ScheduledTask) -> None:
         """Route to the correct handler based on action type."""
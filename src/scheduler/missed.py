@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-import uuid
-from datetime import datetime
+import secrets
+from collections import OrderedDict
+from datetime import datetime, timedelta
 
 from src.config import settings
 from src.notifications.router import NotificationRouter
@@ -28,7 +29,15 @@ logger = logging.getLogger(__name__)
 _engine: SchedulerEngine | None = None
 _executor: TaskExecutor | None = None
 _owner_user_id: str = ""
-_pending_missed: dict[str, str] = {}  # 8-char key -> full task_id
+# 8-char key -> full task_id. Entries for notifications the owner never
+# answers would otherwise pile up; past the cap the oldest is dropped and its
+# buttons report "expired".
+_pending_missed: OrderedDict[str, str] = OrderedDict()
+_MAX_PENDING_MISSED = 256
+
+# UTC offsets span -12:00..+14:00, so two stored run_at strings for the same
+# instant can differ by up to 26 hours of wall-clock text
+_RUN_AT_SLACK = timedelta(days=2)
 
 
 def init_missed_task_recovery(
@@ -45,7 +54,7 @@ def init_missed_task_recovery(
 
 def _generate_key() -> str:
     """Return an 8-character hex string for callback data."""
-    return uuid.uuid4().hex[:8]
+    return secrets.token_hex(4)
 
 
 async def check_and_notify_missed_tasks() -> int:
@@ -57,17 +66,17 @@ async def check_and_notify_missed_tasks() -> int:
         logger.warning("Missed task recovery not initialised")
         return 0
 
-    tasks = await _engine._store.list_active_tasks()
     tz = zoneinfo.ZoneInfo(settings.scheduler_timezone)
     now = datetime.now(tz)
     missed_count = 0
 
-    for task in tasks:
-        if not task.is_one_off:
-            continue
-        if task.last_run_at is not None:
-            continue
+    # Only never-run one-offs that are due can be missed; the store filters on
+    # the run_at text, so give it a bound wide enough to cover any UTC offset
+    # the stored value may carry. The exact check happens below.
+    bound = (now + _RUN_AT_SLACK).replace(tzinfo=None).isoformat()
+    tasks = await _engine._store.list_missed_one_offs(bound)
 
+    for task in tasks:
         run_at_str = task.schedule.get("run_at")
         if not run_at_str:
             continue
@@ -83,6 +92,8 @@ async def check_and_notify_missed_tasks() -> int:
         # This task was missed
         key = _generate_key()
         _pending_missed[key] = task.id
+        if len(_pending_missed) > _MAX_PENDING_MISSED:
+            _pending_missed.popitem(last=False)
 
         formatted_time = run_at.strftime("%Y-%m-%d %H:%M %Z")
         message = (
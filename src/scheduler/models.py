@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-import json
-import uuid
+import secrets
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
+
 
 @dataclass
 class ScheduledTask:
     """A task to be executed on a schedule.
 
     Attributes:
-        id: Unique identifier (UUID hex).
+        id: Unique identifier (32 hex chars).
         name: Human-readable name.
         task_type: Either ``"one_off"`` or ``"recurring"``.
         schedule: Timing config — ``{"run_at": "ISO"}`` for one-off,
@@ -27,7 +28,11 @@ class ScheduledTask:
         active: Whether the task is scheduled.
         created_at: ISO 8601 timestamp.
         last_run_at: ISO 8601 timestamp of the last execution.
-        next_run_at: ISO 8601 timestamp of the next planned execution.
+        next_run_at: ISO 8601 timestamp of the next planned execution, as of
+            the last schedule or reload. Recurring tasks don't persist it after
+            each firing, so it can be stale; for the live value ask
+            ``SchedulerEngine.next_run_time()`` (or use
+            ``scheduler_tools.next_run_at()``, which falls back to this field).
     """
 
     id: str
@@ -70,8 +75,8 @@ class ScheduledTask:
             self.id,
             self.name,
             self.task_type,
-            json.dumps(self.schedule),
-            json.dumps(self.action),
+            orjson.dumps(self.schedule).decode(),
+            orjson.dumps(self.action).decode(),
             self.description,
             self.notification_channel,
             self.model,
@@ -83,39 +88,41 @@ class ScheduledTask:
 
     @classmethod
     def from_row(cls, row: tuple) -> ScheduledTask:
-        """Deserialize from a SQLite row tuple."""
-        # Handle rows from databases that predate the model column (11 elements)
-        has_model = len(row) > 11
-        if has_model:
-            return cls(
-                id=row[0],
-                name=row[1],
-                task_type=row[2],
-                schedule=json.loads(row[3]),
-                action=json.loads(row[4]),
-                description=row[5] or "",
-                notification_channel=row[6],
-                model=row[7],
-                active=bool(row[8]),
-                created_at=row[9],
-                last_run_at=row[10],
-                next_run_at=row[11],
-            )
+        """Deserialize from a row selected with ``TaskStore``'s ``_COLUMNS``.
+
+        The store always selects its explicit column list, so the row layout
+        is fixed regardless of where ALTER TABLE put the model column.
+        """
+        (
+            task_id,
+            name,
+            task_type,
+            schedule,
+            action,
+            description,
+            notification_channel,
+            model,
+            active,
+            created_at,
+            last_run_at,
+            next_run_at,
+        ) = row
         return cls(
-            id=row[0],
-            name=row[1],
-            task_type=row[2],
-            schedule=json.loads(row[3]),
-            action=json.loads(row[4]),
-            description=row[5] or "",
-            notification_channel=row[6],
-            active=bool(row[7]),
-            created_at=row[8],
-            last_run_at=row[9],
-            next_run_at=row[10],
+            id=task_id,
+            name=name,
+            task_type=task_type,
+            schedule=orjson.loads(schedule),
+            action=orjson.loads(action),
+            description=description or "",
+            notification_channel=notification_channel,
+            model=model,
+            active=bool(active),
+            created_at=created_at,
+            last_run_at=last_run_at,
+            next_run_at=next_run_at,
         )
 
 
 def make_task_id() -> str:
     """Generate a new task ID."""
-    return uuid.uuid4().hex
+    return secrets.token_hex(16)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
 from datetime import UTC, datetime
@@ -11,8 +12,11 @@ from src.db import get_connection
 from src.scheduler.models import ScheduledTask
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
     from pathlib import Path
 
+    from src.db import _AsyncConnection
+
 logger = logging.getLogger(__name__)
 
 _CREATE_TABLE = """
@@ -32,6 +36,26 @@ CREATE TABLE IF NOT EXISTS scheduled_tasks (
 )
 """
 
+# Serves list_missed_one_offs: only never-run one-offs are indexed, by run_at.
+# Without stats the planner prefers the (active, created_at) index, hence the
+# ANALYZE when the table is set up.
+_CREATE_MISSED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_missed_oneoff
+ON scheduled_tasks(json_extract(schedule, '$.run_at'))
+WHERE active = 1 AND task_type = 'one_off' AND last_run_at IS NULL
+"""
+
+_ANALYZE = "ANALYZE scheduled_tasks"
+
+# Migrates databases created before the model column existed
+_ADD_MODEL_COLUMN = "ALTER TABLE scheduled_tasks ADD COLUMN model TEXT"
+
+# Serves list/search_active_tasks: WHERE active = 1 ORDER BY created_at
+_CREATE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_scheduled_tasks_active_created
+ON scheduled_tasks(active, created_at)
+"""
+
 # Explicit column list for SELECT queries.  Using SELECT * breaks when
 # the 'model' column was added via ALTER TABLE (appended at the end)
 # instead of being in the CREATE TABLE position (index 7).
@@ -40,6 +64,40 @@ _COLUMNS = (
     "notification_channel, model, active, created_at, last_run_at, next_run_at"
 )
 
+# Statements are module constants so every call sends identical SQL text.
+_INSERT = f"INSERT INTO scheduled_tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM scheduled_tasks WHERE id = ?"
+_SELECT_ACTIVE = f"SELECT {_COLUMNS} FROM scheduled_tasks WHERE active = 1 ORDER BY created_at"
+_SELECT_MISSED_ONE_OFF = f"""
+SELECT {_COLUMNS} FROM scheduled_tasks
+WHERE active = 1 AND task_type = 'one_off' AND last_run_at IS NULL
+  AND json_extract(schedule, '$.run_at') < ?
+ORDER BY created_at
+"""
+_SEARCH_ACTIVE = f"""
+SELECT {_COLUMNS} FROM scheduled_tasks
+WHERE active = 1 AND (name LIKE ? OR description LIKE ?)
+ORDER BY created_at
+"""
+_DEACTIVATE = "UPDATE scheduled_tasks SET active = 0 WHERE id = ?"
+_DEACTIVATE_AND_CLEAR = (
+    "UPDATE scheduled_tasks SET active = 0, next_run_at = NULL WHERE id = ? AND active = 1"
+)
+_SET_LAST_RUN = "UPDATE scheduled_tasks SET last_run_at = ? WHERE id = ?"
+_COMPLETE_ONE_OFF = (
+    "UPDATE scheduled_tasks SET active = 0, next_run_at = NULL, last_run_at = ? "
+    "WHERE id = ? AND active = 1"
+)
+_SET_NEXT_RUN = "UPDATE scheduled_tasks SET next_run_at = ? WHERE id = ?"
+_SET_MODEL = "UPDATE scheduled_tasks SET model = ? WHERE id = ? AND active = 1"
+
+
+# Write-behind for last_run_at (see TaskStore.start_write_behind): commit up
+# to this many updates at once, waiting at most this long after the first
+# one for others to join it.
+_LAST_RUN_BATCH = 100
+_LAST_RUN_WINDOW = 0.05
+
 
 class TaskStore:
     """Persists scheduled tasks in SQLite / Turso.
@@ -53,6 +111,13 @@ class TaskStore:
     def __init__(self, db_path: Path | None = None) -> None:
         self._db_path = db_path
         self._initialised = False
+        # Long-lived connection to *db_path*, opened on first use
+        self._conn: _AsyncConnection | None = None
+        self._conn_lock = asyncio.Lock()
+        # (timestamp, task_id) pairs awaiting the write-behind task; None
+        # while write-behind is off
+        self._last_run_queue: asyncio.Queue[tuple[str, str] | None] | None = None
+        self._last_run_writer: asyncio.Task | None = None
 
     @classmethod
     def get(cls) -> TaskStore:
@@ -68,135 +133,250 @@ class TaskStore:
 
     # -- Internal helpers ------------------------------------------------------
 
-    async def _connect(self):
-        db = await get_connection(local_path_override=self._db_path)
+    async def _ensure_table(self, db: _AsyncConnection) -> None:
         if not self._initialised:
             await db.execute(_CREATE_TABLE)
             # Migrate existing databases: add model column if missing
             with contextlib.suppress(Exception):
-                await db.execute(
-                    "ALTER TABLE scheduled_tasks ADD COLUMN model TEXT"
-                )
+                await db.execute(_ADD_MODEL_COLUMN)
+            await db.execute(_CREATE_INDEX)
+            await db.execute(_CREATE_MISSED_INDEX)
+            await db.execute(_ANALYZE)
             await db.commit()
             self._initialised = True
-        return db
+
+    @contextlib.asynccontextmanager
+    async def _connect(self, *, read_only: bool = False) -> AsyncIterator[_AsyncConnection]:
+        """Yield a connection with the table in place.
+
+        With an explicit *db_path* the store keeps one connection open for
+        its lifetime (see ``close()``) and hands it to one caller at a
+        time. The configured database is borrowed
+        from the shared pool per call instead: the pool already keeps its
+        connections warm, and pinning one here would starve other users of
+        the single local connection. *read_only* lookups borrow from the
+        reader pool, so they don't wait behind writes.
+        """
+        if self._db_path is None:
+            if not self._initialised:
+                db = await get_connection()
+                try:
+                    await self._ensure_table(db)
+                finally:
+                    await db.close()
+            db = await get_connection(read_only=read_only)
+            try:
+                yield db
+            finally:
+                await db.close()
+            return
+
+        # One coroutine at a time: a shared connection has one transaction,
+        # so another caller's commit or rollback would land on this one's work
+        async with self._conn_lock:
+            if self._conn is None:
+                db = await get_connection(local_path_override=self._db_path)
+                self._initialised = False
+                try:
+                    await self._ensure_table(db)
+                except BaseException:
+                    await db.close()
+                    raise
+                self._conn = db
+            db = self._conn
+            try:
+                yield db
+            except BaseException:
+                # Don't leave a half-done write for the next commit to pick up
+                await db.rollback()
+                raise
+
+    async def close(self) -> None:
+        """Close the store's own connection, if it has one (called on shutdown)."""
+        async with self._conn_lock:
+            if self._conn is not None:
+                conn, self._conn = self._conn, None
+                await conn.close()
+
+    # -- last_run_at write-behind --------------------------------------------------
+
+    def start_write_behind(self) -> None:
+        """Queue ``update_last_run`` writes and commit them in batches.
+
+        Keeps the commit off the task-execution path; a single background
+        task coalesces whatever arrives within ``_LAST_RUN_WINDOW`` into one
+        transaction. Call ``stop_write_behind()`` to flush on shutdown. Only
+        recurring runs are deferred: a lost update just leaves last_run_at a
+        little old, whereas one-offs complete through ``complete_one_off``.
+        """
+        if self._last_run_writer is None:
+            self._last_run_queue = asyncio.Queue()
+            self._last_run_writer = asyncio.create_task(self._write_last_runs(self._last_run_queue))
+
+    async def stop_write_behind(self) -> None:
+        """Write any queued last_run_at updates and stop the background task."""
+        writer, queue = self._last_run_writer, self._last_run_queue
+        if writer is None or queue is None:
+            return
+        self._last_run_writer = self._last_run_queue = None
+        queue.put_nowait(None)  # the writer flushes its batch and exits
+        await writer
+
+    async def _write_last_runs(self, queue: asyncio.Queue[tuple[str, str] | None]) -> None:
+        loop = asyncio.get_running_loop()
+        stop = False
+        while not stop:
+            item = await queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + _LAST_RUN_WINDOW
+            while len(batch) < _LAST_RUN_BATCH:
+                try:
+                    item = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                await self._set_last_runs(batch)
+            except Exception:
+                logger.exception("Failed to write %d last_run_at update(s)", len(batch))
+
+    async def _set_last_runs(self, updates: list[tuple[str, str]]) -> None:
+        async with self._connect() as db:
+            await db.executemany(_SET_LAST_RUN, updates)
+            await db.commit()
 
     # -- CRUD ------------------------------------------------------------------
 
     async def add_task(self, task: ScheduledTask) -> ScheduledTask:
         """Insert a new task. Returns the same task object."""
-        db = await self._connect()
-        try:
-            await db.execute(
-                """
-                INSERT INTO scheduled_tasks
-                    (id, name, task_type, schedule, action, description,
-                     notification_channel, model, active, created_at,
-                     last_run_at, next_run_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                task.to_row(),
-            )
+        await self.add_tasks([task])
+        return task
+
+    async def add_tasks(self, tasks: Iterable[ScheduledTask]) -> list[ScheduledTask]:
+        """Insert many tasks in a single transaction. Returns them as a list."""
+        tasks = list(tasks)
+        if not tasks:
+            return tasks
+        async with self._connect() as db:
+            await db.executemany(_INSERT, [task.to_row() for task in tasks])
             await db.commit()
+        for task in tasks:
             logger.info("Added scheduled task: %s (%s)", task.name, task.id)
-            return task
-        finally:
-            await db.close()
+        return tasks
 
     async def get_task(self, task_id: str) -> ScheduledTask | None:
         """Fetch a task by ID, or None if not found."""
-        db = await self._connect()
-        try:
-            cursor = await db.execute(
-                f"SELECT {_COLUMNS} FROM scheduled_tasks WHERE id = ?", (task_id,)
-            )
+        async with self._connect(read_only=True) as db:
+            cursor = await db.execute(_SELECT_BY_ID, (task_id,))
             row = await cursor.fetchone()
             return ScheduledTask.from_row(row) if row else None
-        finally:
-            await db.close()
 
     async def list_active_tasks(self) -> list[ScheduledTask]:
         """Return all active tasks."""
-        db = await self._connect()
-        try:
-            cursor = await db.execute(
-                f"SELECT {_COLUMNS} FROM scheduled_tasks WHERE active = 1 ORDER BY created_at"
-            )
+        async with self._connect(read_only=True) as db:
+            cursor = await db.execute(_SELECT_ACTIVE)
+            rows = await cursor.fetchall()
+            return [ScheduledTask.from_row(row) for row in rows]
+
+    async def list_missed_one_offs(self, run_at_before: str) -> list[ScheduledTask]:
+        """Return active, never-run one-off tasks with ``run_at`` before *run_at_before*.
+
+        The comparison is on the ISO text as stored (naive or with an
+        offset), so callers should pass a bound with some slack and check
+        the exact time themselves.
+        """
+        async with self._connect(read_only=True) as db:
+            cursor = await db.execute(_SELECT_MISSED_ONE_OFF, (run_at_before,))
             rows = await cursor.fetchall()
             return [ScheduledTask.from_row(row) for row in rows]
-        finally:
-            await db.close()
 
     async def deactivate_task(self, task_id: str) -> bool:
         """Mark a task as inactive. Returns True if a row was updated."""
-        db = await self._connect()
-        try:
-            cursor = await db.execute(
-                "UPDATE scheduled_tasks SET active = 0 WHERE id = ?", (task_id,)
-            )
+        async with self._connect() as db:
+            cursor = await db.execute(_DEACTIVATE, (task_id,))
+            await db.commit()
+            updated = cursor.rowcount > 0
+            if updated:
+                logger.info("Deactivated task: %s", task_id)
+            return updated
+
+    async def deactivate_and_clear_next(self, task_id: str) -> bool:
+        """Deactivate an active task and clear its next_run_at in one statement.
+
+        Returns True if the task was active.
+        """
+        async with self._connect() as db:
+            cursor = await db.execute(_DEACTIVATE_AND_CLEAR, (task_id,))
             await db.commit()
             updated = cursor.rowcount > 0
             if updated:
                 logger.info("Deactivated task: %s", task_id)
             return updated
-        finally:
-            await db.close()
 
     async def search_active_tasks(self, query: str) -> list[ScheduledTask]:
         """Search active tasks by name or description (case-insensitive LIKE)."""
-        db = await self._connect()
-        try:
+        async with self._connect(read_only=True) as db:
             pattern = f"%{query}%"
-            cursor = await db.execute(
-                f"""
-                SELECT {_COLUMNS} FROM scheduled_tasks
-                WHERE active = 1 AND (name LIKE ? OR description LIKE ?)
-                ORDER BY created_at
-                """,
-                (pattern, pattern),
-            )
+            cursor = await db.execute(_SEARCH_ACTIVE, (pattern, pattern))
             rows = await cursor.fetchall()
             return [ScheduledTask.from_row(row) for row in rows]
-        finally:
-            await db.close()
 
-    async def update_last_run(self, task_id: str, timestamp: str | None = None) -> None:
-        """Set the last_run_at timestamp (defaults to now UTC)."""
+    async def complete_one_off(self, task_id: str, timestamp: str | None = None) -> bool:
+        """Record a one-off task's run and deactivate it, committed immediately.
+
+        Never goes through the write-behind queue: a one-off left active with
+        no last_run_at after a crash would be offered again as missed.
+        Returns True if the task was still active.
+        """
         ts = timestamp or datetime.now(UTC).isoformat()
-        db = await self._connect()
-        try:
-            await db.execute(
-                "UPDATE scheduled_tasks SET last_run_at = ? WHERE id = ?",
-                (ts, task_id),
-            )
+        async with self._connect() as db:
+            cursor = await db.execute(_COMPLETE_ONE_OFF, (ts, task_id))
             await db.commit()
-        finally:
-            await db.close()
+            updated = cursor.rowcount > 0
+            if updated:
+                logger.info("Completed one-off task: %s", task_id)
+            return updated
+
+    async def update_last_run(self, task_id: str, timestamp: str | None = None) -> None:
+        """Set the last_run_at timestamp (defaults to now UTC).
+
+        While write-behind is on, this only queues the write; use
+        ``complete_one_off`` for one-off tasks.
+        """
+        ts = timestamp or datetime.now(UTC).isoformat()
+        if self._last_run_queue is not None:
+            self._last_run_queue.put_nowait((ts, task_id))
+            return
+        await self._set_last_runs([(ts, task_id)])
 
     async def update_next_run(self, task_id: str, timestamp: str | None) -> None:
         """Set or clear the next_run_at timestamp."""
-        db = await self._connect()
-        try:
-            await db.execute(
-                "UPDATE scheduled_tasks SET next_run_at = ? WHERE id = ?",
-                (timestamp, task_id),
-            )
+        async with self._connect() as db:
+            await db.execute(_SET_NEXT_RUN, (timestamp, task_id))
+            await db.commit()
+
+    async def update_next_runs(self, updates: list[tuple[str | None, str]]) -> None:
+        """Set next_run_at for many tasks in one transaction.
+
+        *updates* holds ``(timestamp, task_id)`` pairs.
+        """
+        if not updates:
+            return
+        async with self._connect() as db:
+            await db.executemany(_SET_NEXT_RUN, updates)
             await db.commit()
-        finally:
-            await db.close()
 
     async def update_task_model(self, task_id: str, model: str | None) -> bool:
         """Set the model override for a task. Returns True if a row was updated."""
-        db = await self._connect()
-        try:
-            cursor = await db.execute(
-                "UPDATE scheduled_tasks SET model = ? WHERE id = ? AND active = 1",
-                (model, task_id),
-            )
+        async with self._connect() as db:
+            cursor = await db.execute(_SET_MODEL, (model, task_id))
             await db.commit()
             updated = cursor.rowcount > 0
             if updated:
                 logger.info("Updated model for task %s → %s", task_id, model)
             return updated
-        finally:
-            await db.close()
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+import shutil
+import string
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from src.config import settings
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,6 +25,24 @@ MAX_TOTAL_SIZE = 500 * 1024 * 1024  # 500 MB total
 DEFAULT_CLEANUP_HOURS = 72  # 3 days
 
 _SAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9._\-]")
+# Same mapping as _SAFE_FILENAME_RE for ASCII input, as a single translate pass
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+_SAFE_TRANSLATE = str.maketrans({chr(c): "_" for c in range(128) if chr(c) not in _SAFE_CHARS})
+
+
+@lru_cache(maxsize=512)
+def _sanitized_parts(name: str) -> tuple[str, ...]:
+    """Split *name* on ``/`` and sanitize each component.
+
+    Pure string work, so it is cached; tool sessions keep hitting the same
+    few names. The filesystem side of ``resolve()`` is not cached, since
+    symlinks can change where a path lands.
+    """
+    parts = tuple(ScratchSpace.sanitize_filename(p) for p in name.split("/") if p)
+    if not parts:
+        msg = f"Path resolves to empty after sanitization: {name!r}"
+        raise ValueError(msg)
+    return parts
 
 
 class ScratchSpace:
@@ -36,6 +60,8 @@ class ScratchSpace:
     def __init__(self, root: Path | None = None) -> None:
         self._root = (root or settings.scratch_dir).resolve()
         self._root.mkdir(parents=True, exist_ok=True)
+        # Sum of file sizes, computed on first use and then kept up to date
+        self._total_size: int | None = None
 
     @classmethod
     def get(cls) -> ScratchSpace:
@@ -57,9 +83,11 @@ class ScratchSpace:
 
         Raises ``ValueError`` if the result is empty.
         """
-        sanitized = _SAFE_FILENAME_RE.sub("_", name)
-        sanitized = sanitized.lstrip(".")
-        sanitized = sanitized[:255]
+        if name.isascii():
+            sanitized = name.translate(_SAFE_TRANSLATE)
+        else:
+            sanitized = _SAFE_FILENAME_RE.sub("_", name)
+        sanitized = sanitized.lstrip(".")[:255]
         if not sanitized:
             msg = f"Filename is empty after sanitization: {name!r}"
             raise ValueError(msg)
@@ -71,18 +99,29 @@ class ScratchSpace:
         Splits on ``/``, sanitizes each component, and verifies the resolved
         path is inside ``self._root`` (prevents directory traversal).
         """
-        parts = name.split("/")
-        sanitized_parts = [self.sanitize_filename(p) for p in parts if p]
-        if not sanitized_parts:
-            msg = f"Path resolves to empty after sanitization: {name!r}"
-            raise ValueError(msg)
-        target = self._root.joinpath(*sanitized_parts).resolve()
-        # Traversal check: resolved path must be inside root
-        if not str(target).startswith(str(self._root)):
+        target = self._root.joinpath(*_sanitized_parts(name)).resolve()
+        # Traversal check: resolved path must be inside root (compared by parts,
+        # so a sibling like "<root>bar" doesn't pass as a prefix match)
+        if not target.is_relative_to(self._root):
             msg = f"Path traversal detected: {name!r}"
             raise ValueError(msg)
         return target
 
+    def _walk(self, top: str | None = None, prefix: str = "") -> Iterator[tuple[os.DirEntry, str]]:
+        """Yield ``(entry, relative_path)`` for everything under the root, parents first.
+
+        Built on ``os.scandir`` so type checks and stats reuse the directory
+        entry instead of costing a fresh syscall per path. Symlinks are not
+        followed.
+        """
+        with os.scandir(top or self._root) as it:
+            entries = list(it)
+        for entry in entries:
+            relative = prefix + entry.name
+            yield entry, relative
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._walk(entry.path, relative + os.sep)
+
     # -- File operations -------------------------------------------------------
 
     def write(self, name: str, content: str | bytes) -> Path:
@@ -105,7 +144,12 @@ class ScratchSpace:
             raise ValueError(msg)
 
         target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(data)
+        try:
+            target.write_bytes(data)
+        except OSError:
+            self._total_size = None  # a partial write leaves the size unknown
+            raise
+        self._total_size = new_total
         return target
 
     def read(self, name: str) -> str:
@@ -137,7 +181,10 @@ class ScratchSpace:
         target = self.resolve(name)
         if not target.exists():
             return False
+        size = target.stat().st_size
         target.unlink()
+        if self._total_size is not None:
+            self._total_size -= size
         return True
 
     def exists(self, name: str) -> bool:
@@ -150,54 +197,98 @@ class ScratchSpace:
 
         Returns a list of dicts with keys: name, size, modified_iso, age_hours.
         """
-        now = datetime.now(UTC)
+        now = time.time()
         files = []
-        for path in sorted(self._root.rglob("*")):
-            if not path.is_file():
+        for entry, relative in self._walk():
+            if not entry.is_file(follow_symlinks=False):
                 continue
-            stat = path.stat()
-            mtime = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
-            age_hours = (now - mtime).total_seconds() / 3600
-            relative = str(path.relative_to(self._root))
+            stat = entry.stat(follow_symlinks=False)
             files.append(
                 {
                     "name": relative,
                     "size": stat.st_size,
-                    "modified_iso": mtime.isoformat(),
-                    "age_hours": round(age_hours, 1),
+                    "modified_iso": datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat(),
+                    "age_hours": round((now - stat.st_mtime) / 3600, 1),
                 }
             )
+        # Component-wise, so "a/b" sorts before "a.txt" as Path ordering did
+        files.sort(key=lambda f: f["name"].split(os.sep))
         return files
 
     def total_size(self) -> int:
-        """Sum of all file sizes in the scratch space."""
-        return sum(p.stat().st_size for p in self._root.rglob("*") if p.is_file())
+        """Sum of all file sizes in the scratch space.
+
+        Walks the tree once, then is maintained by ``write``, ``delete`` and
+        ``cleanup``. Anything that writes into the scratch root directly must
+        call ``invalidate_total_size()`` afterwards.
+        """
+        if self._total_size is None:
+            self._total_size = sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry, _ in self._walk()
+                if entry.is_file(follow_symlinks=False)
+            )
+        return self._total_size
+
+    def invalidate_total_size(self) -> None:
+        """Forget the cached total so the next ``total_size()`` re-walks the tree."""
+        self._total_size = None
 
     def cleanup(self, max_age_hours: float = DEFAULT_CLEANUP_HOURS) -> int:
         """Remove files older than *max_age_hours* and empty subdirectories.
 
         Returns the number of files removed.
         """
-        now = datetime.now(UTC)
-        removed = 0
-        for path in list(self._root.rglob("*")):
-            if not path.is_file():
-                continue
-            mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=UTC)
-            age_hours = (now - mtime).total_seconds() / 3600
-            if age_hours > max_age_hours:
-                path.unlink()
-                removed += 1
-                logger.debug("Scratch cleanup: removed %s (%.1fh old)", path.name, age_hours)
+        now = time.time()
+        removed, kept_size, _ = self._prune(self._root, now - max_age_hours * 3600, now)
+        # Every file was just visited, so the total comes for free
+        self._total_size = kept_size
+        return removed
 
-        # Remove empty subdirectories (bottom-up)
-        for path in sorted(self._root.rglob("*"), reverse=True):
-            if path.is_dir() and not any(path.iterdir()):
-                path.rmdir()
-                logger.debug("Scratch cleanup: removed empty dir %s", path)
+    def _prune(self, top: str | Path, cutoff: float, now: float) -> tuple[int, int, int]:
+        """Delete files under *top* modified before *cutoff*, then directories left empty.
 
-        return removed
+        Post-order, so each subdirectory is known to be empty (or not) by the
+        time its scan returns. Returns ``(files removed, bytes kept, entries
+        left in top)``.
+        """
+        removed = kept_size = remaining = 0
+        with os.scandir(top) as it:
+            entries = list(it)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub_removed, sub_kept, sub_remaining = self._prune(entry.path, cutoff, now)
+                removed += sub_removed
+                kept_size += sub_kept
+                if sub_remaining:
+                    remaining += 1
+                else:
+                    os.rmdir(entry.path)
+                    logger.debug("Scratch cleanup: removed empty dir %s", entry.path)
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                remaining += 1
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+                age_hours = (now - stat.st_mtime) / 3600
+                logger.debug("Scratch cleanup: removed %s (%.1fh old)", entry.name, age_hours)
+            else:
+                kept_size += stat.st_size
+                remaining += 1
+        return removed, kept_size, remaining
 
     def wipe(self) -> int:
         """Remove all files and subdirectories. Returns the number of files removed."""
-        return self.cleanup(max_age_hours=0)
+        removed = sum(1 for entry, _ in self._walk() if entry.is_file(follow_symlinks=False))
+        # Empty the root in place rather than recreating it
+        with os.scandir(self._root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        self._total_size = 0
+        return removed
@@ -78,7 +78,7 @@ async def handle_inbound_slack_dm(
             )
 
             # Background memory extraction
-            recent = session.to_api_messages()[-6:]
+            recent = session.to_api_messages(last=6)
             asyncio.create_task(
                 extract_and_save(
                     user_message=cleaned,
@@ -51,7 +51,7 @@ async def handle_inbound_sms(from_number: str, body: str) -> None:
             await send_sms(from_number, result_text)
 
             # Background memory extraction
-            recent = session.to_api_messages()[-6:]
+            recent = session.to_api_messages(last=6)
             asyncio.create_task(
                 extract_and_save(
                     user_message=body,
@@ -1,10 +1,10 @@
 """Base types for the tool-calling framework."""
 
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field
 
 
@@ -24,10 +24,10 @@ class ToolResult:
         return self.error is None
 
     def to_content(self) -> str:
-        """Serialize for the Claude tool_result content field."""
+        """Serialize for the Claude tool_result content field (compact JSON)."""
         if self.error:
-            return json.dumps({"error": self.error})
-        return json.dumps(self.data or {})
+            return orjson.dumps({"error": self.error}).decode()
+        return orjson.dumps(self.data or {}, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 class ToolParams(BaseModel):
@@ -89,6 +89,8 @@ class BaseTool(ABC):
     description: str = ""
     category: str = ""
     params_model: type[ToolParams] | None = None
+    parallel_safe: bool = False
+    side_effect_free: bool = False
 
     @abstractmethod
     async def execute(self, **kwargs: Any) -> ToolResult:
@@ -34,7 +34,6 @@ class BrowseWebParams(ToolParams):
     ),
     category="research",
     params_model=BrowseWebParams,
-
 )
 async def browse_web(url: str, task: str) -> ToolResult:
     try:
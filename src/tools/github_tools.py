@@ -136,6 +136,8 @@ class GetIssueParams(ToolParams):
     ),
     category="github",
     params_model=GetRepoParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_get_repo(repo: str) -> ToolResult:
     try:
@@ -169,6 +171,8 @@ async def github_get_repo(repo: str) -> ToolResult:
     ),
     category="github",
     params_model=ListDirectoryParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_list_directory(
     repo: str, path: str = "", ref: str | None = None
@@ -211,6 +215,8 @@ async def github_list_directory(
     ),
     category="github",
     params_model=ReadFileParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_read_file(
     repo: str, path: str, ref: str | None = None
@@ -257,6 +263,8 @@ async def github_read_file(
     ),
     category="github",
     params_model=SearchCodeParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_search_code(
     query: str, repo: str | None = None, max_results: int = 10
@@ -295,6 +303,8 @@ async def github_search_code(
     ),
     category="github",
     params_model=ListCommitsParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_list_commits(
     repo: str,
@@ -341,6 +351,8 @@ async def github_list_commits(
     ),
     category="github",
     params_model=GetCommitParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_get_commit(repo: str, sha: str) -> ToolResult:
     try:
@@ -389,6 +401,8 @@ async def github_get_commit(repo: str, sha: str) -> ToolResult:
     ),
     category="github",
     params_model=ListIssuesParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_list_issues(
     repo: str,
@@ -441,6 +455,8 @@ async def github_list_issues(
     ),
     category="github",
     params_model=GetIssueParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def github_get_issue(repo: str, number: int) -> ToolResult:
     try:
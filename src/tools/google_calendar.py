@@ -1,12 +1,11 @@
 """Google Calendar tools — list, create, update, delete events, check availability."""
 
-import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 
 from pydantic import Field
 
-from src.integrations.google_auth import GoogleAuthManager
+from src.integrations.google_auth import GoogleAuthManager, run_google_api
 from src.tools.base import GoogleToolParams, ToolResult
 from src.tools.registry import registry
 
@@ -14,6 +13,13 @@ logger = logging.getLogger(__name__)
 
 _CATEGORY = "google_calendar"
 
+# Partial-response mask for events.list: only what _format_event reads.
+_EVENT_LIST_FIELDS = (
+    "items(id,summary,start,end,location,description,attendees/email,"
+    "hangoutLink,conferenceData/entryPoints(entryPointType,uri))"
+)
+_EVENT_LIST_MAX_RESULTS = 250
+
 
 def _auth(account: str | None = None) -> GoogleAuthManager:
     return GoogleAuthManager.get(account)
@@ -40,8 +46,8 @@ def _format_event(event: dict) -> dict:
     return {
         "id": event["id"],
         "title": event.get("summary", "(no title)"),
-        "start": start.get("dateTime", start.get("date", "")),
-        "end": end.get("dateTime", end.get("date", "")),
+        "start": start.get("dateTime") or start.get("date", ""),
+        "end": end.get("dateTime") or end.get("date", ""),
         "location": event.get("location", ""),
         "description": event.get("description", ""),
         "attendees": attendees,
@@ -72,7 +78,7 @@ async def list_events(
     now = datetime.now(UTC)
     time_max = now + timedelta(days=days_ahead)
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.events()
         .list(
             calendarId=calendar_id,
@@ -80,6 +86,8 @@ async def list_events(
             timeMax=time_max.isoformat(),
             singleEvents=True,
             orderBy="startTime",
+            maxResults=_EVENT_LIST_MAX_RESULTS,
+            fields=_EVENT_LIST_FIELDS,
         )
         .execute()
     )
@@ -109,7 +117,7 @@ async def get_todays_schedule(
     start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
     end_of_day = start_of_day + timedelta(days=1)
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.events()
         .list(
             calendarId=calendar_id,
@@ -117,6 +125,8 @@ async def get_todays_schedule(
             timeMax=end_of_day.isoformat(),
             singleEvents=True,
             orderBy="startTime",
+            maxResults=_EVENT_LIST_MAX_RESULTS,
+            fields=_EVENT_LIST_FIELDS,
         )
         .execute()
     )
@@ -169,7 +179,7 @@ async def create_event(
     if attendees:
         body["attendees"] = [{"email": e} for e in attendees]
 
-    event = await asyncio.to_thread(
+    event = await run_google_api(
         lambda: service.events()
         .insert(calendarId=calendar_id, body=body)
         .execute()
@@ -218,7 +228,7 @@ async def update_event(
     service = _auth(account).calendar()
 
     # Fetch existing event
-    existing = await asyncio.to_thread(
+    existing = await run_google_api(
         lambda: service.events()
         .get(calendarId=calendar_id, eventId=event_id)
         .execute()
@@ -238,7 +248,7 @@ async def update_event(
     if attendees is not None:
         existing["attendees"] = [{"email": e} for e in attendees]
 
-    updated = await asyncio.to_thread(
+    updated = await run_google_api(
         lambda: service.events()
         .patch(calendarId=calendar_id, eventId=event_id, body=existing)
         .execute()
@@ -273,7 +283,7 @@ async def delete_event(
 ) -> ToolResult:
     service = _auth(account).calendar()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.events()
         .delete(calendarId=calendar_id, eventId=event_id)
         .execute()
@@ -321,7 +331,7 @@ async def get_events_by_date_range(
 
     service = _auth(account).calendar()
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.events()
         .list(
             calendarId=calendar_id,
@@ -329,6 +339,8 @@ async def get_events_by_date_range(
             timeMax=end.isoformat(),
             singleEvents=True,
             orderBy="startTime",
+            maxResults=_EVENT_LIST_MAX_RESULTS,
+            fields=_EVENT_LIST_FIELDS,
         )
         .execute()
     )
@@ -362,7 +374,7 @@ async def check_availability(
     day = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC)
     day_end = day + timedelta(days=1)
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.freebusy()
         .query(
             body={
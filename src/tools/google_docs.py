@@ -1,11 +1,10 @@
 """Google Docs tools — read, create, update, append documents."""
 
-import asyncio
 import logging
 
 from pydantic import Field
 
-from src.integrations.google_auth import GoogleAuthManager
+from src.integrations.google_auth import GoogleAuthManager, run_google_api
 from src.tools.base import GoogleToolParams, ToolResult
 from src.tools.registry import registry
 
@@ -57,7 +56,7 @@ async def _read_document_content(document_id: str, account: str | None = None) -
     """Read document text — shared by read_document and Drive's read_file."""
     service = _auth(account).docs()
 
-    doc = await asyncio.to_thread(
+    doc = await run_google_api(
         lambda: service.documents().get(documentId=document_id).execute()
     )
 
@@ -80,7 +79,7 @@ class ReadDocumentParams(GoogleToolParams):
 async def read_document(document_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).docs()
 
-    doc = await asyncio.to_thread(
+    doc = await run_google_api(
         lambda: service.documents().get(documentId=document_id).execute()
     )
 
@@ -113,14 +112,14 @@ class CreateDocumentParams(GoogleToolParams):
 async def create_document(title: str, content: str = "", account: str | None = None) -> ToolResult:
     service = _auth(account).docs()
 
-    doc = await asyncio.to_thread(
+    doc = await run_google_api(
         lambda: service.documents().create(body={"title": title}).execute()
     )
 
     document_id = doc["documentId"]
 
     if content:
-        await asyncio.to_thread(
+        await run_google_api(
             lambda: service.documents()
             .batchUpdate(
                 documentId=document_id,
@@ -162,7 +161,7 @@ async def update_document(document_id: str, content: str, account: str | None =
     service = _auth(account).docs()
 
     # Get current document to find end index
-    doc = await asyncio.to_thread(
+    doc = await run_google_api(
         lambda: service.documents().get(documentId=document_id).execute()
     )
 
@@ -180,7 +179,7 @@ async def update_document(document_id: str, content: str, account: str | None =
     # Insert new content
     requests.append({"insertText": {"location": {"index": 1}, "text": content}})
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.documents()
         .batchUpdate(documentId=document_id, body={"requests": requests})
         .execute()
@@ -215,14 +214,14 @@ async def append_to_document(
     service = _auth(account).docs()
 
     # Get current document to find end index
-    doc = await asyncio.to_thread(
+    doc = await run_google_api(
         lambda: service.documents().get(documentId=document_id).execute()
     )
 
     body_content = doc.get("body", {}).get("content", [])
     end_index = body_content[-1].get("endIndex", 1) if body_content else 1
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.documents()
         .batchUpdate(
             documentId=document_id,
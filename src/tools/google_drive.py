@@ -1,13 +1,12 @@
 """Google Drive tools — search, list, read, delete, download, upload files."""
 
-import asyncio
 import logging
 import mimetypes
 
 from googleapiclient.http import MediaInMemoryUpload
 from pydantic import Field
 
-from src.integrations.google_auth import GoogleAuthManager
+from src.integrations.google_auth import GoogleAuthManager, run_google_api
 from src.scratch import ScratchSpace
 from src.tools.base import GoogleToolParams, ToolResult
 from src.tools.registry import registry
@@ -66,7 +65,7 @@ async def _resolve_folder_path(
         return "…"
 
     try:
-        meta = await asyncio.to_thread(
+        meta = await run_google_api(
             lambda fid=folder_id: service.files()
             .get(
                 fileId=fid,
@@ -130,7 +129,7 @@ async def search_files(
     if folder_id:
         q = f"'{folder_id}' in parents and ({q})"
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.files()
         .list(q=q, pageSize=max_results, fields=_FILE_FIELDS, **_SHARED_DRIVE_PARAMS)
         .execute()
@@ -174,7 +173,7 @@ class ListRecentFilesParams(GoogleToolParams):
 async def list_recent_files(max_results: int = 10, account: str | None = None) -> ToolResult:
     service = _auth(account).drive()
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.files()
         .list(
             q="trashed = false",
@@ -224,7 +223,7 @@ async def list_folder(
 
     q = f"'{folder_id}' in parents"
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.files()
         .list(
             q=q,
@@ -270,7 +269,7 @@ async def read_file(file_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).drive()
 
     # Get file metadata
-    meta = await asyncio.to_thread(
+    meta = await run_google_api(
         lambda: service.files()
         .get(
             fileId=file_id,
@@ -312,7 +311,7 @@ async def read_file(file_id: str, account: str | None = None) -> ToolResult:
     is_text = mime_type in text_types or name.endswith((".txt", ".csv", ".json", ".md"))
 
     if is_text:
-        content_bytes = await asyncio.to_thread(
+        content_bytes = await run_google_api(
             lambda: service.files()
             .get_media(fileId=file_id, supportsAllDrives=True)
             .execute()
@@ -348,7 +347,7 @@ class DeleteFileParams(GoogleToolParams):
 async def delete_file(file_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).drive()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.files()
         .update(fileId=file_id, body={"trashed": True}, supportsAllDrives=True)
         .execute()
@@ -382,7 +381,7 @@ async def download_drive_file(
 ) -> ToolResult:
     service = _auth(account).drive()
 
-    meta = await asyncio.to_thread(
+    meta = await run_google_api(
         lambda: service.files()
         .get(
             fileId=file_id,
@@ -399,7 +398,7 @@ async def download_drive_file(
     export_fmt = _EXPORT_FORMATS.get(mime_type)
     if export_fmt:
         export_mime, ext = export_fmt
-        data = await asyncio.to_thread(
+        data = await run_google_api(
             lambda: service.files()
             .export(fileId=file_id, mimeType=export_mime)
             .execute()
@@ -409,7 +408,7 @@ async def download_drive_file(
             filename = drive_name + ext if not drive_name.endswith(ext) else drive_name
         mime_type = export_mime
     else:
-        data = await asyncio.to_thread(
+        data = await run_google_api(
             lambda: service.files()
             .get_media(fileId=file_id, supportsAllDrives=True)
             .execute()
@@ -478,7 +477,7 @@ async def upload_to_drive(
     media = MediaInMemoryUpload(data, mimetype=mime_type, resumable=False)
     service = _auth(account).drive()
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.files()
         .create(
             body=file_metadata,
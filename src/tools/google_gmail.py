@@ -2,41 +2,95 @@
 
 from __future__ import annotations
 
-import asyncio
 import base64
 import logging
 import mimetypes
 from email import encoders
+from email.header import Header
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from bs4 import BeautifulSoup
 from pydantic import Field
 
-from src.integrations.google_auth import GoogleAuthManager
+from src.integrations.google_auth import GoogleAuthManager, run_google_api
 from src.scratch import ScratchSpace
 from src.tools.base import GoogleToolParams, ToolResult
 from src.tools.registry import registry
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
 logger = logging.getLogger(__name__)
 
 _CATEGORY = "google_gmail"
 
 GMAIL_ATTACHMENT_LIMIT = 25 * 1024 * 1024  # 25 MB per email
 
+# Gmail accepts up to 100 calls per batch but recommends staying at or below
+# 50 to avoid per-user rate limiting.
+_BATCH_SIZE = 50
+
+# Headers requested with format="metadata" — Gmail otherwise returns every
+# header on the message, most of which we never read.
+_SUMMARY_HEADERS = ["Subject", "From", "To", "Date"]
+_REPLY_HEADERS = ["Subject", "From", "Reply-To", "Message-ID"]
+_THREAD_HEADERS = ("Subject", "From", "To", "Date")
+_DRAFT_HEADERS = ("Subject", "To", "Date")
+
 
 def _auth(account: str | None = None) -> GoogleAuthManager:
     return GoogleAuthManager.get(account)
 
 
-def _extract_headers(msg: dict) -> dict[str, str]:
-    """Extract headers from a Gmail message into a flat dict."""
-    return {
-        h["name"]: h["value"]
-        for h in msg.get("payload", {}).get("headers", [])
-    }
+def _extract_headers(msg: dict, wanted: Collection[str] | None = None) -> dict[str, str]:
+    """Extract headers from a Gmail message into a flat dict.
+
+    With *wanted*, only those header names are kept and the scan stops once
+    all of them have been seen.
+    """
+    headers = msg.get("payload", {}).get("headers", [])
+    if wanted is None:
+        return {h["name"]: h["value"] for h in headers}
+
+    found: dict[str, str] = {}
+    remaining = len(wanted)
+    for h in headers:
+        name = h["name"]
+        if name in wanted and name not in found:
+            found[name] = h["value"]
+            remaining -= 1
+            if not remaining:
+                break
+    return found
+
+
+def _execute_batch(service: Any, requests: list[Any]) -> list[dict]:
+    """Execute Gmail API requests via HTTP batching (blocking).
+
+    Sends up to ``_BATCH_SIZE`` requests per round-trip instead of one each.
+    Returns responses in request order; re-raises the first per-request error.
+    """
+    results: list[dict] = [{}] * len(requests)
+    errors: list[Exception] = []
+
+    def _collect(request_id: str, response: dict, exception: Exception | None) -> None:
+        if exception is not None:
+            errors.append(exception)
+        else:
+            results[int(request_id)] = response
+
+    for start in range(0, len(requests), _BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        for i, request in enumerate(requests[start : start + _BATCH_SIZE], start):
+            batch.add(request, request_id=str(i))
+        batch.execute()
+
+    if errors:
+        raise errors[0]
+    return results
 
 
 def _extract_body(payload: dict) -> str:
@@ -129,6 +183,46 @@ def _build_message(body: str, attachments: list[str] | None = None) -> MIMEText
     return msg
 
 
+def _encode_header(value: str) -> str:
+    """Return *value* ready for a header line, RFC 2047-encoding non-ASCII text."""
+    if "\r" in value or "\n" in value:
+        msg = "Header values must not contain line breaks"
+        raise ValueError(msg)
+    return value if value.isascii() else Header(value, "utf-8").encode()
+
+
+def _raw_message(
+    body: str,
+    headers: dict[str, str | None],
+    attachments: list[str] | None = None,
+) -> str:
+    """Build the base64url ``raw`` payload for the Gmail API.
+
+    Plain-text messages (the common case) are written out directly rather
+    than going through ``email.mime`` and its generator; messages with
+    attachments still use ``_build_message``. Empty headers are omitted.
+
+    Raises ``FileNotFoundError`` / ``ValueError`` like ``_build_message``.
+    """
+    if attachments:
+        message = _build_message(body, attachments)
+        for name, value in headers.items():
+            if value:
+                message[name] = value
+        return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+    lines = [f"{name}: {_encode_header(value)}" for name, value in headers.items() if value]
+    lines += [
+        "MIME-Version: 1.0",
+        'Content-Type: text/plain; charset="utf-8"',
+        "Content-Transfer-Encoding: base64",
+        "",
+        "",
+    ]
+    raw = "\n".join(lines).encode("ascii") + base64.encodebytes(body.encode("utf-8"))
+    return base64.urlsafe_b64encode(raw).decode()
+
+
 # -- search_emails -----------------------------------------------------------
 
 
@@ -167,19 +261,27 @@ async def search_emails(
     if page_token:
         list_kwargs["pageToken"] = page_token
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users().messages().list(**list_kwargs).execute()
     )
 
-    messages = []
-    for msg_ref in result.get("messages", []):
-        msg = await asyncio.to_thread(
-            lambda mid=msg_ref["id"]: service.users()
-            .messages()
-            .get(userId="me", id=mid, format="metadata")
-            .execute()
+    requests = [
+        service.users()
+        .messages()
+        .get(
+            userId="me",
+            id=msg_ref["id"],
+            format="metadata",
+            metadataHeaders=_SUMMARY_HEADERS,
+            fields="id,threadId,snippet,payload/headers",
         )
-        headers = _extract_headers(msg)
+        for msg_ref in result.get("messages", [])
+    ]
+    fetched = await run_google_api(_execute_batch, service, requests) if requests else []
+
+    messages = []
+    for msg in fetched:
+        headers = _extract_headers(msg, _SUMMARY_HEADERS)
         messages.append({
             "id": msg["id"],
             "thread_id": msg.get("threadId", ""),
@@ -218,7 +320,7 @@ class ReadEmailParams(GoogleToolParams):
 async def read_email(message_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    msg = await asyncio.to_thread(
+    msg = await run_google_api(
         lambda: service.users()
         .messages()
         .get(userId="me", id=message_id, format="full")
@@ -257,7 +359,7 @@ class ReadThreadParams(GoogleToolParams):
 async def read_thread(thread_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    thread = await asyncio.to_thread(
+    thread = await run_google_api(
         lambda: service.users()
         .threads()
         .get(userId="me", id=thread_id, format="full")
@@ -267,7 +369,7 @@ async def read_thread(thread_id: str, account: str | None = None) -> ToolResult:
     messages = []
     subject = ""
     for msg in thread.get("messages", []):
-        headers = _extract_headers(msg)
+        headers = _extract_headers(msg, _THREAD_HEADERS)
         payload = msg.get("payload", {})
         if not subject:
             subject = headers.get("Subject", "")
@@ -321,20 +423,11 @@ async def send_email(
     service = _auth(account).gmail()
 
     try:
-        message = _build_message(body, attachments)
+        raw = _raw_message(body, {"to": to, "subject": subject, "cc": cc, "bcc": bcc}, attachments)
     except (FileNotFoundError, ValueError) as exc:
         return ToolResult(error=str(exc))
 
-    message["to"] = to
-    message["subject"] = subject
-    if cc:
-        message["cc"] = cc
-    if bcc:
-        message["bcc"] = bcc
-
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users()
         .messages()
         .send(userId="me", body={"raw": raw})
@@ -381,22 +474,11 @@ async def create_draft(
     service = _auth(account).gmail()
 
     try:
-        message = _build_message(body, attachments)
+        raw = _raw_message(body, {"to": to, "subject": subject, "cc": cc, "bcc": bcc}, attachments)
     except (FileNotFoundError, ValueError) as exc:
         return ToolResult(error=str(exc))
 
-    if to:
-        message["to"] = to
-    if subject:
-        message["subject"] = subject
-    if cc:
-        message["cc"] = cc
-    if bcc:
-        message["bcc"] = bcc
-
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users()
         .drafts()
         .create(userId="me", body={"message": {"raw": raw}})
@@ -436,24 +518,24 @@ async def list_drafts(
 ) -> ToolResult:
     service = _auth(account).gmail()
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users()
         .drafts()
         .list(userId="me", maxResults=max_results)
         .execute()
     )
 
+    # Fetch metadata for all drafts in batched round-trips
+    requests = [
+        service.users().drafts().get(userId="me", id=draft_ref["id"], format="metadata")
+        for draft_ref in result.get("drafts", [])
+    ]
+    fetched = await run_google_api(_execute_batch, service, requests) if requests else []
+
     drafts = []
-    for draft_ref in result.get("drafts", []):
-        # Fetch metadata for each draft
-        draft = await asyncio.to_thread(
-            lambda did=draft_ref["id"]: service.users()
-            .drafts()
-            .get(userId="me", id=did, format="metadata")
-            .execute()
-        )
+    for draft in fetched:
         msg = draft.get("message", {})
-        headers = _extract_headers(msg)
+        headers = _extract_headers(msg, _DRAFT_HEADERS)
         drafts.append({
             "draft_id": draft["id"],
             "message_id": msg.get("id", ""),
@@ -487,7 +569,7 @@ async def delete_draft(
 ) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .drafts()
         .delete(userId="me", id=draft_id)
@@ -526,32 +608,40 @@ async def reply_to_email(
     service = _auth(account).gmail()
 
     # Fetch original for threading headers
-    original = await asyncio.to_thread(
+    original = await run_google_api(
         lambda: service.users()
         .messages()
-        .get(userId="me", id=message_id, format="metadata")
+        .get(
+            userId="me",
+            id=message_id,
+            format="metadata",
+            metadataHeaders=_REPLY_HEADERS,
+        )
         .execute()
     )
 
-    headers = _extract_headers(original)
+    headers = _extract_headers(original, _REPLY_HEADERS)
     thread_id = original.get("threadId", "")
     orig_subject = headers.get("Subject", "")
     subject = orig_subject if orig_subject.lower().startswith("re:") else f"Re: {orig_subject}"
     reply_to = headers.get("Reply-To") or headers.get("From", "")
 
+    message_id_header = headers.get("Message-ID", "")
     try:
-        message = _build_message(body, attachments)
+        raw = _raw_message(
+            body,
+            {
+                "to": reply_to,
+                "subject": subject,
+                "In-Reply-To": message_id_header,
+                "References": message_id_header,
+            },
+            attachments,
+        )
     except (FileNotFoundError, ValueError) as exc:
         return ToolResult(error=str(exc))
 
-    message["to"] = reply_to
-    message["subject"] = subject
-    message["In-Reply-To"] = headers.get("Message-ID", "")
-    message["References"] = headers.get("Message-ID", "")
-
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users()
         .messages()
         .send(userId="me", body={"raw": raw, "threadId": thread_id})
@@ -579,7 +669,7 @@ class ArchiveEmailParams(GoogleToolParams):
 async def archive_email(message_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .modify(userId="me", id=message_id, body={"removeLabelIds": ["INBOX"]})
@@ -606,7 +696,7 @@ class ArchiveEmailsParams(GoogleToolParams):
 async def archive_emails(message_ids: list[str], account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .batchModify(
@@ -639,7 +729,7 @@ class TrashEmailParams(GoogleToolParams):
 async def trash_email(message_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .trash(userId="me", id=message_id)
@@ -665,7 +755,7 @@ class MarkAsReadParams(GoogleToolParams):
 async def mark_as_read(message_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .modify(userId="me", id=message_id, body={"removeLabelIds": ["UNREAD"]})
@@ -691,7 +781,7 @@ class MarkAsUnreadParams(GoogleToolParams):
 async def mark_as_unread(message_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .modify(userId="me", id=message_id, body={"addLabelIds": ["UNREAD"]})
@@ -717,7 +807,7 @@ class StarEmailParams(GoogleToolParams):
 async def star_email(message_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .modify(userId="me", id=message_id, body={"addLabelIds": ["STARRED"]})
@@ -743,7 +833,7 @@ class UnstarEmailParams(GoogleToolParams):
 async def unstar_email(message_id: str, account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .modify(userId="me", id=message_id, body={"removeLabelIds": ["STARRED"]})
@@ -780,7 +870,7 @@ async def _resolve_label_id(service: Any, label_name: str) -> str | None:
         return upper
 
     # Look up user-created labels
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users().labels().list(userId="me").execute()
     )
     for label in result.get("labels", []):
@@ -807,7 +897,7 @@ async def add_label(
     if not label_id:
         return ToolResult(error=f"Label not found: {label_name}")
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .modify(userId="me", id=message_id, body={"addLabelIds": [label_id]})
@@ -848,7 +938,7 @@ async def remove_label(
     if not label_id:
         return ToolResult(error=f"Label not found: {label_name}")
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .messages()
         .modify(userId="me", id=message_id, body={"removeLabelIds": [label_id]})
@@ -885,7 +975,7 @@ async def create_label(
         "messageListVisibility": "show",
     }
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users()
         .labels()
         .create(userId="me", body=label_body)
@@ -936,7 +1026,7 @@ async def delete_label(
     if label_id in system_labels:
         return ToolResult(error=f"Cannot delete system label: {label_name}")
 
-    await asyncio.to_thread(
+    await run_google_api(
         lambda: service.users()
         .labels()
         .delete(userId="me", id=label_id)
@@ -962,7 +1052,7 @@ class ListLabelsParams(GoogleToolParams):
 async def list_labels(account: str | None = None) -> ToolResult:
     service = _auth(account).gmail()
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users().labels().list(userId="me").execute()
     )
 
@@ -1006,7 +1096,7 @@ async def download_email_attachment(
 ) -> ToolResult:
     service = _auth(account).gmail()
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.users()
         .messages()
         .attachments()
@@ -1,11 +1,10 @@
 """Google People tools — search, get, create, update contacts + local notes."""
 
-import asyncio
 import logging
 
 from pydantic import Field
 
-from src.integrations.google_auth import GoogleAuthManager
+from src.integrations.google_auth import GoogleAuthManager, run_google_api
 from src.people.store import PeopleStore
 from src.tools.base import GoogleToolParams, ToolResult
 from src.tools.registry import registry
@@ -75,7 +74,7 @@ async def search_contacts(
 ) -> ToolResult:
     service = _auth(account).people()
 
-    result = await asyncio.to_thread(
+    result = await run_google_api(
         lambda: service.people()
         .searchContacts(query=query, readMask=_PERSON_FIELDS, pageSize=min(max_results, 30))
         .execute()
@@ -108,7 +107,7 @@ async def get_contact(
 ) -> ToolResult:
     service = _auth(account).people()
 
-    person = await asyncio.to_thread(
+    person = await run_google_api(
         lambda: service.people()
         .get(resourceName=resource_name, personFields=_PERSON_FIELDS)
         .execute()
@@ -180,7 +179,7 @@ async def create_contact(
             org["title"] = title
         person_body["organizations"] = [org]
 
-    created = await asyncio.to_thread(
+    created = await run_google_api(
         lambda: service.people().createContact(body=person_body).execute()
     )
 
@@ -235,7 +234,7 @@ async def update_contact(
     service = _auth(account).people()
 
     # Fetch current person for etag
-    current = await asyncio.to_thread(
+    current = await run_google_api(
         lambda: service.people()
         .get(resourceName=resource_name, personFields=_PERSON_FIELDS)
         .execute()
@@ -274,7 +273,7 @@ async def update_contact(
     if not update_fields:
         return ToolResult(error="No fields to update. Provide at least one field.")
 
-    updated = await asyncio.to_thread(
+    updated = await run_google_api(
         lambda: service.people()
         .updateContact(
             resourceName=resource_name,
@@ -324,7 +323,7 @@ async def update_contact_notes(
     else:
         # Fetch display name from People API
         service = _auth(account).people()
-        person = await asyncio.to_thread(
+        person = await run_google_api(
             lambda: service.people()
             .get(resourceName=resource_name, personFields="names")
             .execute()
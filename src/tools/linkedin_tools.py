@@ -86,8 +86,8 @@ async def linkedin_create_post(
 ) -> ToolResult:
     try:
         auth = _auth()
-        headers = auth.get_headers()
-        person_urn = auth.get_person_urn()
+        headers = await auth.get_headers()
+        person_urn = await auth.get_person_urn()
     except LinkedInAuthError as exc:
         return ToolResult(error=str(exc))
 
@@ -152,8 +152,8 @@ async def linkedin_post_comment(
 
     try:
         auth = _auth()
-        headers = auth.get_headers()
-        person_urn = auth.get_person_urn()
+        headers = await auth.get_headers()
+        person_urn = await auth.get_person_urn()
     except LinkedInAuthError as exc:
         return ToolResult(error=str(exc))
 
@@ -57,6 +57,8 @@ def _format_entry(entry: dict) -> str:
     ),
     category="observability",
     params_model=QueryLogsParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def query_logs(
     filter_query: str | None = None,
@@ -98,6 +98,8 @@ class RecallParams(ToolParams):
     ),
     category="memory",
     params_model=RecallParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def recall(query: str, limit: int = 5) -> ToolResult:
     store = MemoryStore.get()
@@ -658,6 +658,8 @@ class NotionUpdateBlockParams(ToolParams):
     ),
     category="notion",
     params_model=NotionSearchParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def notion_search(
     query: str,
@@ -692,6 +694,8 @@ async def notion_search(
     ),
     category="notion",
     params_model=NotionListDatabasesParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def notion_list_databases(
     page_size: int = DEFAULT_PAGE_SIZE,
@@ -748,6 +752,8 @@ async def notion_list_databases(
     ),
     category="notion",
     params_model=NotionGetDatabaseParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def notion_get_database(database_id: str) -> ToolResult:
     try:
@@ -788,6 +794,8 @@ async def notion_get_database(database_id: str) -> ToolResult:
     ),
     category="notion",
     params_model=NotionQueryDatabaseParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def notion_query_database(
     database_id: str,
@@ -835,6 +843,8 @@ async def notion_query_database(
     ),
     category="notion",
     params_model=NotionGetPageParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def notion_get_page(page_id: str) -> ToolResult:
     try:
@@ -856,6 +866,8 @@ async def notion_get_page(page_id: str) -> ToolResult:
     ),
     category="notion",
     params_model=NotionReadPageContentParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def notion_read_page_content(page_id: str) -> ToolResult:
     try:
@@ -1065,6 +1077,8 @@ async def notion_append_content(
     ),
     category="notion",
     params_model=NotionListBlocksParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def notion_list_blocks(
     block_id: str,
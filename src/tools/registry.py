@@ -7,9 +7,9 @@ import logging
 import time
 import tomllib
 from dataclasses import dataclass
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from src.config import CONFIG_DIR
 from src.tools.base import BaseTool, ToolParams, ToolResult
 
 if TYPE_CHECKING:
@@ -19,8 +19,7 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-_CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
-_CONFIRMATIONS_PATH = _CONFIG_DIR / "TOOL_CONFIRMATIONS.toml"
+_CONFIRMATIONS_PATH = CONFIG_DIR / "TOOL_CONFIRMATIONS.toml"
 
 
 def _load_confirmation_config() -> dict[str, bool]:
@@ -45,6 +44,13 @@ class ToolDef:
     category: str
     handler: Callable[..., Awaitable[ToolResult]]
     params_model: type[ToolParams] | None = None
+    # True for tools that may run concurrently with others in the same round.
+    # Off by default so calls with side effects keep their order; read-only
+    # fetches opt in.
+    parallel_safe: bool = False
+    # True for read-only tools: identical calls within one response may
+    # reuse the earlier result instead of hitting the API again.
+    side_effect_free: bool = False
 
 
 class ToolRegistry:
@@ -72,6 +78,8 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, ToolDef] = {}
+        # Built on first get_schemas() and dropped whenever a tool is registered
+        self._schemas: list[dict[str, Any]] | None = None
 
     def tool(
         self,
@@ -80,6 +88,8 @@ class ToolRegistry:
         description: str,
         category: str,
         params_model: type[ToolParams] | None = None,
+        parallel_safe: bool = False,
+        side_effect_free: bool = False,
     ) -> Callable:
         """Decorator to register an async function as a tool."""
 
@@ -88,12 +98,15 @@ class ToolRegistry:
                 msg = f"Tool handler '{name}' must be an async function"
                 raise TypeError(msg)
 
+            self._schemas = None
             self._tools[name] = ToolDef(
                 name=name,
                 description=description,
                 category=category,
                 handler=fn,
                 params_model=params_model,
+                parallel_safe=parallel_safe,
+                side_effect_free=side_effect_free,
             )
             return fn
 
@@ -101,12 +114,15 @@ class ToolRegistry:
 
     def register(self, tool_instance: BaseTool) -> None:
         """Register a class-based tool instance."""
+        self._schemas = None
         self._tools[tool_instance.name] = ToolDef(
             name=tool_instance.name,
             description=tool_instance.description,
             category=tool_instance.category,
             handler=tool_instance.execute,
             params_model=tool_instance.params_model,
+            parallel_safe=tool_instance.parallel_safe,
+            side_effect_free=tool_instance.side_effect_free,
         )
 
     def requires_confirmation(self, name: str) -> bool:
@@ -135,8 +151,16 @@ class ToolRegistry:
         return list(self._tools.keys())
 
     def get_schemas(self) -> list[dict[str, Any]]:
-        """Generate Claude-compatible tool schemas for all registered tools."""
-        return [self._tool_schema(t) for t in self._tools.values()]
+        """Claude-compatible tool schemas for all registered tools.
+
+        Schemas are static once tools are registered, so the list is built
+        once (``model_json_schema()`` per tool is not cheap) and the same
+        object is returned until another tool is registered. Treat it as
+        read-only.
+        """
+        if self._schemas is None:
+            self._schemas = [self._tool_schema(t) for t in self._tools.values()]
+        return self._schemas
 
     def get_tools_by_category(self) -> dict[str, list[ToolDef]]:
         """Group registered tools by category."""
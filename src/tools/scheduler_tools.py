@@ -34,6 +34,16 @@ def init_scheduler_tools(engine: SchedulerEngine) -> None:
     _engine = engine
 
 
+def next_run_at(task: ScheduledTask) -> str | None:
+    """The task's next run: live from the scheduler if it's running, else as stored.
+
+    The stored value is only refreshed on schedule, cancel and reload, so for
+    recurring tasks the live job is the accurate source.
+    """
+    live = _engine.next_run_time(task.id) if _engine is not None else None
+    return live or task.next_run_at
+
+
 def _get_engine() -> SchedulerEngine:
     if _engine is None:
         msg = "Scheduler not initialised — call init_scheduler_tools() first"
@@ -163,10 +173,7 @@ async def schedule_task(
     )
 
     task = await engine.schedule_task(task)
-
-    # Re-read to get the computed next_run_at
-    stored = await engine._store.get_task(task.id)
-    next_run = stored.next_run_at if stored else None
+    next_run = engine.next_run_time(task.id)
 
     return ToolResult(data={
         "scheduled": True,
@@ -207,7 +214,7 @@ async def list_scheduled_tasks() -> ToolResult:
             "action": t.action,
             "notification_channel": t.notification_channel,
             "model": friendly_model(t.model) if t.model else None,
-            "next_run_at": t.next_run_at,
+            "next_run_at": next_run_at(t),
             "last_run_at": t.last_run_at,
             "created_at": t.created_at,
         })
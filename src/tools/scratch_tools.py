@@ -172,7 +172,6 @@ class WipeFilesParams(ToolParams):
     ),
     category="files",
     params_model=WipeFilesParams,
-
 )
 async def wipe_files() -> ToolResult:
     scratch = ScratchSpace.get()
@@ -265,3 +264,6 @@ async def download_file(url: str, filename: str | None = None) -> ToolResult:
         target.unlink(missing_ok=True)
         logger.exception("Failed to write downloaded file")
         return ToolResult(error=f"Write failed: {exc}")
+    finally:
+        # Streamed straight to disk, bypassing ScratchSpace.write()
+        scratch.invalidate_total_size()
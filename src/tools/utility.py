@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 
 from pydantic import Field
 
+from src.config import settings
 from src.db import get_connection
 from src.tools.base import ToolParams, ToolResult
 from src.tools.registry import registry
@@ -38,18 +39,40 @@ async def get_current_datetime() -> ToolResult:
 # ---------------------------------------------------------------------------
 
 
+_CREATE_NOTES_TABLE = """
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+_INSERT_NOTE = "INSERT INTO notes (title, content, created_at) VALUES (?, ?, ?)"
+_SEARCH_NOTES = """
+SELECT id, title, content, created_at FROM notes
+WHERE title LIKE ? OR content LIKE ?
+ORDER BY created_at DESC
+LIMIT 20
+"""
+_SELECT_NOTE = "SELECT id, title FROM notes WHERE id = ?"
+_DELETE_NOTE = "DELETE FROM notes WHERE id = ?"
+
+# Databases (Turso URL or local path) whose notes table is known to exist
+_notes_ready: set[str] = set()
+
+
 async def _ensure_notes_table():
-    """Open the DB and ensure the notes table exists."""
+    """Open the DB, creating the notes table on first use of that database."""
     db = await get_connection()
-    await db.execute("""
-        CREATE TABLE IF NOT EXISTS notes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            created_at TEXT NOT NULL
-        )
-    """)
-    await db.commit()
+    target = settings.turso_database_url or str(settings.database_path)
+    if target not in _notes_ready:
+        try:
+            await db.execute(_CREATE_NOTES_TABLE)
+            await db.commit()
+        except BaseException:
+            await db.close()
+            raise
+        _notes_ready.add(target)
     return db
 
 
@@ -67,10 +90,7 @@ class SaveNoteParams(ToolParams):
 async def save_note(title: str, content: str) -> ToolResult:
     db = await _ensure_notes_table()
     try:
-        await db.execute(
-            "INSERT INTO notes (title, content, created_at) VALUES (?, ?, ?)",
-            (title, content, datetime.now(UTC).isoformat()),
-        )
+        await db.execute(_INSERT_NOTE, (title, content, datetime.now(UTC).isoformat()))
         await db.commit()
         logger.info("Saved note: %s", title)
         return ToolResult(data={"saved": True, "title": title})
@@ -92,15 +112,7 @@ async def search_notes(query: str) -> ToolResult:
     db = await _ensure_notes_table()
     try:
         pattern = f"%{query}%"
-        cursor = await db.execute(
-            """
-            SELECT id, title, content, created_at FROM notes
-            WHERE title LIKE ? OR content LIKE ?
-            ORDER BY created_at DESC
-            LIMIT 20
-            """,
-            (pattern, pattern),
-        )
+        cursor = await db.execute(_SEARCH_NOTES, (pattern, pattern))
         rows = await cursor.fetchall()
         # libsql returns tuples — use positional indexing matching SELECT order
         notes = [
@@ -131,11 +143,11 @@ class DeleteNoteParams(ToolParams):
 async def delete_note(note_id: int) -> ToolResult:
     db = await _ensure_notes_table()
     try:
-        cursor = await db.execute("SELECT id, title FROM notes WHERE id = ?", (note_id,))
+        cursor = await db.execute(_SELECT_NOTE, (note_id,))
         row = await cursor.fetchone()
         if row is None:
             return ToolResult(error=f"Note with id {note_id} not found.")
-        await db.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+        await db.execute(_DELETE_NOTE, (note_id,))
         await db.commit()
         logger.info("Deleted note %d: %s", row[0], row[1])
         return ToolResult(data={"deleted": True, "id": row[0], "title": row[1]})
@@ -100,6 +100,8 @@ def _extract_links(html: str, base_url: str) -> list[dict[str, str]]:
     ),
     category="research",
     params_model=WebSearchParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def web_search(query: str, count: int = 5) -> ToolResult:
     api_key = settings.brave_search_api_key
@@ -149,6 +151,8 @@ async def web_search(query: str, count: int = 5) -> ToolResult:
     ),
     category="research",
     params_model=ReadWebpageParams,
+    parallel_safe=True,
+    side_effect_free=True,
 )
 async def read_webpage(url: str, max_length: int = 5000) -> ToolResult:
     try:
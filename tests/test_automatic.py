@@ -3,13 +3,25 @@
 import json
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
+import src.memory.automatic as automatic_module
 from src.memory.automatic import (
     ExtractionResult,
+    _has_complete_json,
+    _load_rules,
     build_extraction_prompt,
     extract_and_save,
     parse_extraction_result,
 )
 
+
+@pytest.fixture(autouse=True)
+def _fresh_extraction_sem(monkeypatch):
+    monkeypatch.setattr(automatic_module, "_extraction_sem", None)
+    monkeypatch.setattr(automatic_module, "_waiting_extractions", 0)
+
+
 # -- build_extraction_prompt -------------------------------------------------
 
 
@@ -35,11 +47,41 @@ def test_prompt_includes_recent_history() -> None:
     assert "<recent_history>" in prompt
 
 
+def test_prompt_history_skips_non_text_content() -> None:
+    history = [
+        {"role": "user", "content": [{"type": "image"}]},
+        {"role": "assistant", "content": "Text reply"},
+    ]
+    prompt = build_extraction_prompt("new msg", "new reply", history)
+    assert "<recent_history>\n<assistant>Text reply</assistant>\n</recent_history>" in prompt
+
+
 def test_prompt_empty_history() -> None:
     prompt = build_extraction_prompt("hello", "hi", [])
     assert "<recent_history>" not in prompt
 
 
+# -- _load_rules -------------------------------------------------------------
+
+
+def test_load_rules_default_when_missing(tmp_path) -> None:
+    with patch("src.memory.automatic.CONFIG_DIR", tmp_path):
+        assert "JSON" in _load_rules()
+
+
+def test_load_rules_cached_until_file_changes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(automatic_module, "_rules_cache", None)
+    rules = tmp_path / "MEMORY_RULES.md"
+    rules.write_text("v1")
+
+    with patch("src.memory.automatic.CONFIG_DIR", tmp_path):
+        assert _load_rules() == "v1"
+        with patch("pathlib.Path.read_text", side_effect=AssertionError("re-read")):
+            assert _load_rules() == "v1"
+        rules.write_text("version 2")
+        assert _load_rules() == "version 2"
+
+
 # -- parse_extraction_result -------------------------------------------------
 
 
@@ -97,6 +139,31 @@ def test_parse_json_in_markdown_fences() -> None:
     assert len(result.memories) == 1
 
 
+def test_parse_fenced_json_with_surrounding_prose() -> None:
+    inner = json.dumps({"memories": [{"content": "test", "importance": "high"}]})
+    raw = f"Here is the analysis:\n```\n{inner}\n```\nLet me know!"
+    result = parse_extraction_result(raw)
+    assert [m.content for m in result.memories] == ["test"]
+
+
+def test_parse_fence_without_json_returns_empty() -> None:
+    result = parse_extraction_result("```\nnothing here\n```")
+    assert result.memories == []
+
+
+def test_parse_fenced_json_without_closing_fence() -> None:
+    inner = json.dumps({"memories": [{"content": "test", "importance": "high"}]})
+    result = parse_extraction_result(f"```json\n{inner}")
+    assert [m.content for m in result.memories] == ["test"]
+
+
+def test_has_complete_json() -> None:
+    assert not _has_complete_json('{"memories": [')
+    assert not _has_complete_json('{"memories": [{"content": "a}"}')
+    assert _has_complete_json('{"memories": []}')
+    assert _has_complete_json('```json\n{"memories": [], "topic_switch": null}')
+
+
 def test_parse_skips_empty_content() -> None:
     raw = json.dumps({
         "memories": [
@@ -127,15 +194,25 @@ async def test_extract_saves_medium_and_high_only() -> None:
 
     with (
         patch("src.memory.automatic.MemoryStore.get", return_value=mock_store),
-        patch("src.llm.client.complete_text", new_callable=AsyncMock, return_value=response_json),
+        patch(
+            "src.llm.client.complete_text_stream",
+            new_callable=AsyncMock,
+            return_value=response_json,
+        ),
         patch("src.memory.automatic.settings") as mock_settings,
     ):
         mock_settings.memory_extraction_enabled = True
+        mock_settings.memory_extraction_concurrency = 2
 
-        await extract_and_save("hello", "hi", [], "conv_1")
+        await extract_and_save(
+            "I just moved to Denver and prefer oat milk", "Noted, welcome to Denver!", [], "conv_1"
+        )
 
-    # Only high and medium should be saved (2 of 3)
-    assert mock_store.add.call_count == 2
+    # Only high and medium should be saved (2 of 3), in one batch
+    mock_store.add_many.assert_awaited_once()
+    items = mock_store.add_many.call_args[0][0]
+    assert [i["content"] for i in items] == ["Important fact", "Useful detail"]
+    assert mock_store.add_many.call_args[1]["source"] == "automatic"
 
 
 async def test_extract_saves_topic_switch() -> None:
@@ -154,17 +231,105 @@ async def test_extract_saves_topic_switch() -> None:
 
     with (
         patch("src.memory.automatic.MemoryStore.get", return_value=mock_store),
-        patch("src.llm.client.complete_text", new_callable=AsyncMock, return_value=response_json),
+        patch(
+            "src.llm.client.complete_text_stream",
+            new_callable=AsyncMock,
+            return_value=response_json,
+        ),
+        patch("src.memory.automatic.settings") as mock_settings,
+    ):
+        mock_settings.memory_extraction_enabled = True
+        mock_settings.memory_extraction_concurrency = 2
+
+        await extract_and_save(
+            "Let's switch topics to the vendor shortlist", "Sure, what's first?", [], "conv_1"
+        )
+
+    items = mock_store.add_many.call_args[0][0]
+    assert len(items) == 1
+    assert items[0]["category"] == "workstream"
+    assert "Budget" in items[0]["content"]
+
+
+async def test_extraction_concurrency_capped_and_backlog_shed() -> None:
+    import asyncio
+
+    mock_store = AsyncMock()
+    mock_store.enabled = True
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def slow_complete(*_args, **_kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return '{"memories": []}'
+
+    total = 2 + automatic_module._MAX_WAITING_EXTRACTIONS + 3
+    with (
+        patch("src.memory.automatic.MemoryStore.get", return_value=mock_store),
+        patch("src.llm.client.complete_text_stream", side_effect=slow_complete) as complete,
+        patch("src.memory.automatic.settings") as mock_settings,
+    ):
+        mock_settings.memory_extraction_enabled = True
+        mock_settings.memory_extraction_concurrency = 2
+
+        tasks = [
+            asyncio.create_task(
+                extract_and_save(f"Message {i} about the quarterly budget", "Got it.", [], "c")
+            )
+            for i in range(total)
+        ]
+        await asyncio.sleep(0.01)
+        assert running == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert peak == 2
+    # The 3 arrivals beyond the waiting limit were dropped
+    assert complete.call_count == 2 + automatic_module._MAX_WAITING_EXTRACTIONS
+
+
+async def test_extract_skips_trivial_exchanges() -> None:
+    mock_store = AsyncMock()
+    mock_store.enabled = True
+
+    with (
+        patch("src.memory.automatic.MemoryStore.get", return_value=mock_store),
+        patch("src.llm.client.complete_text_stream", new_callable=AsyncMock) as complete,
+        patch("src.memory.automatic.settings") as mock_settings,
+    ):
+        mock_settings.memory_extraction_enabled = True
+        mock_settings.memory_extraction_concurrency = 2
+
+        await extract_and_save("ok", "Great!", [], "conv_1")
+        await extract_and_save("Thanks, got it!", "Great, thank you! Cool, cool, nice.", [], "c")
+
+    complete.assert_not_awaited()
+
+
+async def test_extract_runs_for_short_confirmation_of_substantial_reply() -> None:
+    mock_store = AsyncMock()
+    mock_store.enabled = True
+
+    with (
+        patch("src.memory.automatic.MemoryStore.get", return_value=mock_store),
+        patch(
+            "src.llm.client.complete_text_stream", new_callable=AsyncMock, return_value="{}"
+        ) as complete,
         patch("src.memory.automatic.settings") as mock_settings,
     ):
         mock_settings.memory_extraction_enabled = True
+        mock_settings.memory_extraction_concurrency = 2
 
-        await extract_and_save("let's switch topics", "sure", [], "conv_1")
+        await extract_and_save(
+            "yes", "Booked the Lisbon flight for June 3 and cancelled the Porto hotel.", [], "c"
+        )
 
-    assert mock_store.add.call_count == 1
-    call_kwargs = mock_store.add.call_args[1]
-    assert call_kwargs["category"] == "workstream"
-    assert "Budget" in call_kwargs["content"]
+    complete.assert_awaited_once()
 
 
 async def test_extract_disabled_is_noop() -> None:
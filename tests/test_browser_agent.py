@@ -1,10 +1,10 @@
 """Tests for BrowserAgent — the autonomous navigation loop."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.browser.agent import BrowserAgent, BrowseResult
+from src.browser.agent import _INTERACTIVE_SELECTORS, BrowserAgent, BrowseResult
 
 
 @pytest.fixture
@@ -13,7 +13,10 @@ def mock_page():
     page = AsyncMock()
     page.url = "https://example.com"
     page.goto = AsyncMock()
-    page.evaluate = AsyncMock(return_value=[])
+    page.evaluate = AsyncMock()
+    locator = MagicMock()
+    locator.evaluate_all = AsyncMock(return_value=[])
+    page.locator = MagicMock(return_value=locator)
     page.screenshot = AsyncMock(return_value=b"\x89PNG fake screenshot data")
     page.mouse = AsyncMock()
     page.keyboard = AsyncMock()
@@ -25,8 +28,8 @@ def mock_page():
 
 @pytest.fixture
 def _mock_complete_text():
-    """Patch complete_text used by BrowserAgent."""
-    with patch("src.llm.client.complete_text", new_callable=AsyncMock) as mock:
+    """Patch complete_text_stream used by BrowserAgent."""
+    with patch("src.llm.client.complete_text_stream", new_callable=AsyncMock) as mock:
         yield mock
 
 
@@ -43,10 +46,11 @@ class TestBrowserAgent:
         assert result.summary == "Page says hello world."
         assert result.steps_taken == 1
         mock_page.goto.assert_called_once()
+        mock_page.locator.assert_called_once_with(_INTERACTIVE_SELECTORS)
 
     async def test_click_then_done(self, mock_page, _mock_complete_text):
         """Agent clicks an element, then completes."""
-        mock_page.evaluate.return_value = [
+        mock_page.locator.return_value.evaluate_all.return_value = [
             {
                 "index": 0, "tag": "a", "type": "", "text": "Click me",
                 "href": "/next", "name": "", "x": 100, "y": 200,
@@ -67,7 +71,7 @@ class TestBrowserAgent:
 
     async def test_fill_action(self, mock_page, _mock_complete_text):
         """Agent fills a text input."""
-        mock_page.evaluate.return_value = [
+        mock_page.locator.return_value.evaluate_all.return_value = [
             {
                 "index": 0, "tag": "input", "type": "text", "text": "",
                 "href": "", "name": "search", "x": 300, "y": 100,
@@ -160,7 +164,7 @@ class TestBrowserAgent:
 
     async def test_select_action(self, mock_page, _mock_complete_text):
         """Agent selects a dropdown option."""
-        mock_page.evaluate.return_value = [
+        mock_page.locator.return_value.evaluate_all.return_value = [
             {
                 "index": 0, "tag": "select", "type": "", "text": "Option A",
                 "href": "", "name": "color", "x": 200, "y": 150,
@@ -217,6 +221,37 @@ class TestParseAction:
         assert result["action"] == "done"
 
 
+class TestHasCompleteAction:
+    """Test the early-stop probe used while streaming Claude's reply."""
+
+    def test_complete_object(self):
+        assert BrowserAgent._has_complete_action('{"action": "click", "index": 3}')
+
+    def test_partial_object(self):
+        assert not BrowserAgent._has_complete_action('{"action": "done", "summ')
+
+    def test_brace_inside_string_is_not_the_end(self):
+        assert not BrowserAgent._has_complete_action('{"action": "done", "summary": "a}')
+
+    def test_object_inside_fence(self):
+        assert BrowserAgent._has_complete_action('```json\n{"action": "scroll"}')
+
+    def test_object_without_action(self):
+        assert not BrowserAgent._has_complete_action('{"foo": "bar"}')
+
+    def test_no_object(self):
+        assert not BrowserAgent._has_complete_action("Thinking about it")
+
+    async def test_ask_claude_passes_probe(self, mock_page, _mock_complete_text):
+        _mock_complete_text.return_value = '{"action": "done", "summary": "ok"}'
+
+        agent = BrowserAgent(mock_page, "Read", max_steps=1)
+        await agent.run("https://example.com")
+
+        call_kwargs = _mock_complete_text.call_args.kwargs
+        assert call_kwargs["stop_when"] == BrowserAgent._has_complete_action
+
+
 class TestFormatElements:
     def test_format_mixed_elements(self):
         elements = [
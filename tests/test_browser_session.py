@@ -7,7 +7,7 @@ import pytest
 
 @pytest.fixture
 def _mock_playwright(tmp_path, monkeypatch):
-    """Mock the entire Playwright stack (persistent context + stealth)."""
+    """Mock the entire Playwright stack (browser + context + stealth)."""
     monkeypatch.setattr("src.browser.session.settings.browser_profile_dir", tmp_path / "profile")
 
     page = AsyncMock()
@@ -15,8 +15,11 @@ def _mock_playwright(tmp_path, monkeypatch):
     context.new_page.return_value = page
     context.set_default_timeout = MagicMock()
 
+    browser = AsyncMock()
+    browser.new_context.return_value = context
+
     pw = AsyncMock()
-    pw.chromium.launch_persistent_context.return_value = context
+    pw.chromium.launch.return_value = browser
 
     pw_cm = AsyncMock()
     pw_cm.start.return_value = pw
@@ -33,6 +36,7 @@ def _mock_playwright(tmp_path, monkeypatch):
         yield {
             "playwright": pw,
             "pw_cm": pw_cm,
+            "browser": browser,
             "context": context,
             "page": page,
             "stealth_cls": stealth_cls,
@@ -47,11 +51,12 @@ class TestBrowserSession:
         session = BrowserSession(timeout_ms=5000)
         await session.start()
 
-        # Persistent context was launched
-        _mock_playwright["playwright"].chromium.launch_persistent_context.assert_called_once()
-        call_kwargs = _mock_playwright["playwright"].chromium.launch_persistent_context.call_args
-        assert call_kwargs.kwargs["headless"] is True
-        assert call_kwargs.kwargs["user_data_dir"] == str(tmp_path / "profile")
+        # Browser was launched and a fresh context created (no saved state yet)
+        _mock_playwright["playwright"].chromium.launch.assert_called_once()
+        launch_kwargs = _mock_playwright["playwright"].chromium.launch.call_args
+        assert launch_kwargs.kwargs["headless"] is True
+        context_kwargs = _mock_playwright["browser"].new_context.call_args
+        assert context_kwargs.kwargs["storage_state"] is None
 
         # Timeout was set
         _mock_playwright["context"].set_default_timeout.assert_called_once_with(5000)
@@ -62,11 +67,41 @@ class TestBrowserSession:
             _mock_playwright["context"]
         )
 
-        # Stop cleans up (no browser.close — persistent context only)
+        # Stop saves state and cleans up
         await session.stop()
+        _mock_playwright["context"].storage_state.assert_called_once_with(
+            path=str(tmp_path / "profile" / "storage_state.json")
+        )
         _mock_playwright["context"].close.assert_called_once()
+        _mock_playwright["browser"].close.assert_called_once()
         _mock_playwright["playwright"].stop.assert_called_once()
 
+    async def test_loads_saved_storage_state(self, _mock_playwright, tmp_path):
+        from src.browser.session import BrowserSession
+
+        state_file = tmp_path / "profile" / "storage_state.json"
+        state_file.parent.mkdir(parents=True)
+        state_file.write_text('{"cookies": [], "origins": []}')
+
+        session = BrowserSession()
+        await session.start()
+
+        context_kwargs = _mock_playwright["browser"].new_context.call_args
+        assert context_kwargs.kwargs["storage_state"] == str(state_file)
+        await session.stop()
+
+    async def test_storage_state_save_failure_still_closes(self, _mock_playwright):
+        from src.browser.session import BrowserSession
+
+        _mock_playwright["context"].storage_state.side_effect = RuntimeError("disk full")
+
+        session = BrowserSession()
+        await session.start()
+        await session.stop()
+
+        _mock_playwright["context"].close.assert_called_once()
+        _mock_playwright["browser"].close.assert_called_once()
+
     async def test_context_manager(self, _mock_playwright):
         from src.browser.session import BrowserSession
 
@@ -116,6 +151,17 @@ class TestBrowserSession:
         assert profile_dir.is_dir()
         await session.stop()
 
+    async def test_profile_dir_created_once(self, _mock_playwright):
+        from src.browser.session import BrowserSession
+
+        with patch("pathlib.Path.mkdir") as mkdir:
+            for _ in range(3):
+                session = BrowserSession()
+                await session.start()
+                await session.stop()
+
+        mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
     async def test_stealth_failure_does_not_crash(self, tmp_path, monkeypatch):
         """If stealth import/apply fails, the session still starts."""
         monkeypatch.setattr(
@@ -126,8 +172,11 @@ class TestBrowserSession:
         context.set_default_timeout = MagicMock()
         context.new_page.return_value = AsyncMock()
 
+        browser = AsyncMock()
+        browser.new_context.return_value = context
+
         pw = AsyncMock()
-        pw.chromium.launch_persistent_context.return_value = context
+        pw.chromium.launch.return_value = browser
 
         pw_cm = AsyncMock()
         pw_cm.start.return_value = pw
@@ -152,25 +201,16 @@ class TestBrowserSession:
         session = BrowserSession()
         await session.start()
 
-        call_kwargs = _mock_playwright["playwright"].chromium.launch_persistent_context.call_args
+        call_kwargs = _mock_playwright["browser"].new_context.call_args
         assert "Chrome/131" in call_kwargs.kwargs["user_agent"]
         await session.stop()
 
-    async def test_context_manager_releases_lock_on_start_failure(self, tmp_path, monkeypatch):
-        """If start() fails, the profile lock is released."""
-        monkeypatch.setattr(
-            "src.browser.session.settings.browser_profile_dir", tmp_path / "profile"
-        )
-
-        pw_cm = AsyncMock()
-        pw_cm.start.side_effect = RuntimeError("launch failed")
-
-        with patch("src.browser.session.async_playwright", return_value=pw_cm):
-            from src.browser.session import BrowserSession, _profile_lock
+    async def test_concurrent_sessions_do_not_block(self, _mock_playwright):
+        """Sessions no longer share a profile lock — they can be open at once."""
+        from src.browser.session import BrowserSession
 
-            with pytest.raises(RuntimeError, match="launch failed"):
-                async with BrowserSession():
-                    pass  # pragma: no cover
+        async with BrowserSession() as first, BrowserSession() as second:
+            assert await first.new_page() is _mock_playwright["page"]
+            assert await second.new_page() is _mock_playwright["page"]
 
-            # Lock was released despite failure
-            assert not _profile_lock.locked()
+        assert _mock_playwright["browser"].new_context.call_count == 2
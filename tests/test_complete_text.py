@@ -1,8 +1,9 @@
-"""Tests for complete_text() bare LLM call."""
+"""Tests for complete_text() / complete_text_stream() bare LLM calls."""
 
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.llm.client import complete_text
+from src.llm.client import complete_text, complete_text_stream
 
 
 async def test_complete_text_basic() -> None:
@@ -88,3 +89,93 @@ async def test_complete_text_omits_system_when_none() -> None:
 
     call_kwargs = mock_client.messages.create.call_args.kwargs
     assert "system" not in call_kwargs
+
+
+def _make_stream_client(chunks: list[str]) -> tuple[MagicMock, list[str]]:
+    """Mock client whose messages.stream yields ``chunks``; records what was consumed."""
+    consumed: list[str] = []
+
+    class _Stream:
+        @property
+        async def text_stream(self):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+    client = MagicMock()
+    client.stream_kwargs = {}
+
+    @asynccontextmanager
+    async def _stream(**kwargs):
+        client.stream_kwargs = kwargs
+        yield _Stream()
+
+    client.messages.stream = _stream
+    return client, consumed
+
+
+async def test_complete_text_stream_joins_chunks() -> None:
+    client, _ = _make_stream_client(["hel", "lo ", "world"])
+
+    with patch("src.llm.client._get_client", return_value=client):
+        result = await complete_text_stream(
+            [{"role": "user", "content": "hi"}],
+            model="claude-test-model",
+            max_tokens=256,
+        )
+
+    assert result == "hello world"
+    assert client.stream_kwargs["model"] == "claude-test-model"
+    assert client.stream_kwargs["max_tokens"] == 256
+    assert "system" not in client.stream_kwargs
+
+
+async def test_complete_text_stream_stops_early() -> None:
+    client, consumed = _make_stream_client(['{"a": ', "1}", " trailing", " text"])
+
+    with patch("src.llm.client._get_client", return_value=client):
+        result = await complete_text_stream(
+            [{"role": "user", "content": "hi"}],
+            model="claude-test-model",
+            stop_when=lambda text: text.endswith("}"),
+        )
+
+    assert result == '{"a": 1}'
+    assert consumed == ['{"a": ', "1}"]
+
+
+async def test_complete_text_stream_checks_only_after_closing_brace() -> None:
+    client, _ = _make_stream_client(['{"a": ', "[1, ", "2]", "}\n", "more"])
+    seen: list[str] = []
+
+    def stop_when(text: str) -> bool:
+        seen.append(text)
+        return True
+
+    with patch("src.llm.client._get_client", return_value=client):
+        result = await complete_text_stream(
+            [{"role": "user", "content": "hi"}],
+            model="claude-test-model",
+            stop_when=stop_when,
+        )
+
+    assert seen == ['{"a": [1, 2]}\n']
+    assert result == '{"a": [1, 2]}\n'
+
+
+async def test_shared_client_uses_tuned_http2_pool(monkeypatch) -> None:
+    import src.llm.client as client_module
+
+    monkeypatch.setattr(client_module, "_client", None)
+    with patch(
+        "src.llm.client.anthropic.DefaultAsyncHttpxClient",
+        wraps=client_module.anthropic.DefaultAsyncHttpxClient,
+    ) as mock_http:
+        client = client_module._get_client()
+        assert client_module._get_client() is client
+
+    mock_http.assert_called_once_with(limits=client_module._HTTP_LIMITS, http2=True)
+    with patch.object(client, "close", new_callable=AsyncMock) as mock_close:
+        await client_module.close_client()
+    mock_close.assert_awaited_once()
+    assert client_module._client is None
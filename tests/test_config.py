@@ -22,23 +22,39 @@ class TestGetAllowedUserIds:
         s = Settings(allowed_user_ids="42")
         assert s.get_allowed_user_ids() == {42}
 
+    def test_returns_cached_frozenset(self):
+        s = Settings(allowed_user_ids="1,2")
+        ids = s.get_allowed_user_ids()
+        assert isinstance(ids, frozenset)
+        assert s.get_allowed_user_ids() is ids
+
 
 class TestGetGoogleAccounts:
     def test_parses_comma_separated(self):
         s = Settings(google_accounts="work,personal")
-        assert s.get_google_accounts() == ["work", "personal"]
+        assert s.get_google_accounts() == ("work", "personal")
 
     def test_handles_spaces(self):
         s = Settings(google_accounts=" work , personal ")
-        assert s.get_google_accounts() == ["work", "personal"]
+        assert s.get_google_accounts() == ("work", "personal")
 
-    def test_empty_string_returns_empty_list(self):
+    def test_empty_string_returns_empty_tuple(self):
         s = Settings(google_accounts="")
-        assert s.get_google_accounts() == []
+        assert s.get_google_accounts() == ()
 
     def test_single_account(self):
         s = Settings(google_accounts="main")
-        assert s.get_google_accounts() == ["main"]
+        assert s.get_google_accounts() == ("main",)
+
+    def test_parsed_once_per_value(self):
+        s = Settings(google_accounts="work,personal")
+        assert s.get_google_accounts() is s.get_google_accounts()
+
+    def test_reassignment_is_picked_up(self):
+        s = Settings(google_accounts="work")
+        assert s.get_google_accounts() == ("work",)
+        s.google_accounts = "work,personal"
+        assert s.get_google_accounts() == ("work", "personal")
 
 
 class TestDefaults:
@@ -69,6 +85,36 @@ class TestDefaults:
         assert s.memory_extraction_enabled is True
 
 
+class TestForTests:
+    def test_uses_field_defaults(self):
+        s = Settings.for_tests()
+        assert s.default_memory_model == "haiku"
+        assert s.webhook_port == 8443
+
+    def test_applies_overrides(self):
+        s = Settings.for_tests(google_accounts="work", webhook_port=9000)
+        assert s.get_google_accounts() == ("work",)
+        assert s.webhook_port == 9000
+
+    def test_ignores_environment(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_ACCOUNTS", "from-env")
+        assert Settings.for_tests().google_accounts == ""
+
+
+class TestLazySettings:
+    def test_settings_is_cached_singleton(self):
+        import src.config
+
+        assert src.config.settings is src.config.get_settings()
+        assert isinstance(src.config.settings, Settings)
+
+    def test_unknown_attribute_raises(self):
+        import src.config
+
+        with pytest.raises(AttributeError):
+            src.config.not_a_setting  # noqa: B018
+
+
 class TestExtraForbidden:
     def test_unknown_env_var_raises(self):
         with pytest.raises(ValueError, match="extra_forbidden"):
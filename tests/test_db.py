@@ -1,10 +1,12 @@
 """Tests for async database connection abstraction."""
 
+import asyncio
+import threading
 from pathlib import Path
 
 import pytest
 
-from src.db import _AsyncConnection, get_connection
+from src.db import _AsyncConnection, _ConnectionPool, _run, get_connection
 
 pytestmark = pytest.mark.usefixtures("_no_turso")
 
@@ -21,6 +23,23 @@ class TestGetConnection:
         assert db_path.parent.exists()
         await conn.close()
 
+    async def test_local_pragmas_applied(self, tmp_path: Path):
+        conn = await get_connection(local_path_override=tmp_path / "test.db")
+        results = {}
+        pragmas = ("journal_mode", "busy_timeout", "synchronous", "temp_store", "cache_size")
+        for pragma in (*pragmas, "mmap_size"):
+            cursor = await conn.execute(f"PRAGMA {pragma}")
+            results[pragma] = (await cursor.fetchone())[0]
+        await conn.close()
+        assert results == {
+            "journal_mode": "wal",
+            "busy_timeout": 5000,
+            "synchronous": 1,  # NORMAL
+            "temp_store": 2,  # MEMORY
+            "cache_size": -20000,
+            "mmap_size": 268435456,
+        }
+
 
 class TestAsyncConnection:
     async def test_execute_and_fetchall(self, tmp_path: Path):
@@ -64,3 +83,173 @@ class TestAsyncConnection:
         cursor = await conn.execute("DELETE FROM t")
         assert cursor.rowcount == 2
         await conn.close()
+
+
+class TestConnectionPool:
+    @pytest.fixture(autouse=True)
+    def _local_db(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("src.config.settings.database_path", tmp_path / "pool.db")
+        monkeypatch.setattr("src.db._pools", {})
+
+    async def test_close_returns_connection_to_pool(self):
+        first = await get_connection()
+        raw = first._conn
+        await first.close()
+
+        second = await get_connection()
+        assert second._conn is raw
+        await second.close()
+
+    async def test_double_close_returns_connection_once(self):
+        first = await get_connection()
+        await first.close()
+        await first.close()
+
+        second = await get_connection()
+        waiter = asyncio.create_task(get_connection())
+        await asyncio.sleep(0.05)
+        # The second close() didn't put a duplicate in the pool to hand out
+        assert not waiter.done()
+        await second.close()
+        third = await asyncio.wait_for(waiter, timeout=1)
+        assert third._conn is second._conn
+        await third.close()
+
+    async def test_uncommitted_work_rolled_back_on_release(self):
+        conn = await get_connection()
+        await conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        await conn.commit()
+        await conn.execute("INSERT INTO t (id) VALUES (1)")
+        await conn.close()  # no commit
+
+        conn = await get_connection()
+        cursor = await conn.execute("SELECT COUNT(*) FROM t")
+        assert await cursor.fetchone() == (0,)
+        await conn.close()
+
+    async def test_pool_is_bounded(self):
+        from src.db import _LOCAL_POOL_SIZE
+
+        held = [await get_connection() for _ in range(_LOCAL_POOL_SIZE)]
+        waiter = asyncio.create_task(get_connection())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await held[0].close()
+        extra = await asyncio.wait_for(waiter, timeout=1)
+        assert extra._conn is held[0]._conn
+
+        await extra.close()
+        for conn in held[1:]:
+            await conn.close()
+
+    async def test_close_pools_closes_idle_connections(self):
+        import src.db as db
+
+        conn = await get_connection()
+        raw = conn._conn
+        await conn.close()
+
+        await db.close_pools()
+        assert db._pools == {}
+
+        fresh = await get_connection()
+        assert fresh._conn is not raw
+        await fresh.close()
+
+    async def test_read_only_connection(self):
+        writer = await get_connection()
+        await writer.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        await writer.execute("INSERT INTO t (id) VALUES (1)")
+        await writer.commit()
+        await writer.close()
+
+        reader = await get_connection(read_only=True)
+        try:
+            cursor = await reader.execute("SELECT COUNT(*) FROM t")
+            assert await cursor.fetchone() == (1,)
+            with pytest.raises(ValueError, match="readonly"):
+                await reader.execute("INSERT INTO t (id) VALUES (2)")
+            name = await _run(reader._executor, lambda: threading.current_thread().name)
+            assert name.startswith("libsql-read")
+        finally:
+            await reader.close()
+
+    async def test_read_only_does_not_wait_for_writer(self):
+        writer = await get_connection()
+        await writer.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        await writer.commit()
+        try:
+            # The only writer connection is borrowed; a read still goes through
+            reader = await asyncio.wait_for(get_connection(read_only=True), timeout=1)
+            cursor = await reader.execute("SELECT COUNT(*) FROM t")
+            assert await cursor.fetchone() == (0,)
+            await reader.close()
+        finally:
+            await writer.close()
+
+
+class _FakeConn:
+    def __init__(self, *, fail_rollback: bool = False) -> None:
+        self.in_transaction = True
+        self.fail_rollback = fail_rollback
+
+    def rollback(self) -> None:
+        if self.fail_rollback:
+            raise RuntimeError("rollback failed")
+        self.in_transaction = False
+
+
+class TestConnectionPoolRecovery:
+    async def test_failed_rollback_frees_the_slot(self):
+        conns = iter([_FakeConn(fail_rollback=True), _FakeConn()])
+        pool = _ConnectionPool(lambda: next(conns), max_size=1)
+
+        broken = await pool.acquire()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.05)
+        with pytest.raises(RuntimeError, match="rollback failed"):
+            await broken.close()
+
+        # The waiter gets a freshly opened connection, not the broken one
+        fresh = await asyncio.wait_for(waiter, timeout=1)
+        assert fresh._conn is not broken._conn
+        await fresh.close()
+
+    async def test_cancelled_release_frees_the_slot(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        class _SlowConn(_FakeConn):
+            def rollback(self) -> None:
+                started.set()
+                release.wait(1)
+
+        conns = iter([_SlowConn(), _FakeConn()])
+        pool = _ConnectionPool(lambda: next(conns), max_size=1)
+        borrowed = await pool.acquire()
+        closing = asyncio.create_task(borrowed.close())
+        await asyncio.to_thread(started.wait, 1)
+        closing.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await closing
+        release.set()
+
+        fresh = await asyncio.wait_for(pool.acquire(), timeout=1)
+        assert fresh._conn is not borrowed._conn
+
+    async def test_acquire_times_out(self):
+        pool = _ConnectionPool(_FakeConn, max_size=1)
+        held = await pool.acquire()
+        with pytest.raises(TimeoutError):
+            await pool.acquire(timeout=0.05)
+        await held.close()
+        assert (await pool.acquire(timeout=0.05))._conn is held._conn
+
+
+class TestLocalExecutor:
+    async def test_local_calls_run_on_dedicated_thread(self, tmp_path: Path):
+        conn = await get_connection(local_path_override=tmp_path / "test.db")
+        name = await _run(conn._executor, lambda: threading.current_thread().name)
+        assert name.startswith("libsql")
+        await conn.close()
@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import anthropic
 
-from src.llm.client import generate_response
+from src.llm.client import _split_content, generate_response
 from src.notifications.context import MessageContext
 from src.tools.base import ToolResult
 from src.tools.registry import ToolDef
@@ -173,6 +173,7 @@ async def test_model_param_overrides_default() -> None:
         result = await generate_response(
             [{"role": "user", "content": "hi"}],
             model="claude-opus-4-6-20250612",
+            on_text_delta=AsyncMock(),
         )
 
     assert result == "Hello!"
@@ -237,6 +238,295 @@ async def test_text_not_retracted_for_non_confirmation_tools() -> None:
     assert "Here are your tasks." in result
 
 
+async def test_multi_chunk_rounds_joined_with_separator() -> None:
+    """Deltas are joined in order, with a blank line between rounds."""
+    round1 = _FakeStream(
+        ["Let me ", "look."],
+        [_FakeBlock(type="tool_use", id="tool1", name="list_scheduled_tasks", input={})],
+    )
+    round2 = _FakeStream(["Done", "."], [_FakeBlock(type="text", text="Done.")])
+    mock_client = _make_mock_client([round1, round2])
+
+    mock_registry = MagicMock()
+    mock_registry.get_schemas.return_value = [{"name": "list_scheduled_tasks"}]
+    mock_registry.requires_confirmation.return_value = False
+    mock_registry.execute = AsyncMock(return_value=ToolResult(data={"tasks": []}))
+
+    with (
+        patch("src.llm.client._get_client", return_value=mock_client),
+        patch("src.llm.client.build_system_prompt", new_callable=AsyncMock, return_value="system"),
+        patch("src.llm.client.registry", mock_registry),
+    ):
+        result = await generate_response([{"role": "user", "content": "list my tasks"}])
+
+    assert result == "Let me look.\n\nDone."
+
+
+def test_split_content_serializes_and_collects_tool_uses() -> None:
+    text = _FakeBlock(type="text", text="Checking.")
+    call = _FakeBlock(type="tool_use", id="t1", name="search", input={"q": "x"})
+
+    serialized, tool_uses = _split_content([text, call])
+
+    assert serialized == [
+        {"type": "text", "text": "Checking."},
+        {"type": "tool_use", "id": "t1", "name": "search", "input": {"q": "x"}},
+    ]
+    assert tool_uses == [call]
+
+
+# ---------------------------------------------------------------------------
+# Tool execution within a round
+# ---------------------------------------------------------------------------
+
+
+def _tool_round(names: list[str]) -> _FakeStream:
+    blocks = [_FakeBlock(type="tool_use", id=f"id_{n}", name=n, input={}) for n in names]
+    return _FakeStream([], blocks)
+
+
+async def _run_round(names: list[str], execute, tool_defs: dict[str, ToolDef]):
+    """Run one tool round followed by a final text round; return the tool_results."""
+    captured: list[list[dict[str, Any]]] = []
+    rounds = [_tool_round(names), _make_stream("done", [_FakeBlock(type="text", text="done")])]
+    client = MagicMock()
+    call_count = 0
+
+    @asynccontextmanager
+    async def _stream(**kwargs):
+        nonlocal call_count
+        captured.append(list(kwargs["messages"]))
+        yield rounds[call_count]
+        call_count += 1
+
+    client.messages.stream = _stream
+
+    mock_registry = MagicMock()
+    mock_registry.get_schemas.return_value = [{"name": n} for n in names]
+    mock_registry.get.side_effect = tool_defs.get
+    mock_registry.requires_confirmation.return_value = False
+    mock_registry.execute = execute
+
+    with (
+        patch("src.llm.client._get_client", return_value=client),
+        patch("src.llm.client.build_system_prompt", new_callable=AsyncMock, return_value="system"),
+        patch("src.llm.client.registry", mock_registry),
+    ):
+        await generate_response([{"role": "user", "content": "go"}])
+
+    return captured[-1][-1]["content"]
+
+
+def _def(name: str, *, parallel_safe: bool = True) -> ToolDef:
+    return ToolDef(
+        name=name,
+        description=name,
+        category="test",
+        handler=AsyncMock(),
+        parallel_safe=parallel_safe,
+    )
+
+
+async def test_parallel_safe_tools_run_concurrently_in_order() -> None:
+    import asyncio
+
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    async def execute(name, _args, msg_context=None):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        # Would deadlock if the calls ran one after another
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return ToolResult(data={"tool": name})
+
+    defs = {"a": _def("a"), "b": _def("b")}
+    results = await _run_round(["a", "b"], execute, defs)
+
+    assert [r["tool_use_id"] for r in results] == ["id_a", "id_b"]
+    assert results[0]["content"] == '{"tool":"a"}'
+
+
+async def test_non_parallel_safe_tool_is_a_barrier() -> None:
+    order: list[str] = []
+
+    async def execute(name, _args, msg_context=None):
+        order.append(f"start:{name}")
+        order.append(f"end:{name}")
+        return ToolResult(data={})
+
+    defs = {"a": _def("a"), "w": _def("w", parallel_safe=False), "b": _def("b")}
+    results = await _run_round(["a", "w", "b"], execute, defs)
+
+    assert [r["tool_use_id"] for r in results] == ["id_a", "id_w", "id_b"]
+    assert order.index("end:a") < order.index("start:w") < order.index("end:w")
+    assert order.index("end:w") < order.index("start:b")
+
+
+def _def_reader(name: str) -> ToolDef:
+    tool_def = _def(name)
+    tool_def.side_effect_free = True
+    return tool_def
+
+
+def _blocks(*calls: tuple[str, dict[str, Any]]) -> list[_FakeBlock]:
+    return [
+        _FakeBlock(type="tool_use", id=f"id{i}", name=name, input=args)
+        for i, (name, args) in enumerate(calls)
+    ]
+
+
+async def _execute(blocks, defs, execute, call_cache):
+    from src.llm.client import _execute_tool_calls
+
+    mock_registry = MagicMock()
+    mock_registry.get.side_effect = defs.get
+    mock_registry.requires_confirmation.return_value = False
+    mock_registry.execute = execute
+    with patch("src.llm.client.registry", mock_registry):
+        return await _execute_tool_calls(blocks, None, None, call_cache)
+
+
+async def test_identical_read_calls_execute_once() -> None:
+    execute = AsyncMock(return_value=ToolResult(data={"ok": True}))
+    defs = {"read": _def_reader("read")}
+    cache: dict = {}
+
+    await _execute(
+        _blocks(("read", {"a": 1, "b": 2}), ("read", {"b": 2, "a": 1})), defs, execute, cache
+    )
+    results = await _execute(_blocks(("read", {"a": 1, "b": 2})), defs, execute, cache)
+
+    assert execute.await_count == 1
+    assert results[0]["tool_use_id"] == "id0"
+    assert not results[0]["is_error"]
+
+
+async def test_side_effect_tool_invalidates_read_cache() -> None:
+    execute = AsyncMock(return_value=ToolResult(data={"ok": True}))
+    defs = {"read": _def_reader("read"), "write": _def("write")}
+    cache: dict = {}
+
+    await _execute(_blocks(("read", {})), defs, execute, cache)
+    await _execute(_blocks(("write", {})), defs, execute, cache)
+    await _execute(_blocks(("read", {})), defs, execute, cache)
+
+    assert [c.args[0] for c in execute.await_args_list] == ["read", "write", "read"]
+
+
+async def test_failed_read_not_reused() -> None:
+    execute = AsyncMock(side_effect=[ToolResult(error="boom"), ToolResult(data={"ok": True})])
+    defs = {"read": _def_reader("read")}
+    cache: dict = {}
+
+    first = await _execute(_blocks(("read", {})), defs, execute, cache)
+    second = await _execute(_blocks(("read", {})), defs, execute, cache)
+
+    assert first[0]["is_error"]
+    assert not second[0]["is_error"]
+    assert execute.await_count == 2
+
+
+async def test_tool_history_cache_breakpoints_roll() -> None:
+    """From the second tool round on, the last tool_result is a cache breakpoint.
+
+    Only the two most recent breakpoints are kept.
+    """
+    rounds = [_tool_round([f"t{i}"]) for i in range(4)]
+    rounds.append(_make_stream("done", [_FakeBlock(type="text", text="done")]))
+    sent: list[dict[str, Any]] = []
+    call_count = 0
+
+    @asynccontextmanager
+    async def _stream(**kwargs):
+        nonlocal call_count
+        sent[:] = kwargs["messages"]
+        yield rounds[call_count]
+        call_count += 1
+
+    client = MagicMock()
+    client.messages.stream = _stream
+
+    mock_registry = MagicMock()
+    mock_registry.get_schemas.return_value = [{"name": "t"}]
+    mock_registry.get.return_value = None
+    mock_registry.requires_confirmation.return_value = False
+    mock_registry.execute = AsyncMock(return_value=ToolResult(data={}))
+
+    with (
+        patch("src.llm.client._get_client", return_value=client),
+        patch("src.llm.client.build_system_prompt", new_callable=AsyncMock, return_value="system"),
+        patch("src.llm.client.registry", mock_registry),
+    ):
+        await generate_response([{"role": "user", "content": "go"}])
+
+    tagged = [
+        r["tool_use_id"]
+        for m in sent
+        if m["role"] == "user" and isinstance(m["content"], list)
+        for r in m["content"]
+        if "cache_control" in r
+    ]
+    assert tagged == ["id_t2", "id_t3"]
+
+
+# ---------------------------------------------------------------------------
+# Delta coalescing
+# ---------------------------------------------------------------------------
+
+
+async def test_small_deltas_coalesced_into_fewer_callbacks() -> None:
+    round1 = _FakeStream(["ab"] * 40, [_FakeBlock(type="text", text="ab" * 40)])
+    mock_client = _make_mock_client([round1])
+    mock_registry = MagicMock()
+    mock_registry.get_schemas.return_value = []
+
+    streamed: list[str] = []
+
+    async def on_text_delta(text: str) -> None:
+        streamed.append(text)
+
+    with (
+        patch("src.llm.client._get_client", return_value=mock_client),
+        patch("src.llm.client.build_system_prompt", new_callable=AsyncMock, return_value="system"),
+        patch("src.llm.client.registry", mock_registry),
+    ):
+        result = await generate_response(
+            [{"role": "user", "content": "hi"}], on_text_delta=on_text_delta
+        )
+
+    assert "".join(streamed) == result == "ab" * 40
+    assert 1 < len(streamed) < 40
+
+
+async def test_delta_buffer_flushes_remainder() -> None:
+    from src.llm.client import _DeltaBuffer
+
+    received: list[str] = []
+
+    async def callback(text: str) -> None:
+        received.append(text)
+
+    buf = _DeltaBuffer(callback, min_chars=10, max_delay=60)
+    await buf.push("abc")
+    await buf.push("def")
+    assert received == []
+    await buf.push("ghij")
+    assert received == ["abcdefghij"]
+    await buf.push("k")
+    await buf.flush()
+    assert received == ["abcdefghij", "k"]
+
+
+async def test_delta_buffer_without_callback_is_noop() -> None:
+    from src.llm.client import _DeltaBuffer
+
+    buf = _DeltaBuffer(None)
+    await buf.push("text")
+    await buf.flush()
+
+
 # ---------------------------------------------------------------------------
 # Content filter handling
 # ---------------------------------------------------------------------------
@@ -335,6 +625,7 @@ async def test_content_filter_no_partial_text() -> None:
     ):
         result = await generate_response(
             [{"role": "user", "content": "something"}],
+            on_text_delta=AsyncMock(),
         )
 
     assert "content filter" in result.lower()
@@ -375,6 +666,7 @@ async def test_non_content_filter_api_error_reraises() -> None:
         try:
             await generate_response(
                 [{"role": "user", "content": "hi"}],
+                on_text_delta=AsyncMock(),
             )
             raised = False
         except anthropic.APIStatusError:
@@ -383,6 +675,55 @@ async def test_non_content_filter_api_error_reraises() -> None:
     assert raised, "Non-content-filter APIStatusError should propagate"
 
 
+async def test_no_tools_no_callback_skips_streaming() -> None:
+    """With no tools and no delta callback, a single create() call is made."""
+    client = MagicMock()
+    client.messages.stream = MagicMock(side_effect=AssertionError("should not stream"))
+    client.messages.create = AsyncMock(
+        return_value=MagicMock(
+            content=[_FakeBlock(type="text", text="Hello "), _FakeBlock(type="text", text="there")]
+        )
+    )
+
+    mock_registry = MagicMock()
+    mock_registry.get_schemas.return_value = []
+
+    with (
+        patch("src.llm.client._get_client", return_value=client),
+        patch("src.llm.client.build_system_prompt", new_callable=AsyncMock, return_value="system"),
+        patch("src.llm.client.registry", mock_registry),
+    ):
+        result = await generate_response([{"role": "user", "content": "hi"}])
+
+    assert result == "Hello there"
+    client.messages.create.assert_awaited_once()
+    assert "tools" not in client.messages.create.call_args.kwargs
+
+
+async def test_no_tools_fast_path_content_filter() -> None:
+    """The non-streaming fast path maps content-filter errors to the friendly message."""
+    client = MagicMock()
+    client.messages.create = AsyncMock(
+        side_effect=anthropic.APIStatusError(
+            message="Output blocked by content filtering policy",
+            response=MagicMock(status_code=400, headers={}),
+            body=None,
+        )
+    )
+
+    mock_registry = MagicMock()
+    mock_registry.get_schemas.return_value = []
+
+    with (
+        patch("src.llm.client._get_client", return_value=client),
+        patch("src.llm.client.build_system_prompt", new_callable=AsyncMock, return_value="system"),
+        patch("src.llm.client.registry", mock_registry),
+    ):
+        result = await generate_response([{"role": "user", "content": "hi"}])
+
+    assert result.startswith("My response")
+
+
 # ---------------------------------------------------------------------------
 # Channel awareness
 # ---------------------------------------------------------------------------
@@ -411,6 +752,7 @@ async def test_source_channel_forwarded_to_build_system_prompt() -> None:
     ):
         await generate_response(
             [{"role": "user", "content": "hi"}],
+            on_text_delta=AsyncMock(),
             msg_context=ctx,
         )
 
@@ -1,10 +1,14 @@
 """Tests for GoogleAuthManager multi-account registry."""
 
+import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.integrations import google_auth
 from src.integrations.google_auth import GoogleAuthManager
 
 
@@ -71,6 +75,14 @@ class TestAnyEnabled:
         monkeypatch.chdir(tmp_path)
         assert GoogleAuthManager.any_enabled() is False
 
+    def test_token_paths_built_once_per_account_list(self):
+        paths = google_auth._token_paths(("work", "personal"))
+        assert paths == (
+            "auth_tokens/google_work_auth_token.json",
+            "auth_tokens/google_personal_auth_token.json",
+        )
+        assert google_auth._token_paths(("work", "personal")) is paths
+
     def test_returns_false_when_no_accounts(self, monkeypatch):
         monkeypatch.setattr("src.integrations.google_auth.settings.google_accounts", "")
         assert GoogleAuthManager.any_enabled() is False
@@ -102,7 +114,7 @@ class TestLoadCredentials:
 
         mock_creds = MagicMock()
         mock_creds.expired = False
-        mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+        mock_creds_cls.from_authorized_user_info.return_value = mock_creds
 
         creds = GoogleAuthManager.get("work")._load_credentials()
         assert creds is mock_creds
@@ -121,7 +133,7 @@ class TestLoadCredentials:
         mock_creds.expired = True
         mock_creds.refresh_token = "refresh-token"
         mock_creds.to_json.return_value = '{"refreshed": true}'
-        mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+        mock_creds_cls.from_authorized_user_info.return_value = mock_creds
 
         creds = GoogleAuthManager.get("work")._load_credentials()
         assert creds is mock_creds
@@ -129,6 +141,126 @@ class TestLoadCredentials:
         assert token.read_text() == '{"refreshed": true}'
 
 
+class TestGetCredentials:
+    @pytest.fixture
+    def _token(self, _accounts, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        token = tmp_path / "auth_tokens/google_work_auth_token.json"
+        token.write_text("{}")
+        return token
+
+    @patch("src.integrations.google_auth.Credentials")
+    def test_file_read_once(self, mock_creds_cls, _token):
+        mock_creds_cls.from_authorized_user_info.return_value = MagicMock(expired=False)
+
+        mgr = GoogleAuthManager.get("work")
+        first = mgr._get_credentials()
+        assert mgr._get_credentials() is first
+        mock_creds_cls.from_authorized_user_info.assert_called_once()
+
+    @patch("src.integrations.google_auth.Request")
+    @patch("src.integrations.google_auth.Credentials")
+    def test_expired_refreshed_in_place(self, mock_creds_cls, _mock_request, _token):
+        creds = MagicMock(expired=False, refresh_token="rt")
+        creds.to_json.return_value = '{"refreshed": true}'
+        mock_creds_cls.from_authorized_user_info.return_value = creds
+
+        mgr = GoogleAuthManager.get("work")
+        mgr._get_credentials()
+        creds.expired = True
+
+        assert mgr._get_credentials() is creds
+        creds.refresh.assert_called_once()
+        mock_creds_cls.from_authorized_user_info.assert_called_once()
+        assert _token.read_text() == '{"refreshed": true}'
+
+    @patch("src.integrations.google_auth.Credentials")
+    def test_reloads_when_token_file_changes(self, mock_creds_cls, _token):
+        old, new = MagicMock(expired=False), MagicMock(expired=False)
+        mock_creds_cls.from_authorized_user_info.side_effect = [old, new]
+
+        mgr = GoogleAuthManager.get("work")
+        assert mgr._get_credentials() is old
+
+        stat = _token.stat()
+        os.utime(_token, (stat.st_atime, stat.st_mtime + 10))
+        assert mgr._get_credentials() is new
+
+    @patch("src.integrations.google_auth.Request")
+    @patch("src.integrations.google_auth.Credentials")
+    def test_concurrent_expiry_refreshes_once(self, mock_creds_cls, _mock_request, _token):
+        creds = MagicMock(expired=False, refresh_token="rt")
+        creds.to_json.return_value = "{}"
+        mock_creds_cls.from_authorized_user_info.return_value = creds
+
+        def slow_refresh(_request):
+            time.sleep(0.05)
+            creds.expired = False
+
+        creds.refresh.side_effect = slow_refresh
+
+        mgr = GoogleAuthManager.get("work")
+        mgr._get_credentials()
+        creds.expired = True
+
+        threads = [threading.Thread(target=mgr._get_credentials) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        creds.refresh.assert_called_once()
+
+
+class TestGetGoogleCredentials:
+    @patch("src.integrations.google_auth.Credentials")
+    def test_delegates_to_manager(self, mock_creds_cls, _accounts, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
+        mock_creds_cls.from_authorized_user_info.return_value = MagicMock(expired=False)
+
+        creds = google_auth.get_google_credentials()
+        assert creds is GoogleAuthManager.get("work")._credentials
+        assert google_auth.get_google_credentials("work") is creds
+
+
+class TestAuthRequest:
+    @pytest.fixture(autouse=True)
+    def _reset_auth_request(self, monkeypatch):
+        monkeypatch.setattr(google_auth, "_auth_request", None)
+
+    def test_shared_across_calls(self):
+        first = google_auth._get_auth_request()
+        assert google_auth._get_auth_request() is first
+
+    @patch("src.integrations.google_auth.Credentials")
+    def test_refresh_uses_shared_transport(self, mock_creds_cls, _accounts, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
+        (tmp_path / "auth_tokens/google_personal_auth_token.json").write_text("{}")
+        creds = MagicMock(expired=True, refresh_token="rt")
+        creds.to_json.return_value = "{}"
+        mock_creds_cls.from_authorized_user_info.return_value = creds
+
+        GoogleAuthManager.get("work")._get_credentials()
+        GoogleAuthManager.get("personal")._get_credentials()
+
+        transports = {c.args[0] for c in creds.refresh.call_args_list}
+        assert transports == {google_auth._get_auth_request()}
+
+
+class TestRunGoogleApi:
+    async def test_runs_on_dedicated_pool(self):
+        name = await google_auth.run_google_api(lambda: threading.current_thread().name)
+        assert name.startswith("google-api")
+
+    async def test_passes_args(self):
+        assert await google_auth.run_google_api(max, 3, 7) == 7
+
+
 class TestServiceBuilders:
     @patch("src.integrations.google_auth.build")
     @patch("src.integrations.google_auth.Credentials")
@@ -137,10 +269,12 @@ class TestServiceBuilders:
         (tmp_path / "auth_tokens").mkdir()
         (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
         mock_creds = MagicMock(expired=False)
-        mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+        mock_creds_cls.from_authorized_user_info.return_value = mock_creds
 
         GoogleAuthManager.get("work").gmail()
-        mock_build.assert_called_once_with("gmail", "v1", credentials=mock_creds)
+        mock_build.assert_called_once()
+        assert mock_build.call_args.args == ("gmail", "v1")
+        assert mock_build.call_args.kwargs["http"].credentials is mock_creds
 
     @patch("src.integrations.google_auth.build")
     @patch("src.integrations.google_auth.Credentials")
@@ -149,10 +283,12 @@ class TestServiceBuilders:
         (tmp_path / "auth_tokens").mkdir()
         (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
         mock_creds = MagicMock(expired=False)
-        mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+        mock_creds_cls.from_authorized_user_info.return_value = mock_creds
 
         GoogleAuthManager.get("work").calendar()
-        mock_build.assert_called_once_with("calendar", "v3", credentials=mock_creds)
+        mock_build.assert_called_once()
+        assert mock_build.call_args.args == ("calendar", "v3")
+        assert mock_build.call_args.kwargs["http"].credentials is mock_creds
 
     @patch("src.integrations.google_auth.build")
     @patch("src.integrations.google_auth.Credentials")
@@ -161,10 +297,12 @@ class TestServiceBuilders:
         (tmp_path / "auth_tokens").mkdir()
         (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
         mock_creds = MagicMock(expired=False)
-        mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+        mock_creds_cls.from_authorized_user_info.return_value = mock_creds
 
         GoogleAuthManager.get("work").drive()
-        mock_build.assert_called_once_with("drive", "v3", credentials=mock_creds)
+        mock_build.assert_called_once()
+        assert mock_build.call_args.args == ("drive", "v3")
+        assert mock_build.call_args.kwargs["http"].credentials is mock_creds
 
     @patch("src.integrations.google_auth.build")
     @patch("src.integrations.google_auth.Credentials")
@@ -173,10 +311,58 @@ class TestServiceBuilders:
         (tmp_path / "auth_tokens").mkdir()
         (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
         mock_creds = MagicMock(expired=False)
-        mock_creds_cls.from_authorized_user_file.return_value = mock_creds
+        mock_creds_cls.from_authorized_user_info.return_value = mock_creds
 
         GoogleAuthManager.get("work").docs()
-        mock_build.assert_called_once_with("docs", "v1", credentials=mock_creds)
+        mock_build.assert_called_once()
+        assert mock_build.call_args.args == ("docs", "v1")
+        assert mock_build.call_args.kwargs["http"].credentials is mock_creds
+
+    @patch("src.integrations.google_auth.build")
+    @patch("src.integrations.google_auth.Credentials")
+    def test_service_is_cached(self, mock_creds_cls, mock_build, _accounts, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
+        mock_creds_cls.from_authorized_user_info.return_value = MagicMock(expired=False)
+
+        mgr = GoogleAuthManager.get("work")
+        assert mgr.gmail() is mgr.gmail()
+        mock_build.assert_called_once()
+
+    @patch("src.integrations.google_auth.build")
+    @patch("src.integrations.google_auth.Credentials")
+    def test_service_rebuilt_when_credentials_change(
+        self, mock_creds_cls, mock_build, _accounts, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
+        mock_creds_cls.from_authorized_user_info.return_value = MagicMock(expired=False)
+
+        mgr = GoogleAuthManager.get("work")
+        mgr.gmail()
+        mgr._credentials = MagicMock(expired=False)
+        mgr.gmail()
+        assert mock_build.call_count == 2
+
+    @patch("src.integrations.google_auth.build")
+    @patch("src.integrations.google_auth.Credentials")
+    def test_each_request_gets_its_own_http(
+        self, mock_creds_cls, mock_build, _accounts, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        (tmp_path / "auth_tokens/google_work_auth_token.json").write_text("{}")
+        mock_creds = MagicMock(expired=False)
+        mock_creds_cls.from_authorized_user_info.return_value = mock_creds
+
+        GoogleAuthManager.get("work").calendar()
+        build_request = mock_build.call_args.kwargs["requestBuilder"]
+        first = build_request(None, MagicMock(), "https://example.com", method="GET")
+        second = build_request(None, MagicMock(), "https://example.com", method="GET")
+        assert first.http is not second.http
+        assert first.http.credentials is mock_creds
 
 
 class TestScopes:
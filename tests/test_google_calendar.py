@@ -63,6 +63,17 @@ class TestListEvents:
         assert result.success
         assert result.data["count"] == 0
 
+    @pytest.mark.asyncio
+    async def test_list_events_requests_partial_response(self, cal_mock):
+        from src.tools.google_calendar import list_events
+
+        cal_mock.events().list().execute.return_value = {"items": []}
+
+        await list_events()
+        kwargs = cal_mock.events().list.call_args.kwargs
+        assert kwargs["maxResults"] == 250
+        assert kwargs["fields"].startswith("items(id,summary,start,end,")
+
 
 class TestGetTodaysSchedule:
     @pytest.mark.asyncio
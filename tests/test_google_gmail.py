@@ -10,10 +10,31 @@ import pytest
 from src.tools.base import ToolResult
 
 
+class _FakeBatch:
+    """Stand-in for BatchHttpRequest: executes each added request in turn."""
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self._requests:
+            try:
+                response = request.execute()
+            except Exception as exc:
+                self._callback(request_id, None, exc)
+            else:
+                self._callback(request_id, response, None)
+
+
 def _mock_auth():
     """Create a mock GoogleAuthManager with a mock Gmail service."""
     auth = MagicMock()
     service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: _FakeBatch(callback)
     auth.gmail.return_value = service
     return auth, service
 
@@ -106,6 +127,52 @@ class TestSearchEmails:
         assert "next_page_token" not in result.data
 
 
+    @pytest.mark.asyncio
+    async def test_search_batches_message_fetches(self, gmail_mock):
+        from src.tools.google_gmail import search_emails
+
+        ids = [f"msg{i}" for i in range(60)]
+        gmail_mock.users().messages().list().execute.return_value = {
+            "messages": [{"id": mid} for mid in ids],
+            "resultSizeEstimate": 60,
+        }
+        gmail_mock.users().messages().get().execute.side_effect = [
+            _make_message(msg_id=mid, subject=f"S{mid}") for mid in ids
+        ]
+
+        result = await search_emails(query="test", max_results=60)
+        assert result.data["count"] == 60
+        assert [e["id"] for e in result.data["emails"]] == ids
+        # 60 messages → two batches of at most 50
+        assert gmail_mock.new_batch_http_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_requests_only_needed_headers(self, gmail_mock):
+        from src.tools.google_gmail import search_emails
+
+        gmail_mock.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}],
+        }
+        gmail_mock.users().messages().get().execute.return_value = _make_message()
+
+        await search_emails(query="test")
+        get_kwargs = gmail_mock.users().messages().get.call_args.kwargs
+        assert get_kwargs["format"] == "metadata"
+        assert get_kwargs["metadataHeaders"] == ["Subject", "From", "To", "Date"]
+
+    @pytest.mark.asyncio
+    async def test_search_batch_error_propagates(self, gmail_mock):
+        from src.tools.google_gmail import search_emails
+
+        gmail_mock.users().messages().list().execute.return_value = {
+            "messages": [{"id": "msg1"}],
+        }
+        gmail_mock.users().messages().get().execute.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await search_emails(query="test")
+
+
 class TestReadEmail:
     @pytest.mark.asyncio
     async def test_read_email(self, gmail_mock):
@@ -244,6 +311,63 @@ class TestBuildMessage:
             _build_message("body", ["big.bin"])
 
 
+class TestRawMessage:
+    @staticmethod
+    def _parse(raw: str):
+        from email import message_from_bytes, policy
+
+        return message_from_bytes(base64.urlsafe_b64decode(raw), policy=policy.default)
+
+    def test_plain_text_round_trips(self):
+        from src.tools.google_gmail import _raw_message
+
+        msg = self._parse(_raw_message("Hello\nthere", {"to": "a@b.com", "subject": "Hi"}))
+        assert msg["To"] == "a@b.com"
+        assert msg["Subject"] == "Hi"
+        assert msg.get_content_type() == "text/plain"
+        assert msg.get_content().replace("\r\n", "\n") == "Hello\nthere"
+
+    def test_non_ascii_subject_and_body(self):
+        from src.tools.google_gmail import _raw_message
+
+        msg = self._parse(_raw_message("Grüße ☕", {"to": "a@b.com", "subject": "Café"}))
+        assert msg["Subject"] == "Café"
+        assert msg.get_content() == "Grüße ☕"
+
+    def test_long_subject_and_body_use_one_line_ending(self):
+        from src.tools.google_gmail import _raw_message
+
+        subject = "Résumé des réunions de la semaine prochaine " * 3
+        body = "Ünïcödé body text that is long enough to wrap. " * 5
+        raw = _raw_message(body, {"to": "a@b.com", "subject": subject})
+        assert b"\r\n" not in base64.urlsafe_b64decode(raw)
+
+        msg = self._parse(raw)
+        assert msg["Subject"] == subject
+        assert msg.get_content() == body
+
+    def test_empty_headers_omitted(self):
+        from src.tools.google_gmail import _raw_message
+
+        msg = self._parse(_raw_message("x", {"to": "a@b.com", "cc": None, "bcc": ""}))
+        assert "Cc" not in msg
+        assert "Bcc" not in msg
+
+    def test_line_break_in_header_raises(self):
+        from src.tools.google_gmail import _raw_message
+
+        with pytest.raises(ValueError, match="line breaks"):
+            _raw_message("x", {"to": "a@b.com", "subject": "Hi\r\nBcc: evil@x.com"})
+
+    def test_attachments_use_multipart(self, scratch):
+        from src.tools.google_gmail import _raw_message
+
+        scratch.write("doc.pdf", b"%PDF-fake-content")
+        msg = self._parse(_raw_message("See attached", {"to": "a@b.com"}, ["doc.pdf"]))
+        assert msg.get_content_type() == "multipart/mixed"
+        assert msg["To"] == "a@b.com"
+
+
 class TestSendEmailWithAttachments:
     @pytest.mark.asyncio
     async def test_send_with_attachment(self, gmail_mock, scratch):
@@ -544,6 +668,37 @@ class TestListLabels:
         assert result.data["count"] == 0
 
 
+class TestExtractHeaders:
+    _MSG = {
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": "Hi"},
+                {"name": "Received", "value": "by mx"},
+                {"name": "From", "value": "a@b.com"},
+                {"name": "Subject", "value": "duplicate"},
+            ]
+        }
+    }
+
+    def test_all_headers_without_filter(self):
+        from src.tools.google_gmail import _extract_headers
+
+        headers = _extract_headers(self._MSG)
+        assert headers["Received"] == "by mx"
+
+    def test_only_wanted_headers(self):
+        from src.tools.google_gmail import _extract_headers
+
+        headers = _extract_headers(self._MSG, ("Subject", "From"))
+        assert headers == {"Subject": "Hi", "From": "a@b.com"}
+
+    def test_missing_wanted_header_omitted(self):
+        from src.tools.google_gmail import _extract_headers
+
+        headers = _extract_headers(self._MSG, ("Subject", "To"))
+        assert headers == {"Subject": "Hi"}
+
+
 class TestExtractAttachments:
     def test_includes_attachment_id(self):
         from src.tools.google_gmail import _extract_attachments
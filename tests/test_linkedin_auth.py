@@ -2,7 +2,7 @@
 
 import json
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -16,6 +16,15 @@ def _reset():
     LinkedInAuth._reset()
 
 
+@pytest.fixture
+def mock_post():
+    """Patch the shared HTTP client's post() used for token refreshes."""
+    client = MagicMock()
+    client.post = AsyncMock()
+    with patch("src.integrations.linkedin_auth._get_client", return_value=client):
+        yield client.post
+
+
 class TestSingleton:
     def test_get_returns_same_instance(self):
         a = LinkedInAuth.get()
@@ -61,7 +70,7 @@ class TestLoadToken:
 
 
 class TestEnsureToken:
-    def test_returns_valid_token(self, tmp_path, monkeypatch):
+    async def test_returns_valid_token(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "auth_tokens").mkdir()
         token_data = {"access_token": "valid", "expires_at": time.time() + 3600}
@@ -69,10 +78,10 @@ class TestEnsureToken:
             json.dumps(token_data)
         )
         auth = LinkedInAuth.get()
-        result = auth._ensure_token()
+        result = await auth._ensure_token()
         assert result["access_token"] == "valid"
 
-    def test_expired_no_refresh_raises(self, tmp_path, monkeypatch):
+    async def test_expired_no_refresh_raises(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "auth_tokens").mkdir()
         token_data = {"access_token": "expired", "expires_at": time.time() - 100}
@@ -81,10 +90,9 @@ class TestEnsureToken:
         )
         auth = LinkedInAuth.get()
         with pytest.raises(LinkedInAuthError, match="expired"):
-            auth._ensure_token()
+            await auth._ensure_token()
 
-    @patch("src.integrations.linkedin_auth.httpx.post")
-    def test_refresh_success(self, mock_post, tmp_path, monkeypatch):
+    async def test_refresh_success(self, mock_post, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         monkeypatch.setattr("src.config.settings.linkedin_client_id", "cid")
         monkeypatch.setattr("src.config.settings.linkedin_client_secret", "csecret")
@@ -106,11 +114,14 @@ class TestEnsureToken:
         mock_post.return_value = mock_resp
 
         auth = LinkedInAuth.get()
-        result = auth._ensure_token()
+        result = await auth._ensure_token()
         assert result["access_token"] == "new_token"
 
-    @patch("src.integrations.linkedin_auth.httpx.post")
-    def test_refresh_failure_raises(self, mock_post, tmp_path, monkeypatch):
+        saved = json.loads((tmp_path / "auth_tokens/linkedin_default_auth_token.json").read_text())
+        assert saved["access_token"] == "new_token"
+        assert saved["refresh_token"] == "refresh123"
+
+    async def test_refresh_failure_raises(self, mock_post, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         monkeypatch.setattr("src.config.settings.linkedin_client_id", "cid")
         monkeypatch.setattr("src.config.settings.linkedin_client_secret", "csecret")
@@ -130,11 +141,58 @@ class TestEnsureToken:
 
         auth = LinkedInAuth.get()
         with pytest.raises(LinkedInAuthError, match="refresh failed"):
-            auth._ensure_token()
+            await auth._ensure_token()
+
+    async def test_cached_token_skips_expiry_check(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        token_data = {"access_token": "valid", "expires_at": time.time() + 3600}
+        (tmp_path / "auth_tokens/linkedin_default_auth_token.json").write_text(
+            json.dumps(token_data)
+        )
+        auth = LinkedInAuth.get()
+        await auth._ensure_token()
+
+        # Within the cached validity window the dict is not consulted again
+        auth._token_data["expires_at"] = 0
+        result = await auth._ensure_token()
+        assert result["access_token"] == "valid"
+
+    async def test_refreshes_within_expiry_margin(self, mock_post, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        token_data = {
+            "access_token": "old",
+            "expires_at": time.time() + 30,
+            "refresh_token": "refresh123",
+        }
+        (tmp_path / "auth_tokens/linkedin_default_auth_token.json").write_text(
+            json.dumps(token_data)
+        )
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = {"access_token": "new_token", "expires_in": 3600}
+        mock_post.return_value = mock_resp
+
+        auth = LinkedInAuth.get()
+        result = await auth._ensure_token()
+        assert result["access_token"] == "new_token"
+        mock_post.assert_awaited_once()
+
+    async def test_within_margin_without_refresh_token_still_usable(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "auth_tokens").mkdir()
+        token_data = {"access_token": "nearly", "expires_at": time.time() + 30}
+        (tmp_path / "auth_tokens/linkedin_default_auth_token.json").write_text(
+            json.dumps(token_data)
+        )
+        auth = LinkedInAuth.get()
+        result = await auth._ensure_token()
+        assert result["access_token"] == "nearly"
 
 
 class TestGetHeaders:
-    def test_returns_auth_headers(self, tmp_path, monkeypatch):
+    async def test_returns_auth_headers(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "auth_tokens").mkdir()
         token_data = {"access_token": "mytoken", "expires_at": time.time() + 3600}
@@ -142,13 +200,13 @@ class TestGetHeaders:
             json.dumps(token_data)
         )
         auth = LinkedInAuth.get()
-        headers = auth.get_headers()
+        headers = await auth.get_headers()
         assert headers["Authorization"] == "Bearer mytoken"
         assert "LinkedIn-Version" in headers
 
 
 class TestGetPersonUrn:
-    def test_returns_urn(self, tmp_path, monkeypatch):
+    async def test_returns_urn(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "auth_tokens").mkdir()
         token_data = {
@@ -160,9 +218,9 @@ class TestGetPersonUrn:
             json.dumps(token_data)
         )
         auth = LinkedInAuth.get()
-        assert auth.get_person_urn() == "urn:li:person:abc123"
+        assert await auth.get_person_urn() == "urn:li:person:abc123"
 
-    def test_missing_person_id_raises(self, tmp_path, monkeypatch):
+    async def test_missing_person_id_raises(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "auth_tokens").mkdir()
         token_data = {"access_token": "tok", "expires_at": time.time() + 3600}
@@ -171,4 +229,4 @@ class TestGetPersonUrn:
         )
         auth = LinkedInAuth.get()
         with pytest.raises(LinkedInAuthError, match="person_id"):
-            auth.get_person_urn()
+            await auth.get_person_urn()
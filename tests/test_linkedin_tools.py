@@ -31,8 +31,8 @@ MOCK_PERSON_URN = "urn:li:person:abc123"
 def _mock_linkedin_auth():
     """Patch _auth() to return a mock LinkedInAuth for all tests."""
     mock_auth = MagicMock()
-    mock_auth.get_headers.return_value = MOCK_HEADERS
-    mock_auth.get_person_urn.return_value = MOCK_PERSON_URN
+    mock_auth.get_headers = AsyncMock(return_value=MOCK_HEADERS)
+    mock_auth.get_person_urn = AsyncMock(return_value=MOCK_PERSON_URN)
 
     with patch("src.tools.linkedin_tools._auth", return_value=mock_auth):
         yield mock_auth
@@ -1,7 +1,10 @@
 """Tests for the shared memory store."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from collections import OrderedDict
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from src.memory.models import MemoryEntry
@@ -15,6 +18,9 @@ def store() -> MemoryStore:
     s._client = AsyncMock()
     s._enabled = True
     s._user_id = "owner"
+    s._add_sem = asyncio.Semaphore(8)
+    s._search_cache = OrderedDict()
+    s._cache_generation = 0
     return s
 
 
@@ -25,9 +31,60 @@ def disabled_store() -> MemoryStore:
     s._client = None
     s._enabled = False
     s._user_id = "owner"
+    s._add_sem = asyncio.Semaphore(8)
+    s._search_cache = OrderedDict()
+    s._cache_generation = 0
     return s
 
 
+# -- init --------------------------------------------------------------------
+
+
+def test_init_uses_keepalive_http2_client() -> None:
+    with (
+        patch("src.memory.store.settings") as mock_settings,
+        patch("mem0.AsyncMemoryClient") as mock_client_cls,
+    ):
+        mock_settings.mem0_api_key = "key"
+        store = MemoryStore()
+
+    assert store.enabled
+    http_client = mock_client_cls.call_args.kwargs["client"]
+    assert isinstance(http_client, httpx.AsyncClient)
+    assert http_client._transport._pool._http2
+
+
+async def test_warm_builds_instance_off_loop(monkeypatch) -> None:
+    import threading
+
+    monkeypatch.setattr(MemoryStore, "_instance", None)
+    built_on: list[threading.Thread] = []
+
+    def fake_init(self) -> None:
+        built_on.append(threading.current_thread())
+
+    monkeypatch.setattr(MemoryStore, "__init__", fake_init)
+    await MemoryStore.warm()
+
+    assert MemoryStore._instance is not None
+    assert len(built_on) == 1
+    assert built_on[0] is not threading.main_thread()
+
+
+# -- close -------------------------------------------------------------------
+
+
+async def test_close_closes_http_client(store: MemoryStore, monkeypatch) -> None:
+    monkeypatch.setattr(MemoryStore, "_instance", store)
+    await MemoryStore.close()
+    store._client.async_client.aclose.assert_awaited_once()
+
+
+async def test_close_without_instance_is_noop(monkeypatch) -> None:
+    monkeypatch.setattr(MemoryStore, "_instance", None)
+    await MemoryStore.close()
+
+
 # -- add ---------------------------------------------------------------------
 
 
@@ -58,6 +115,49 @@ async def test_add_extra_metadata(store: MemoryStore) -> None:
     assert kwargs["metadata"]["conversation_id"] == "conv_123"
 
 
+async def test_add_many_issues_all_adds(store: MemoryStore) -> None:
+    store._client.add.return_value = {"id": "m"}
+    results = await store.add_many(
+        [
+            {"content": "Likes tea", "category": "preference"},
+            {"content": "Lives in Austin", "category": "fact", "metadata": {"k": "v"}},
+        ],
+        source="automatic",
+    )
+
+    assert results == [{"id": "m"}, {"id": "m"}]
+    assert store._client.add.await_count == 2
+    second = store._client.add.call_args_list[1]
+    assert second[0][0] == "Lives in Austin"
+    assert second[1]["metadata"]["k"] == "v"
+
+
+async def test_add_many_bounds_concurrency(store: MemoryStore) -> None:
+    in_flight = peak = 0
+
+    async def add(*_args, **_kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"id": "m"}
+
+    store._client.add.side_effect = add
+    store._add_sem = asyncio.Semaphore(2)
+    items = [{"content": f"m{i}", "category": "fact"} for i in range(6)]
+
+    await store.add_many(items, source="automatic")
+
+    assert store._client.add.await_count == 6
+    assert peak == 2
+
+
+async def test_add_many_disabled(disabled_store: MemoryStore) -> None:
+    results = await disabled_store.add_many([{"content": "x", "category": "fact"}], "explicit")
+    assert results == [None]
+
+
 async def test_add_disabled_returns_none(disabled_store: MemoryStore) -> None:
     result = await disabled_store.add("test", "explicit", "fact")
     assert result is None
@@ -100,6 +200,66 @@ async def test_search_returns_memory_entries(store: MemoryStore) -> None:
     assert results[1].source == "explicit"
 
 
+async def test_search_served_from_cache(store: MemoryStore) -> None:
+    store._client.search.return_value = {"results": [{"id": "1", "memory": "Likes tea"}]}
+
+    first = await store.search("Tea preference?")
+    second = await store.search("  tea   PREFERENCE? ")
+
+    assert first == second
+    store._client.search.assert_awaited_once()
+
+
+async def test_search_cache_keeps_pronouns_and_word_order(store: MemoryStore) -> None:
+    store._client.search.return_value = {"results": []}
+
+    await store.search("what do I like")
+    await store.search("what do you like")
+    await store.search("who owes Alice")
+    await store.search("Alice owes who")
+
+    assert store._client.search.await_count == 4
+
+
+async def test_search_started_before_write_not_cached(store: MemoryStore) -> None:
+    gate = asyncio.Event()
+
+    async def slow_search(*args, **kwargs):
+        await gate.wait()
+        return {"results": [{"id": "1", "memory": "stale"}]}
+
+    store._client.search.side_effect = slow_search
+    pending = asyncio.create_task(store.search("tea"))
+    await asyncio.sleep(0)
+    await store.add(content="Likes tea", source="explicit", category="preference")
+    gate.set()
+    await pending
+
+    store._client.search.side_effect = None
+    store._client.search.return_value = {"results": [{"id": "2", "memory": "fresh"}]}
+    results = await store.search("tea")
+    assert [e.content for e in results] == ["fresh"]
+
+
+async def test_search_cache_cleared_on_add(store: MemoryStore) -> None:
+    store._client.search.return_value = {"results": []}
+
+    await store.search("tea")
+    await store.add(content="Likes tea", source="explicit", category="preference")
+    await store.search("tea")
+
+    assert store._client.search.await_count == 2
+
+
+async def test_search_failure_not_cached(store: MemoryStore) -> None:
+    store._client.search.side_effect = [RuntimeError("down"), {"results": []}]
+
+    assert await store.search("tea") == []
+    assert await store.search("tea") == []
+
+    assert store._client.search.await_count == 2
+
+
 async def test_search_disabled_returns_empty(disabled_store: MemoryStore) -> None:
     results = await disabled_store.search("anything")
     assert results == []
@@ -183,6 +183,24 @@ async def test_multiple_missed_tasks_send_multiple_messages(
     assert len(_pending_missed) == 2
 
 
+async def test_pending_missed_is_bounded(engine: SchedulerEngine, store: TaskStore) -> None:
+    """Old unanswered notifications are evicted once the cap is reached."""
+    past = (datetime.now(zoneinfo.ZoneInfo(TZ)) - timedelta(hours=1)).isoformat()
+    await store.add_task(_make_task(run_at=past))
+    await store.add_task(_make_task(run_at=past))
+    _pending_missed["oldest"] = "stale-task"
+
+    with (
+        patch("src.scheduler.missed._MAX_PENDING_MISSED", 2),
+        patch("src.scheduler.missed.NotificationRouter") as mock_router_cls,
+    ):
+        mock_router_cls.get.return_value.send_rich = AsyncMock(return_value=True)
+        await check_and_notify_missed_tasks()
+
+    assert len(_pending_missed) == 2
+    assert "oldest" not in _pending_missed
+
+
 # -- Callback handling tests ---------------------------------------------------
 
 
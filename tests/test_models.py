@@ -82,3 +82,16 @@ def test_set_by_full_model_id(mock_settings) -> None:
     assert result == MODEL_MAP["opus"]
     assert mm.get_chat_model() == MODEL_MAP["opus"]
     ModelManager._instance = None
+
+
+@patch("src.llm.models.settings")
+def test_chat_model_attribute_tracks_setter(mock_settings) -> None:
+    mock_settings.default_chat_model = "sonnet"
+    mock_settings.default_memory_model = "haiku"
+    mm = ModelManager()
+
+    assert mm.chat_model == MODEL_MAP["sonnet"]
+    mm.set_chat_model("haiku")
+    assert mm.chat_model == MODEL_MAP["haiku"]
+    mm.set_memory_model("opus")
+    assert mm.memory_model == MODEL_MAP["opus"]
@@ -2,8 +2,10 @@
 
 from unittest.mock import AsyncMock, patch
 
+import pytest
+
 from src.notifications.channels import NotificationChannel
-from src.notifications.telegram_channel import TelegramChannel
+from src.notifications.telegram_channel import TelegramChannel, _build_markup
 
 # -- Helpers -----------------------------------------------------------------
 
@@ -13,9 +15,18 @@ def _make_mock_bot() -> AsyncMock:
     bot = AsyncMock()
     bot.send_message = AsyncMock()
     bot.send_photo = AsyncMock()
+    bot.send_media_group = AsyncMock()
     return bot
 
 
+@pytest.fixture(autouse=True)
+def _clear_markup_cache():
+    """Tests patch the keyboard classes, so don't leak cached markups between them."""
+    _build_markup.cache_clear()
+    yield
+    _build_markup.cache_clear()
+
+
 # -- Protocol conformance ---------------------------------------------------
 
 
@@ -102,6 +113,19 @@ async def test_send_rich_with_buttons() -> None:
         assert call_kwargs["parse_mode"] == "HTML"
 
 
+async def test_send_rich_reuses_markup_for_same_layout() -> None:
+    bot = _make_mock_bot()
+    ch = TelegramChannel(bot)
+    buttons = [[{"text": "Yes", "callback_data": "yes"}, {"text": "No", "callback_data": "no"}]]
+
+    await ch.send_rich("1", "first", buttons=buttons)
+    await ch.send_rich("1", "second", buttons=[[dict(b) for b in buttons[0]]])
+
+    first, second = (c.kwargs["reply_markup"] for c in bot.send_message.call_args_list)
+    assert first is second
+    assert [b.callback_data for b in first.inline_keyboard[0]] == ["yes", "no"]
+
+
 async def test_send_rich_custom_parse_mode() -> None:
     bot = _make_mock_bot()
     ch = TelegramChannel(bot)
@@ -154,6 +178,37 @@ async def test_send_photo_returns_false_on_error() -> None:
     assert ok is False
 
 
+async def test_send_photos_uses_media_group() -> None:
+    bot = _make_mock_bot()
+    ch = TelegramChannel(bot)
+
+    ok = await ch.send_photos("12345", [b"a", b"b", b"c"], caption="Album")
+    assert ok is True
+    bot.send_photo.assert_not_awaited()
+    bot.send_media_group.assert_awaited_once()
+    media = bot.send_media_group.call_args.kwargs["media"]
+    assert [m.caption for m in media] == ["Album", None, None]
+
+
+async def test_send_photos_splits_large_albums() -> None:
+    bot = _make_mock_bot()
+    ch = TelegramChannel(bot)
+
+    ok = await ch.send_photos("12345", [b"p"] * 11)
+    assert ok is True
+    # 10 in one album; the leftover photo goes out on its own
+    bot.send_media_group.assert_awaited_once()
+    bot.send_photo.assert_awaited_once_with(chat_id=12345, photo=b"p")
+
+
+async def test_send_photos_returns_false_on_error() -> None:
+    bot = _make_mock_bot()
+    bot.send_media_group.side_effect = RuntimeError("network error")
+    ch = TelegramChannel(bot)
+
+    assert await ch.send_photos("1", [b"a", b"b"]) is False
+
+
 # -- Chunking integration ---------------------------------------------------
 
 
@@ -1,5 +1,7 @@
 """Tests for NotificationRouter."""
 
+import asyncio
+
 import pytest
 
 from src.notifications.router import NotificationRouter
@@ -180,6 +182,18 @@ async def test_send_ambiguous_no_default_returns_false() -> None:
     assert ok is False
 
 
+async def test_default_survives_later_registration() -> None:
+    router = NotificationRouter.get()
+    tg = FakeChannel("telegram")
+    router.register_channel(tg)
+    router.set_default_channel("telegram")
+    router.register_channel(FakeChannel("sms"))
+
+    ok = await router.send("1", "hi")
+    assert ok is True
+    assert tg.sent == [("1", "hi")]
+
+
 # -- Send rich ---------------------------------------------------------------
 
 
@@ -227,3 +241,70 @@ async def test_send_photo_no_channel_returns_false() -> None:
     router = NotificationRouter.get()
     ok = await router.send_photo("1", b"\x89PNG...")
     assert ok is False
+
+
+async def test_send_photos_falls_back_to_single_sends() -> None:
+    router = NotificationRouter.get()
+    ch = FakeChannel("sms")
+    router.register_channel(ch)
+
+    ok = await router.send_photos("1", [b"a", b"b"], caption="pics")
+    assert ok is True
+    assert ch.sent_photos == [
+        ("1", b"a", {"caption": "pics"}),
+        ("1", b"b", {"caption": None}),
+    ]
+
+
+async def test_send_photos_uses_channel_batch() -> None:
+    class BatchChannel(FakeChannel):
+        async def send_photos(self, user_id: str, photos: list[bytes], **kwargs) -> bool:
+            self.sent_photos.append((user_id, b"".join(photos), kwargs))
+            return True
+
+    router = NotificationRouter.get()
+    ch = BatchChannel("telegram")
+    router.register_channel(ch)
+
+    ok = await router.send_photos("1", [b"a", b"b"], caption="pics")
+    assert ok is True
+    assert ch.sent_photos == [("1", b"ab", {"caption": "pics"})]
+
+
+# -- Send many ---------------------------------------------------------------
+
+
+async def test_send_many_fans_out_in_order() -> None:
+    router = NotificationRouter.get()
+    ch = FakeChannel("telegram")
+    router.register_channel(ch)
+
+    results = await router.send_many(["1", "2", "3"], "hi")
+    assert results == [True, True, True]
+    assert sorted(ch.sent) == [("1", "hi"), ("2", "hi"), ("3", "hi")]
+
+
+async def test_send_many_respects_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+
+    class SlowChannel(FakeChannel):
+        async def send(self, user_id: str, message: str) -> bool:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return user_id != "bad"
+
+    router = NotificationRouter.get()
+    router.register_channel(SlowChannel("telegram"))
+
+    results = await router.send_many(["1", "bad", "3", "4"], "hi", concurrency=2)
+    assert results == [True, False, True, True]
+    assert peak == 2
+
+
+async def test_send_many_no_channel_returns_all_false() -> None:
+    router = NotificationRouter.get()
+    assert await router.send_many(["1", "2"], "hi") == [False, False]
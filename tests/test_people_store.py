@@ -1,19 +1,47 @@
 """Tests for PeopleStore — libsql CRUD."""
 
 import asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.people.store import PeopleStore
+from src.db import close_pools, get_connection
+from src.people.store import _CREATE_TABLE, _UPSERT, PeopleStore
 
 pytestmark = pytest.mark.usefixtures("_no_turso")
 
 
+@pytest.fixture(params=["cached", "pooled"])
+async def store(
+    request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[PeopleStore]:
+    """Create a PeopleStore backed by a temp database.
+
+    "cached" passes an explicit db_path (one connection kept open); "pooled"
+    uses the configured database through the shared pools, as production does.
+    """
+    if request.param == "cached":
+        store = PeopleStore(db_path=tmp_path / "test.db")
+        yield store
+        await store.close()
+        return
+
+    monkeypatch.setattr("src.config.settings.database_path", tmp_path / "pooled.db")
+    monkeypatch.setattr("src.db._pools", {})
+    store = PeopleStore()
+    yield store
+    await store.close()
+    await close_pools()
+
+
 @pytest.fixture
-async def store(tmp_path: Path) -> PeopleStore:
-    """Create a PeopleStore backed by a temp database."""
-    return PeopleStore(db_path=tmp_path / "test.db")
+async def cached_store(tmp_path: Path) -> AsyncIterator[PeopleStore]:
+    """A PeopleStore with an explicit db_path, for connection-lifecycle tests."""
+    store = PeopleStore(db_path=tmp_path / "test.db")
+    yield store
+    await store.close()
 
 
 # -- upsert / get_by_id -------------------------------------------------------
@@ -39,7 +67,8 @@ async def test_upsert_updates_existing(store: PeopleStore) -> None:
 
     # Small delay so updated_at differs
     await asyncio.sleep(0.01)
-    await store.upsert("people/c123", "Alice J. Smith", "Updated notes")
+    returned = await store.upsert("people/c123", "Alice J. Smith", "Updated notes")
+    assert returned["created_at"] == original_created
 
     record = await store.get_by_id("people/c123")
     assert record is not None
@@ -87,6 +116,52 @@ async def test_search_no_results(store: PeopleStore) -> None:
     assert results == []
 
 
+async def test_search_matches_word_prefix(store: PeopleStore) -> None:
+    await store.upsert("people/c1", "Alice Smith", "Met at Python conference")
+
+    results = await store.search("conf")
+    assert [r["google_resource_id"] for r in results] == ["people/c1"]
+
+
+async def test_search_ignores_fts_syntax(store: PeopleStore) -> None:
+    await store.upsert("people/c1", "Alice Smith", "notes")
+
+    results = await store.search('alice" OR (NOT')
+    assert results == []
+    results = await store.search('"alice"')
+    assert [r["display_name"] for r in results] == ["Alice Smith"]
+
+
+async def test_search_tracks_updates_and_deletes(store: PeopleStore) -> None:
+    await store.upsert("people/c1", "Alice Smith", "likes tennis")
+    await store.upsert("people/c1", "Alice Smith", "likes golf")
+
+    assert await store.search("tennis") == []
+    assert len(await store.search("golf")) == 1
+
+    await store.delete("people/c1")
+    assert await store.search("golf") == []
+
+
+async def test_search_indexes_rows_written_before_fts(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    db = await get_connection(local_path_override=db_path)
+    await db.execute(_CREATE_TABLE)
+    await db.execute(
+        "INSERT INTO people_notes VALUES (?, ?, ?, ?, ?)",
+        ("people/c1", "Alice Smith", "old notes", "2025-01-01", "2025-01-01"),
+    )
+    await db.commit()
+    await db.close()
+
+    store = PeopleStore(db_path=db_path)
+    try:
+        results = await store.search("alice")
+        assert [r["google_resource_id"] for r in results] == ["people/c1"]
+    finally:
+        await store.close()
+
+
 # -- delete --------------------------------------------------------------------
 
 
@@ -105,6 +180,55 @@ async def test_delete_not_found(store: PeopleStore) -> None:
     assert result is False
 
 
+# -- Connection lifecycle -------------------------------------------------------
+
+
+async def test_reuses_one_connection(cached_store: PeopleStore) -> None:
+    with patch("src.people.store.get_connection", wraps=get_connection) as spy:
+        await cached_store.upsert("people/c1", "Alice", "notes")
+        await cached_store.get_by_id("people/c1")
+        await cached_store.search("Alice")
+    assert spy.await_count == 1
+
+
+async def test_cached_connection_serialises_callers(cached_store: PeopleStore) -> None:
+    """A failing caller's rollback must not undo another caller's pending write."""
+    await cached_store.search("")  # create the table
+
+    async def write() -> None:
+        async with cached_store._connect() as db:
+            cursor = await db.execute(_UPSERT, ("people/c1", "Alice", "notes", "t", "t"))
+            await cursor.fetchall()
+            await asyncio.sleep(0.01)
+            await db.commit()
+
+    async def fail() -> None:
+        with pytest.raises(RuntimeError):
+            async with cached_store._connect():
+                raise RuntimeError("boom")
+
+    await asyncio.gather(write(), fail())
+    assert await cached_store.get_by_id("people/c1") is not None
+
+
+async def test_close_then_reopen(cached_store: PeopleStore) -> None:
+    await cached_store.upsert("people/c1", "Alice", "notes")
+    await cached_store.close()
+    assert cached_store._conn is None
+
+    assert await cached_store.get_by_id("people/c1") is not None
+
+
+async def test_recent_listing_uses_index(store: PeopleStore) -> None:
+    await store.search("")
+    async with store._connect() as db:
+        cursor = await db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM people_notes ORDER BY updated_at DESC LIMIT 20"
+        )
+        plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+    assert "idx_people_notes_updated" in plan
+
+
 # -- Singleton -----------------------------------------------------------------
 
 
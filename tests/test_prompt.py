@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, patch
 
+import src.llm.prompt as prompt_module
 from src.llm.prompt import _format_memories, build_system_prompt
 from src.memory.models import MemoryEntry
 
@@ -213,3 +214,84 @@ async def test_notion_not_injected_when_no_api_key(tmp_path) -> None:
 
     text = blocks[0]["text"]
     assert "Should not appear" not in text
+
+
+# -- Static block caching ----------------------------------------------------
+
+
+async def test_static_block_reused_when_inputs_unchanged(tmp_path) -> None:
+    (tmp_path / "SOUL.md").write_text("I am Nella.")
+    with (
+        patch("src.llm.prompt.CONFIG_DIR", tmp_path),
+        patch("src.llm.prompt._read_config", wraps=prompt_module._read_config) as read,
+    ):
+        first = await build_system_prompt()
+        reads = read.call_count
+        second = await build_system_prompt()
+
+    assert read.call_count == reads
+    assert second[0]["text"] == first[0]["text"]
+
+
+async def test_static_block_rebuilt_when_config_changes(tmp_path) -> None:
+    soul = tmp_path / "SOUL.md"
+    soul.write_text("I am Nella.")
+    with patch("src.llm.prompt.CONFIG_DIR", tmp_path):
+        first = await build_system_prompt()
+        soul.write_text("I am Nella, version two.")
+        second = await build_system_prompt()
+
+    assert "version two" not in first[0]["text"]
+    assert "version two" in second[0]["text"]
+
+
+# -- Memory retrieval short-circuit ------------------------------------------
+
+
+async def test_trivial_messages_skip_memory_search() -> None:
+    mock_store = AsyncMock()
+    mock_store.enabled = True
+    mock_store.search.return_value = []
+
+    with patch("src.memory.store.MemoryStore.get", return_value=mock_store):
+        for message in ("ok", "Thanks!", "got it, thank you", "k."):
+            assert await prompt_module._retrieve_memories(message) == ""
+
+    mock_store.search.assert_not_awaited()
+
+
+async def test_memory_search_overlaps_static_block() -> None:
+    """The memory search is already running while the static block is built."""
+    import asyncio
+
+    search_started = asyncio.Event()
+
+    async def search(*_args, **_kwargs):
+        search_started.set()
+        return []
+
+    async def static_text() -> str:
+        # Would time out if the search only started after this returned
+        await asyncio.wait_for(search_started.wait(), timeout=1)
+        return "static"
+
+    mock_store = AsyncMock()
+    mock_store.enabled = True
+    mock_store.search.side_effect = search
+
+    with (
+        patch("src.memory.store.MemoryStore.get", return_value=mock_store),
+        patch("src.llm.prompt._get_static_text", side_effect=static_text),
+    ):
+        blocks = await build_system_prompt(user_message="what's my coffee order?")
+
+    assert blocks[0]["text"] == "static"
+    mock_store.search.assert_awaited_once()
+
+
+def test_named_list_block_marks_default() -> None:
+    args = ("Google Accounts", prompt_module._GOOGLE_ACCOUNTS_INTRO, ("work", "personal"))
+    block = prompt_module._named_list_block(*args, "personal")
+    assert block.startswith("# Google Accounts\n")
+    assert "- work\n- personal (default)" in block
+    assert prompt_module._named_list_block(*args, "personal") is block
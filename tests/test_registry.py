@@ -34,6 +34,37 @@ def test_register_via_decorator(reg: ToolRegistry) -> None:
     assert reg.get("ping").category == "test"
 
 
+def test_parallel_safe_defaults_false_and_can_be_enabled(reg: ToolRegistry) -> None:
+    @reg.tool(name="read", description="Read", category="test", parallel_safe=True)
+    async def read() -> ToolResult:
+        return ToolResult(data={})
+
+    @reg.tool(name="write", description="Write", category="test")
+    async def write() -> ToolResult:
+        return ToolResult(data={})
+
+    assert reg.get("read").parallel_safe is True
+    assert reg.get("write").parallel_safe is False
+
+
+def test_only_side_effect_free_tools_are_parallel_safe() -> None:
+    from src.tools import (  # noqa: F401
+        github_tools,
+        log_tools,
+        memory_tools,
+        notion_tools,
+        scratch_tools,
+        web_tools,
+    )
+    from src.tools.registry import registry
+
+    parallel = [name for name in registry.tool_names if registry.get(name).parallel_safe]
+    assert "recall" in parallel
+    for name in parallel:
+        assert registry.get(name).side_effect_free, name
+    assert not registry.get("remember_this").parallel_safe
+
+
 def test_decorator_rejects_sync_function(reg: ToolRegistry) -> None:
     with pytest.raises(TypeError, match="must be an async function"):
 
@@ -98,6 +129,23 @@ def test_get_schemas_with_params(reg: ToolRegistry) -> None:
     assert "query" in schemas[0]["input_schema"]["required"]
 
 
+def test_get_schemas_cached_until_registration(reg: ToolRegistry) -> None:
+    @reg.tool(name="one", description="One", category="test")
+    async def one() -> ToolResult:
+        return ToolResult(data={})
+
+    schemas = reg.get_schemas()
+    assert reg.get_schemas() is schemas
+
+    @reg.tool(name="two", description="Two", category="test")
+    async def two() -> ToolResult:
+        return ToolResult(data={})
+
+    updated = reg.get_schemas()
+    assert updated is not schemas
+    assert [s["name"] for s in updated] == ["one", "two"]
+
+
 # -- Execution ---------------------------------------------------------------
 
 
@@ -219,3 +267,8 @@ def test_tool_result_error_serialization() -> None:
     assert not r.success
     assert '"error"' in r.to_content()
     assert "something broke" in r.to_content()
+
+
+def test_tool_result_serialization_is_compact_utf8() -> None:
+    r = ToolResult(data={"name": "Café", 1: "one"})
+    assert r.to_content() == '{"name":"Café","1":"one"}'
@@ -1,7 +1,7 @@
 """Tests for SchedulerEngine — APScheduler lifecycle."""
 
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -154,10 +154,31 @@ async def test_reload(engine: SchedulerEngine, store: TaskStore) -> None:
         job_ids = {j.id for j in engine._scheduler.get_jobs()}
         assert "t1" in job_ids
         assert "t2" in job_ids
+
+        # next_run_at persisted for every reloaded task
+        t2 = await store.get_task("t2")
+        assert t2 is not None and t2.next_run_at is not None
     finally:
         await engine.stop()
 
 
+# -- Post-execution bookkeeping --------------------------------------------------
+
+
+async def test_run_task_one_off_reads_task_once(engine: SchedulerEngine, store: TaskStore) -> None:
+    task = _make_task("once1", task_type="one_off", schedule={"run_at": "2099-01-01T09:00:00"})
+    await store.add_task(task)
+
+    with patch.object(store, "get_task", wraps=store.get_task) as spy:
+        await engine._run_task("once1")
+
+    assert spy.await_count == 1
+    fetched = await store.get_task("once1")
+    assert fetched is not None
+    assert fetched.active is False
+    assert fetched.last_run_at is not None
+
+
 # -- Trigger building ----------------------------------------------------------
 
 
@@ -210,20 +231,22 @@ async def test_run_task_deactivates_one_off(
         await engine.stop()
 
 
-async def test_run_task_updates_next_run_for_recurring(
+async def test_run_task_recurring_keeps_next_run_live(
     engine: SchedulerEngine, store: TaskStore
 ) -> None:
     task = _make_task("t1", task_type="recurring", schedule={"cron": "0 9 * * *"})
     await store.add_task(task)
     await engine.start()
     try:
-        await engine._run_task("t1")
+        with patch.object(store, "update_next_run", wraps=store.update_next_run) as spy:
+            await engine._run_task("t1")
 
         updated = await store.get_task("t1")
         assert updated is not None
         # Should still be active
         assert updated.active is True
-        # next_run_at should be set (scheduler calculates next run time)
-        assert updated.next_run_at is not None
+        # No write per firing; the next run comes from the live job
+        spy.assert_not_awaited()
+        assert engine.next_run_time("t1") is not None
     finally:
         await engine.stop()
@@ -71,6 +71,28 @@ async def test_simple_message(executor: TaskExecutor, store: TaskStore, router:
     assert updated.last_run_at is not None
 
 
+async def test_one_off_completion_written_immediately(
+    executor: TaskExecutor, store: TaskStore
+) -> None:
+    await store.add_task(_make_task("once"))
+    await store.add_task(_make_task("daily", task_type="recurring", schedule={"cron": "0 9 * * *"}))
+    store.start_write_behind()
+    try:
+        await executor.execute("once")
+        await executor.execute("daily")
+
+        # The one-off is done and recorded even with writes deferred...
+        once = await store.get_task("once")
+        assert once is not None and once.active is False and once.last_run_at is not None
+        # ...while the recurring run is still queued
+        daily = await store.get_task("daily")
+        assert daily is not None and daily.last_run_at is None
+    finally:
+        await store.stop_write_behind()
+    daily = await store.get_task("daily")
+    assert daily is not None and daily.last_run_at is not None
+
+
 async def test_simple_message_with_channel(
     executor: TaskExecutor, store: TaskStore, router: AsyncMock
 ) -> None:
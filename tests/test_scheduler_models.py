@@ -119,20 +119,6 @@ def test_to_row_and_from_row_roundtrip() -> None:
     assert restored.next_run_at == original.next_run_at
 
 
-def test_from_row_legacy_without_model() -> None:
-    """Rows from databases predating the model column (11 elements) still parse."""
-    row = (
-        "id1", "name", "one_off",
-        '{"run_at": "2025-01-01"}',
-        '{"type": "simple_message", "message": "hi"}',
-        "", None, 1,
-        "2025-01-01T00:00:00", None, None,
-    )
-    task = ScheduledTask.from_row(row)
-    assert task.model is None
-    assert task.active is True
-
-
 def test_to_row_json_fields() -> None:
     task = ScheduledTask(
         id="1", name="t", task_type="one_off",
@@ -150,7 +136,7 @@ def test_from_row_inactive_task() -> None:
         "id1", "name", "one_off",
         '{"run_at": "2025-01-01"}',
         '{"type": "simple_message", "message": "hi"}',
-        "", None, 0,  # active = 0
+        "", None, None, 0,  # model = None, active = 0
         "2025-01-01T00:00:00", None, None,
     )
     task = ScheduledTask.from_row(row)
@@ -161,7 +147,7 @@ def test_from_row_null_description() -> None:
     row = (
         "id1", "name", "one_off",
         '{}', '{}',
-        None, None, 1,
+        None, None, None, 1,
         "2025-01-01T00:00:00", None, None,
     )
     task = ScheduledTask.from_row(row)
@@ -174,7 +160,7 @@ def test_from_row_null_description() -> None:
 def test_make_task_id_is_hex_string() -> None:
     tid = make_task_id()
     assert isinstance(tid, str)
-    assert len(tid) == 32  # UUID hex
+    assert len(tid) == 32
     int(tid, 16)  # Should not raise
 
 
@@ -1,19 +1,48 @@
 """Tests for TaskStore — libsql CRUD."""
 
+import asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from src.db import close_pools, get_connection
 from src.scheduler.models import ScheduledTask
-from src.scheduler.store import TaskStore
+from src.scheduler.store import _INSERT, _SELECT_MISSED_ONE_OFF, TaskStore
 
 pytestmark = pytest.mark.usefixtures("_no_turso")
 
 
+@pytest.fixture(params=["cached", "pooled"])
+async def store(
+    request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[TaskStore]:
+    """Create a TaskStore backed by a temp database.
+
+    "cached" passes an explicit db_path (one connection kept open); "pooled"
+    uses the configured database through the shared pools, as production does.
+    """
+    if request.param == "cached":
+        store = TaskStore(db_path=tmp_path / "test.db")
+        yield store
+        await store.close()
+        return
+
+    monkeypatch.setattr("src.config.settings.database_path", tmp_path / "pooled.db")
+    monkeypatch.setattr("src.db._pools", {})
+    store = TaskStore()
+    yield store
+    await store.close()
+    await close_pools()
+
+
 @pytest.fixture
-async def store(tmp_path: Path) -> TaskStore:
-    """Create a TaskStore backed by a temp database."""
-    return TaskStore(db_path=tmp_path / "test.db")
+async def cached_store(tmp_path: Path) -> AsyncIterator[TaskStore]:
+    """A TaskStore with an explicit db_path, for connection-lifecycle tests."""
+    store = TaskStore(db_path=tmp_path / "test.db")
+    yield store
+    await store.close()
 
 
 def _make_task(
@@ -70,6 +99,47 @@ async def test_list_active_tasks_empty(store: TaskStore) -> None:
     assert active == []
 
 
+async def test_list_missed_one_offs(store: TaskStore) -> None:
+    await store.add_task(_make_task("once"))
+    await store.add_task(_make_task("ran", last_run_at="2025-06-01T09:00:00"))
+    await store.add_task(_make_task("daily", task_type="recurring", schedule={"cron": "0 9 * * *"}))
+    await store.add_task(_make_task("off", active=False))
+    await store.add_task(_make_task("later", schedule={"run_at": "2025-09-01T09:00:00"}))
+
+    tasks = await store.list_missed_one_offs("2025-07-01T00:00:00")
+    assert [t.id for t in tasks] == ["once"]
+
+
+async def test_missed_one_off_query_uses_partial_index(store: TaskStore) -> None:
+    for i in range(20):
+        await store.add_task(
+            _make_task(f"r{i}", task_type="recurring", schedule={"cron": "0 9 * * *"})
+        )
+    await store.add_task(_make_task("once"))
+
+    # A restarted store analyses the populated table when it sets it up
+    restarted = TaskStore(db_path=store._db_path)
+    try:
+        async with restarted._connect() as db:
+            cursor = await db.execute(
+                f"EXPLAIN QUERY PLAN {_SELECT_MISSED_ONE_OFF}", ("2025-07-01",)
+            )
+            plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+    finally:
+        await restarted.close()
+    assert "idx_missed_oneoff" in plan
+
+
+async def test_missed_one_off_query_works_without_partial_index(store: TaskStore) -> None:
+    await store.add_task(_make_task("once", schedule={"run_at": "2025-06-01T09:00:00"}))
+    async with store._connect() as db:
+        await db.execute("DROP INDEX idx_missed_oneoff")
+        await db.commit()
+
+    tasks = await store.list_missed_one_offs("2025-07-01T00:00:00")
+    assert [t.id for t in tasks] == ["once"]
+
+
 # -- deactivate_task -----------------------------------------------------------
 
 
@@ -89,6 +159,19 @@ async def test_deactivate_nonexistent_returns_false(store: TaskStore) -> None:
     assert result is False
 
 
+async def test_deactivate_and_clear_next(store: TaskStore) -> None:
+    await store.add_task(_make_task("t1", next_run_at="2025-06-02T09:00:00"))
+
+    assert await store.deactivate_and_clear_next("t1") is True
+    task = await store.get_task("t1")
+    assert task is not None
+    assert task.active is False
+    assert task.next_run_at is None
+
+    # Already inactive — nothing to do
+    assert await store.deactivate_and_clear_next("t1") is False
+
+
 # -- update_last_run -----------------------------------------------------------
 
 
@@ -111,6 +194,77 @@ async def test_update_last_run_default_timestamp(store: TaskStore) -> None:
     assert "T" in task.last_run_at
 
 
+async def test_add_tasks_bulk(store: TaskStore) -> None:
+    added = await store.add_tasks(_make_task(f"t{i}") for i in range(3))
+    assert [t.id for t in added] == ["t0", "t1", "t2"]
+
+    active = await store.list_active_tasks()
+    assert {t.id for t in active} == {"t0", "t1", "t2"}
+
+
+async def test_add_tasks_rolls_back_whole_batch(store: TaskStore) -> None:
+    await store.add_task(_make_task("t1"))
+    with pytest.raises(Exception):  # noqa: B017 - duplicate primary key
+        await store.add_tasks([_make_task("t2"), _make_task("t1")])
+
+    assert await store.get_task("t2") is None
+
+
+async def test_complete_one_off(store: TaskStore) -> None:
+    await store.add_task(_make_task("once", next_run_at="2025-06-01T09:00:00"))
+
+    assert await store.complete_one_off("once", "2025-06-01T09:00:05") is True
+    task = await store.get_task("once")
+    assert task is not None
+    assert task.active is False
+    assert task.next_run_at is None
+    assert task.last_run_at == "2025-06-01T09:00:05"
+    assert await store.list_missed_one_offs("2025-07-01T00:00:00") == []
+
+    # Already completed: nothing changes
+    assert await store.complete_one_off("once", "2025-06-02T00:00:00") is False
+    assert (await store.get_task("once")).last_run_at == "2025-06-01T09:00:05"
+
+
+async def test_complete_one_off_skips_write_behind(store: TaskStore) -> None:
+    await store.add_task(_make_task("once"))
+    store.start_write_behind()
+    try:
+        await store.complete_one_off("once", "2025-06-01T09:00:05")
+        assert store._last_run_queue.empty()
+        assert (await store.get_task("once")).last_run_at == "2025-06-01T09:00:05"
+    finally:
+        await store.stop_write_behind()
+
+
+async def test_write_behind_batches_and_flushes(store: TaskStore) -> None:
+    await store.add_task(_make_task("t1"))
+    await store.add_task(_make_task("t2"))
+    store.start_write_behind()
+    try:
+        with patch.object(store, "_set_last_runs", wraps=store._set_last_runs) as spy:
+            await store.update_last_run("t1", "2025-06-01T09:00:00")
+            await store.update_last_run("t2", "2025-06-01T09:00:01")
+            # Queued, not yet written
+            task = await store.get_task("t1")
+            assert task is not None and task.last_run_at is None
+
+            await store.stop_write_behind()
+    finally:
+        await store.stop_write_behind()
+
+    # Both updates went out in one batch, flushed by stop_write_behind
+    spy.assert_awaited_once()
+    t1, t2 = await store.get_task("t1"), await store.get_task("t2")
+    assert t1 is not None and t1.last_run_at == "2025-06-01T09:00:00"
+    assert t2 is not None and t2.last_run_at == "2025-06-01T09:00:01"
+
+    # With write-behind off, updates are written immediately again
+    await store.update_last_run("t1", "2025-06-02T09:00:00")
+    t1 = await store.get_task("t1")
+    assert t1 is not None and t1.last_run_at == "2025-06-02T09:00:00"
+
+
 # -- update_next_run -----------------------------------------------------------
 
 
@@ -133,6 +287,17 @@ async def test_update_next_run_clear(store: TaskStore) -> None:
     assert task.next_run_at is None
 
 
+async def test_update_next_runs_batch(store: TaskStore) -> None:
+    await store.add_task(_make_task("t1"))
+    await store.add_task(_make_task("t2"))
+    await store.update_next_runs([("2025-06-02T09:00:00", "t1"), (None, "t2")])
+
+    t1 = await store.get_task("t1")
+    t2 = await store.get_task("t2")
+    assert t1 is not None and t1.next_run_at == "2025-06-02T09:00:00"
+    assert t2 is not None and t2.next_run_at is None
+
+
 # -- model persistence --------------------------------------------------------
 
 
@@ -188,6 +353,98 @@ async def test_update_task_model_nonexistent_returns_false(store: TaskStore) ->
     assert result is False
 
 
+# -- Connection lifecycle -------------------------------------------------------
+
+
+async def test_reuses_one_connection(cached_store: TaskStore) -> None:
+    with patch("src.scheduler.store.get_connection", wraps=get_connection) as spy:
+        await cached_store.add_task(_make_task())
+        await cached_store.get_task("task1")
+        await cached_store.list_active_tasks()
+    assert spy.await_count == 1
+
+
+async def test_cached_connection_serialises_callers(cached_store: TaskStore) -> None:
+    """A failing caller's rollback must not undo another caller's pending write."""
+    await cached_store.list_active_tasks()  # create the table
+
+    async def write() -> None:
+        async with cached_store._connect() as db:
+            await db.execute(_INSERT, _make_task("kept").to_row())
+            await asyncio.sleep(0.01)
+            await db.commit()
+
+    async def fail() -> None:
+        with pytest.raises(RuntimeError):
+            async with cached_store._connect():
+                raise RuntimeError("boom")
+
+    await asyncio.gather(write(), fail())
+    assert await cached_store.get_task("kept") is not None
+
+
+async def test_pooled_store_reads_see_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without db_path, writes use the shared pool and reads the reader pool."""
+    import src.db as db
+
+    monkeypatch.setattr("src.config.settings.database_path", tmp_path / "pooled.db")
+    monkeypatch.setattr("src.db._pools", {})
+    pooled = TaskStore()
+    try:
+        await pooled.add_task(_make_task("t1"))
+        assert [t.id for t in await pooled.list_active_tasks()] == ["t1"]
+
+        await pooled.deactivate_task("t1")
+        assert await pooled.list_active_tasks() == []
+    finally:
+        await db.close_pools()
+
+
+async def test_pooled_store_returns_connections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import src.db as db
+
+    monkeypatch.setattr("src.config.settings.database_path", tmp_path / "pooled.db")
+    monkeypatch.setattr("src.db._pools", {})
+    pooled = TaskStore()
+    try:
+        await pooled.add_task(_make_task("t1"))
+        with pytest.raises(ValueError, match="UNIQUE"):
+            await pooled.add_task(_make_task("t1"))  # duplicate id
+        assert await pooled.get_task("t1") is not None
+
+        # Every borrowed connection, including the failed write's, is back
+        assert db._pools
+        for pool in db._pools.values():
+            assert pool._idle.qsize() == pool._size
+    finally:
+        await db.close_pools()
+
+
+async def test_close_then_reopen(cached_store: TaskStore) -> None:
+    await cached_store.add_task(_make_task())
+    await cached_store.close()
+    assert cached_store._conn is None
+
+    # Next call transparently opens a fresh connection
+    assert await cached_store.get_task("task1") is not None
+    await cached_store.close()
+
+
+async def test_active_listing_uses_index(store: TaskStore) -> None:
+    await store.list_active_tasks()
+    async with store._connect() as db:
+        cursor = await db.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM scheduled_tasks WHERE active = 1 ORDER BY created_at"
+        )
+        plan = " ".join(str(row[-1]) for row in await cursor.fetchall())
+    assert "idx_scheduled_tasks_active_created" in plan
+    assert "TEMP B-TREE" not in plan
+
+
 # -- Singleton -----------------------------------------------------------------
 
 
@@ -109,6 +109,58 @@ async def test_post_init_starts_engine() -> None:
     app_module._webhook_server = None
 
 
+async def test_post_init_keeps_and_logs_warm_task(caplog: pytest.LogCaptureFixture) -> None:
+    """The memory warm-up task is referenced until done and its failure is logged."""
+    import asyncio
+
+    from src.notifications.router import NotificationRouter
+
+    router = NotificationRouter.get()
+    fake_channel = MagicMock()
+    fake_channel.name = "telegram"
+    router.register_channel(fake_channel)
+    router.set_default_channel("telegram")
+
+    warm_started = asyncio.Event()
+    release_warm = asyncio.Event()
+
+    async def failing_warm() -> None:
+        warm_started.set()
+        await release_warm.wait()
+        raise RuntimeError("mem0 down")
+
+    with (
+        patch("src.bot.app.settings") as mock_settings,
+        patch("src.webhooks.server.WebhookServer") as mock_webhook_cls,
+        patch("src.memory.store.MemoryStore.warm", failing_warm),
+    ):
+        mock_settings.get_allowed_user_ids.return_value = {12345}
+        mock_settings.scheduler_timezone = "America/Chicago"
+        mock_settings.database_path = "data/nella.db"
+        mock_settings.default_notification_channel = "telegram"
+        mock_webhook_cls.return_value = AsyncMock()
+
+        import src.bot.app as app_module
+
+        await app_module._post_init(AsyncMock())
+        await warm_started.wait()
+
+    assert len(app_module._background_tasks) == 1
+    (warm_task,) = app_module._background_tasks
+    release_warm.set()
+    with pytest.raises(RuntimeError):
+        await warm_task
+    await asyncio.sleep(0)  # let the done callbacks run
+
+    assert not app_module._background_tasks
+    assert "Background startup task failed" in caplog.text
+
+    # Clean up
+    await app_module._scheduler_engine.stop()
+    app_module._scheduler_engine = None
+    app_module._webhook_server = None
+
+
 async def test_post_shutdown_stops_engine() -> None:
     """_post_shutdown should stop the scheduler engine."""
     from src.notifications.router import NotificationRouter
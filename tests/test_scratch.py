@@ -5,7 +5,7 @@ import time
 
 import pytest
 
-from src.scratch import DEFAULT_CLEANUP_HOURS, MAX_FILE_SIZE, ScratchSpace
+from src.scratch import _SAFE_FILENAME_RE, DEFAULT_CLEANUP_HOURS, MAX_FILE_SIZE, ScratchSpace
 
 
 @pytest.fixture()
@@ -57,6 +57,16 @@ def test_sanitize_empty_raises() -> None:
         ScratchSpace.sanitize_filename("...")
 
 
+def test_sanitize_every_ascii_char_matches_regex() -> None:
+    for code in range(128):
+        name = f"a{chr(code)}b"
+        assert ScratchSpace.sanitize_filename(name) == _SAFE_FILENAME_RE.sub("_", name)
+
+
+def test_sanitize_non_ascii_replaced() -> None:
+    assert ScratchSpace.sanitize_filename("café 日本.txt") == "caf____.txt"
+
+
 def test_sanitize_path_separators_replaced() -> None:
     # Path separators within a single component get replaced
     assert ScratchSpace.sanitize_filename("foo\\bar") == "foo_bar"
@@ -161,6 +171,14 @@ def test_list_files_nested_paths(scratch) -> None:
     assert "nested.txt" in files[0]["name"]
 
 
+def test_list_files_sorted_by_path(scratch) -> None:
+    scratch.write("a.txt", "1")
+    scratch.write("a/b.txt", "2")
+    scratch.write("0.txt", "3")
+    names = [f["name"] for f in scratch.list_files()]
+    assert names == ["0.txt", os.path.join("a", "b.txt"), "a.txt"]
+
+
 # ---------------------------------------------------------------------------
 # total_size / exists
 # ---------------------------------------------------------------------------
@@ -174,6 +192,36 @@ def test_total_size(scratch) -> None:
     assert scratch.total_size() == 10
 
 
+def test_total_size_tracks_changes_without_rewalking(scratch, monkeypatch) -> None:
+    scratch.write("a.txt", "12345")
+    scratch.write("sub/b.txt", "67890")
+    assert scratch.total_size() == 10
+
+    monkeypatch.setattr(scratch, "_walk", lambda: pytest.fail("total_size re-walked"))
+    scratch.write("a.txt", "12")  # overwrite shrinks the file
+    assert scratch.total_size() == 7
+    scratch.delete("sub/b.txt")
+    assert scratch.total_size() == 2
+
+
+def test_total_size_after_cleanup(scratch) -> None:
+    old = scratch.write("old.txt", "stale!")
+    scratch.write("fresh.txt", "new")
+    old_time = time.time() - (4 * 24 * 3600)
+    os.utime(old, (old_time, old_time))
+
+    scratch.cleanup(max_age_hours=DEFAULT_CLEANUP_HOURS)
+    assert scratch.total_size() == 3
+
+
+def test_invalidate_total_size_picks_up_external_writes(scratch) -> None:
+    assert scratch.total_size() == 0
+    scratch.resolve("direct.bin").write_bytes(b"xyz")
+    assert scratch.total_size() == 0
+    scratch.invalidate_total_size()
+    assert scratch.total_size() == 3
+
+
 def test_exists(scratch) -> None:
     assert scratch.exists("nope.txt") is False
     scratch.write("here.txt", "present")
@@ -195,6 +243,24 @@ def test_traversal_nested(scratch) -> None:
         scratch.resolve("foo/../../etc/passwd")
 
 
+def test_traversal_symlink_to_sibling_with_root_prefix(scratch, tmp_path) -> None:
+    sibling = tmp_path / "scratchbar"
+    sibling.mkdir()
+    (tmp_path / "scratch" / "link").symlink_to(sibling)
+    with pytest.raises(ValueError, match="Path traversal detected"):
+        scratch.resolve("link/secret.txt")
+
+
+def test_traversal_checked_on_every_resolve(scratch, tmp_path) -> None:
+    # Repeat names hit the sanitize cache, but the symlink check must still run
+    assert scratch.resolve("link/secret.txt").parent.name == "link"
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (tmp_path / "scratch" / "link").symlink_to(outside)
+    with pytest.raises(ValueError, match="Path traversal detected"):
+        scratch.resolve("link/secret.txt")
+
+
 # ---------------------------------------------------------------------------
 # Size limits
 # ---------------------------------------------------------------------------
@@ -257,6 +323,17 @@ def test_cleanup_empty_subdirs_removed(scratch) -> None:
     assert not path.parent.exists()
 
 
+def test_cleanup_nested_empty_subdirs_removed(scratch) -> None:
+    path = scratch.write("a/b/c/old.txt", "stale")
+    kept = scratch.write("x/y/fresh.txt", "fresh")
+    old_time = time.time() - (4 * 24 * 3600)
+    os.utime(path, (old_time, old_time))
+
+    assert scratch.cleanup(max_age_hours=DEFAULT_CLEANUP_HOURS) == 1
+    assert not (scratch._root / "a").exists()
+    assert kept.exists()
+
+
 # ---------------------------------------------------------------------------
 # Wipe
 # ---------------------------------------------------------------------------
@@ -274,6 +351,16 @@ def test_wipe_removes_all_files(scratch) -> None:
     assert scratch.total_size() == 0
 
 
+def test_wipe_removes_subdirectories_and_keeps_root(scratch) -> None:
+    scratch.write("a/b/c.txt", "ccc")
+    scratch.resolve("link").symlink_to(scratch.resolve("a"))
+
+    assert scratch.wipe() == 1
+    assert scratch._root.is_dir()
+    assert list(scratch._root.iterdir()) == []
+    assert scratch.total_size() == 0
+
+
 def test_wipe_empty_scratch(scratch) -> None:
     removed = scratch.wipe()
     assert removed == 0
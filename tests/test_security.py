@@ -1,5 +1,10 @@
-"""Tests for settings parsing."""
+"""Tests for settings parsing and the user allowlist gate."""
 
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.bot import security
 from src.config import Settings
 
 
@@ -25,3 +30,32 @@ def test_parse_allowed_user_ids_single() -> None:
     """Single ID without commas should work."""
     s = Settings(allowed_user_ids="12345")
     assert s.get_allowed_user_ids() == {12345}
+
+
+@pytest.fixture
+def _allowlist(monkeypatch):
+    monkeypatch.setattr(security, "_allowed", None)
+    monkeypatch.setattr("src.bot.security.settings.allowed_user_ids", "111,222")
+
+
+def _update(user_id: int | None) -> MagicMock:
+    update = MagicMock()
+    update.effective_user = None if user_id is None else MagicMock(id=user_id)
+    return update
+
+
+@pytest.mark.usefixtures("_allowlist")
+def test_is_allowed_accepts_listed_user() -> None:
+    assert security.is_allowed(_update(111))
+
+
+@pytest.mark.usefixtures("_allowlist")
+def test_is_allowed_rejects_unknown_and_missing_user() -> None:
+    assert not security.is_allowed(_update(999))
+    assert not security.is_allowed(_update(None))
+
+
+def test_is_allowed_rejects_all_when_empty(monkeypatch) -> None:
+    monkeypatch.setattr(security, "_allowed", None)
+    monkeypatch.setattr("src.bot.security.settings.allowed_user_ids", "")
+    assert not security.is_allowed(_update(111))
@@ -27,6 +27,16 @@ def test_session_sliding_window() -> None:
     assert msgs[2]["content"] == "msg 4"
 
 
+def test_session_last_n_messages() -> None:
+    """to_api_messages(last=n) returns only the n most recent, oldest first."""
+    session = Session(window_size=10)
+    for i in range(5):
+        session.add("user", f"msg {i}")
+
+    assert [m["content"] for m in session.to_api_messages(last=2)] == ["msg 3", "msg 4"]
+    assert len(session.to_api_messages(last=20)) == 5
+
+
 def test_session_clear() -> None:
     """Clear should remove all messages and return count."""
     session = Session(window_size=10)
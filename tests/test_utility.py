@@ -83,3 +83,49 @@ async def test_delete_note_not_found() -> None:
     result = await delete_note(note_id=99999)
     assert not result.success
     assert "not found" in result.error
+
+
+async def test_notes_table_created_once_per_database(monkeypatch) -> None:
+    import src.tools.utility as utility
+    from src.db import _AsyncConnection
+
+    monkeypatch.setattr(utility, "_notes_ready", set())
+    executed: list[str] = []
+    original = _AsyncConnection.execute
+
+    async def spy(self, sql, params=()):
+        executed.append(sql)
+        return await original(self, sql, params)
+
+    monkeypatch.setattr(_AsyncConnection, "execute", spy)
+
+    await save_note(title="One", content="first")
+    await save_note(title="Two", content="second")
+    result = await search_notes(query="first")
+
+    assert result.data["count"] == 1
+    assert executed.count(utility._CREATE_NOTES_TABLE) == 1
+
+
+async def test_failed_notes_table_setup_returns_connection(monkeypatch) -> None:
+    import asyncio
+
+    import src.tools.utility as utility
+    from src.db import _AsyncConnection
+
+    monkeypatch.setattr(utility, "_notes_ready", set())
+    original = _AsyncConnection.execute
+    failures = iter([True])
+
+    async def flaky(self, sql, params=()):
+        if sql == utility._CREATE_NOTES_TABLE and next(failures, False):
+            raise RuntimeError("boom")
+        return await original(self, sql, params)
+
+    monkeypatch.setattr(_AsyncConnection, "execute", flaky)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await save_note(title="One", content="first")
+    # The connection went back to the pool, so the next call doesn't hang
+    result = await asyncio.wait_for(save_note(title="Two", content="second"), timeout=1)
+    assert result.success